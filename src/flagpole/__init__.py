@@ -65,6 +65,7 @@ from __future__ import annotations
 import dataclasses
 import functools
 import os
+from collections.abc import Callable
 from typing import Any
 
 import jsonschema
@@ -79,6 +80,13 @@ class InvalidFeatureFlagConfiguration(Exception):
     pass
 
 
+FEATURE_CACHE_SIZE = 1000
+"How many parsed features are kept, keyed by their configuration json."
+
+MATCH_CACHE_SIZE = 1000
+"How many evaluation results each feature keeps, keyed by the full evaluation context."
+
+
 @functools.cache
 def load_json_schema() -> dict[str, Any]:
     path = os.path.join(os.path.dirname(__file__), "flagpole-schema.json")
@@ -108,12 +116,33 @@ class Feature:
         if not self.enabled:
             return False
 
-        for segment in self.segments:
-            match = segment.match(context)
-            if match:
-                return segment.in_rollout(context)
+        cache_key = context.cache_key
+        try:
+            return self._match_cache[cache_key]
+        except KeyError:
+            pass
+
+        result = self._compiled_match(context)
+        if len(self._match_cache) >= MATCH_CACHE_SIZE:
+            self._match_cache.clear()
+        self._match_cache[cache_key] = result
+        return result
+
+    @functools.cached_property
+    def _match_cache(self) -> dict[str, bool]:
+        return {}
+
+    @functools.cached_property
+    def _compiled_match(self) -> Callable[[EvaluationContext], bool]:
+        segments = tuple((segment.compile(), segment.in_rollout) for segment in self.segments)
+
+        def evaluate(context: EvaluationContext) -> bool:
+            for segment_match, in_rollout in segments:
+                if segment_match(context):
+                    return in_rollout(context)
+            return False
 
-        return False
+        return evaluate
 
     def validate(self) -> bool:
         """
@@ -149,6 +178,15 @@ class Feature:
 
     @classmethod
     def from_feature_config_json(cls, name: str, config_json: str) -> Feature:
+        """
+        Parse a feature from its json configuration. Features are cached by their
+        configuration, so that their compiled conditions and evaluation results are
+        reused while the configuration is unchanged.
+        """
+        return _feature_from_config_json(cls, name, config_json)
+
+    @classmethod
+    def _parse_feature_config_json(cls, name: str, config_json: str) -> Feature:
         try:
             config_data_dict = orjson.loads(config_json)
         except orjson.JSONDecodeError as decode_error:
@@ -193,6 +231,11 @@ class Feature:
         return orjson.dumps(self.to_dict()).decode()
 
 
+@functools.lru_cache(maxsize=FEATURE_CACHE_SIZE)
+def _feature_from_config_json(cls: type[Feature], name: str, config_json: str) -> Feature:
+    return cls._parse_feature_config_json(name, config_json)
+
+
 __all__ = [
     "Feature",
     "InvalidFeatureFlagConfiguration",
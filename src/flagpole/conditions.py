@@ -1,6 +1,7 @@
 import dataclasses
+import functools
 from abc import abstractmethod
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from enum import Enum
 from typing import Any, Self, TypeVar
 
@@ -36,6 +37,8 @@ def get_type_name(value: Any):
 
 T = TypeVar("T", str, int, float)
 
+ContextPredicate = Callable[[EvaluationContext], bool]
+
 
 def create_case_insensitive_set_from_list(values: list[T]) -> set[T]:
     case_insensitive_set = set()
@@ -67,6 +70,13 @@ class ConditionBase:
             condition_property=context.get(self.property), segment_name=segment_name
         )
 
+    def compile(self, segment_name: str) -> ContextPredicate:
+        """
+        Returns a predicate equivalent to `match` for the given segment. Operators
+        override this to precompute what they can from the condition value.
+        """
+        return functools.partial(self.match, segment_name=segment_name)
+
     @abstractmethod
     def _operator_match(self, condition_property: Any, segment_name: str) -> bool:
         raise NotImplementedError("Each Condition needs to implement this method")
@@ -87,6 +97,27 @@ class ConditionBase:
 
         return condition_property in create_case_insensitive_set_from_list(self.value)
 
+    def _compile_in(self, segment_name: str, negate: bool) -> ContextPredicate:
+        if not isinstance(self.value, list):
+            return ConditionBase.compile(self, segment_name)
+        try:
+            values = frozenset(create_case_insensitive_set_from_list(self.value))
+        except TypeError:
+            return ConditionBase.compile(self, segment_name)
+
+        property_name = self.property
+
+        def evaluate(context: EvaluationContext) -> bool:
+            condition_property = context.get(property_name)
+            if isinstance(condition_property, (list, dict)):
+                # Raises the type mismatch
+                return self.match(context, segment_name=segment_name)
+            if isinstance(condition_property, str):
+                condition_property = condition_property.lower()
+            return (condition_property in values) != negate
+
+        return evaluate
+
     def _evaluate_contains(self, condition_property: Any, segment_name: str) -> bool:
         if not isinstance(condition_property, list):
             raise ConditionTypeMismatchException(
@@ -99,6 +130,27 @@ class ConditionBase:
 
         return value in create_case_insensitive_set_from_list(condition_property)
 
+    def _compile_equals(self, segment_name: str, negate: bool) -> ContextPredicate:
+        value = self.value
+        value_type = type(value)
+        if isinstance(value, str):
+            value = value.lower()
+
+        property_name = self.property
+
+        def evaluate(context: EvaluationContext) -> bool:
+            condition_property = context.get(property_name)
+            if condition_property is None:
+                return negate
+            if not isinstance(condition_property, value_type):
+                # Raises the type mismatch
+                return self.match(context, segment_name=segment_name)
+            if isinstance(condition_property, str):
+                condition_property = condition_property.lower()
+            return (condition_property == value) != negate
+
+        return evaluate
+
     def _evaluate_equals(self, condition_property: Any, segment_name: str) -> bool:
         if condition_property is None:
             return False
@@ -124,6 +176,9 @@ class InCondition(ConditionBase):
     value: InOperatorValueTypes
     operator: str = dataclasses.field(default="in")
 
+    def compile(self, segment_name: str) -> ContextPredicate:
+        return self._compile_in(segment_name=segment_name, negate=False)
+
     def _operator_match(self, condition_property: Any, segment_name: str):
         return self._evaluate_in(condition_property=condition_property, segment_name=segment_name)
 
@@ -132,6 +187,9 @@ class NotInCondition(ConditionBase):
     value: InOperatorValueTypes
     operator: str = dataclasses.field(default="not_in")
 
+    def compile(self, segment_name: str) -> ContextPredicate:
+        return self._compile_in(segment_name=segment_name, negate=True)
+
     def _operator_match(self, condition_property: Any, segment_name: str):
         return not self._evaluate_in(
             condition_property=condition_property, segment_name=segment_name
@@ -168,6 +226,9 @@ class EqualsCondition(ConditionBase):
     value: EqualsOperatorValueTypes
     operator: str = dataclasses.field(default="equals")
 
+    def compile(self, segment_name: str) -> ContextPredicate:
+        return self._compile_equals(segment_name=segment_name, negate=False)
+
     def _operator_match(self, condition_property: Any, segment_name: str):
         return self._evaluate_equals(
             condition_property=condition_property,
@@ -179,6 +240,9 @@ class NotEqualsCondition(ConditionBase):
     value: EqualsOperatorValueTypes
     operator: str = dataclasses.field(default="not_equals")
 
+    def compile(self, segment_name: str) -> ContextPredicate:
+        return self._compile_equals(segment_name=segment_name, negate=True)
+
     def _operator_match(self, condition_property: Any, segment_name: str):
         return not self._evaluate_equals(
             condition_property=condition_property,
@@ -240,6 +304,26 @@ class Segment:
                 return False
         return True
 
+    def compile(self) -> ContextPredicate:
+        """
+        Returns a predicate equivalent to `match`. Conditions keep their configured
+        order, as a condition that fails short circuits the ones after it, including
+        any type mismatch they would raise.
+        """
+        predicates = tuple(
+            condition.compile(segment_name=self.name) for condition in self.conditions
+        )
+        if len(predicates) == 1:
+            return predicates[0]
+
+        def evaluate(context: EvaluationContext) -> bool:
+            for predicate in predicates:
+                if not predicate(context):
+                    return False
+            return True
+
+        return evaluate
+
     def in_rollout(self, context: EvaluationContext) -> bool:
         # Rollout = 0 allows segments to match and disable a feature
         # even if other segments would match
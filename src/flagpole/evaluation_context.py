@@ -22,11 +22,13 @@ class EvaluationContext:
     __data: EvaluationContextDict
     __identity_fields: set[str]
     __id: int
+    __cache_key: str | None
 
     def __init__(self, data: EvaluationContextDict, identity_fields: set[str] | None = None):
         self.__data = deepcopy(data)
         self.__set_identity_fields(identity_fields)
         self.__id = self.__generate_id()
+        self.__cache_key = None
 
     def __set_identity_fields(self, identity_fields: set[str] | None = None):
         trimmed_id_fields = set()
@@ -64,6 +66,18 @@ class EvaluationContext:
         """
         return self.__id
 
+    @property
+    def cache_key(self) -> str:
+        """
+        A key covering the full contents and identity fields of the context.
+        Contexts with equal cache keys evaluate every condition and rollout the same way.
+        """
+        if self.__cache_key is None:
+            # repr keeps values of different types (1, 1.0, True, "1") distinct,
+            # as conditions compare values with their types.
+            self.__cache_key = repr((sorted(self.__identity_fields), sorted(self.__data.items())))
+        return self.__cache_key
+
     def get(self, key: str) -> Any:
         return self.__data.get(key)
 
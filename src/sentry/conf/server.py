@@ -771,6 +771,7 @@ CELERY_IMPORTS = (
     "sentry.replays.tasks",
     "sentry.monitors.tasks.clock_pulse",
     "sentry.monitors.tasks.detect_broken_monitor_envs",
+    "sentry.monitors.tasks.rebuild_timing_wheel",
     "sentry.tasks.assemble",
     "sentry.tasks.auth",
     "sentry.tasks.auto_remove_inbox",
@@ -1093,6 +1094,12 @@ CELERYBEAT_SCHEDULE_REGION = {
         "schedule": crontab(minute="0", hour="15", day_of_week="mon-fri"),
         "options": {"expires": 15 * 60},
     },
+    "monitors-rebuild-timing-wheel": {
+        "task": "sentry.monitors.tasks.rebuild_timing_wheel",
+        # Run every 1 minute, only rebuilds when needed
+        "schedule": crontab(minute="*/1"),
+        "options": {"expires": 60},
+    },
     "clear-expired-snoozes": {
         "task": "sentry.tasks.clear_expired_snoozes",
         # Run every 5 minutes
@@ -1722,6 +1729,11 @@ SENTRY_DEFAULT_MAX_EVENTS_PER_MINUTE = "90%"
 SENTRY_SNUBA = os.environ.get("SNUBA", "http://127.0.0.1:1218")
 SENTRY_SNUBA_TIMEOUT = 30
 SENTRY_SNUBA_CACHE_TTL_SECONDS = 60
+# Number of threads used to send the queries of a bulk snuba request concurrently, and the
+# number of keep-alive connections kept open to snuba. The connection pool should be at
+# least as large as the thread pool, otherwise connections are discarded after each query.
+SENTRY_SNUBA_QUERY_THREADS = 10
+SENTRY_SNUBA_POOL_MAXSIZE = 10
 
 # Node storage backend
 SENTRY_NODESTORE = "sentry.nodestore.django.DjangoNodeStorage"
@@ -2147,6 +2159,13 @@ SENTRY_OPTIONS: dict[str, Any] = {}
 SENTRY_DEFAULT_OPTIONS: dict[str, Any] = {}
 # Raise an error in dev on failed lookups
 SENTRY_OPTIONS_COMPLAIN_ON_ERRORS = True
+# Serve stored options from an in-process snapshot of the options table. The
+# snapshot is reloaded when the snapshot version in the cache changes, which
+# is checked at most every `SENTRY_OPTIONS_SNAPSHOT_CHECK_INTERVAL` seconds,
+# or when it is older than `SENTRY_OPTIONS_SNAPSHOT_MAX_AGE` seconds.
+SENTRY_OPTIONS_SNAPSHOT = False
+SENTRY_OPTIONS_SNAPSHOT_CHECK_INTERVAL = 1.0
+SENTRY_OPTIONS_SNAPSHOT_MAX_AGE = 60.0
 
 # You should not change this setting after your database has been created
 # unless you have altered all schemas first
@@ -2922,6 +2941,17 @@ KAFKA_TOPIC_TO_CLUSTER: Mapping[str, str] = {
 # single-threaded under the hood for performance
 KAFKA_CONSUMER_FORCE_DISABLE_MULTIPROCESSING = False
 
+# Number of slots of the shared memory cache that the worker processes of
+# multiprocessing consumers use for projects, organizations and project keys.
+# Each slot holds one row of at most the slot size in bytes. Setting the
+# number of slots to 0 disables the shared cache.
+KAFKA_CONSUMER_SHARED_MODEL_CACHE_SLOTS = 0
+KAFKA_CONSUMER_SHARED_MODEL_CACHE_SLOT_SIZE = 2048
+# Seconds after which a row in the shared cache is considered stale. Rows that
+# are changed outside of the consumer's worker processes are served for at most
+# this long.
+KAFKA_CONSUMER_SHARED_MODEL_CACHE_TTL = 30
+
 
 # For Jira, only approved apps can use the access_email_addresses scope
 # This scope allows Sentry to use the email endpoint (https://developer.atlassian.com/cloud/jira/platform/rest/v3/#api-rest-api-3-user-email-get)
@@ -3193,6 +3223,8 @@ SENTRY_GROUP_ATTRIBUTES_FUTURES_MAX_LIMIT = 10000
 
 # How long we should wait for a gateway proxy request to return before giving up
 GATEWAY_PROXY_TIMEOUT = None
+# How many keep-alive connections the gateway proxy keeps open to each region
+GATEWAY_PROXY_POOL_MAXSIZE = 10
 
 SENTRY_SLICING_LOGICAL_PARTITION_COUNT = 256
 # This maps a Sliceable for slicing by name and (lower logical partition, upper physical partition)
@@ -2,15 +2,20 @@ import codecs
 import csv
 import logging
 import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from hashlib import sha1
 
 import sentry_sdk
 from celery import current_task
 from celery.exceptions import MaxRetriesExceededError
 from django.core.files.base import ContentFile
-from django.db import IntegrityError, router
+from django.db import IntegrityError, connections, router
 from django.utils import timezone
 
+from sentry import options
 from sentry.models.files.file import File
 from sentry.models.files.fileblob import FileBlob
 from sentry.models.files.fileblobindex import FileBlobIndex
@@ -114,23 +119,29 @@ def assemble_download(
 
                 rows = []
 
-                for _ in range(MAX_FRAGMENTS_PER_BATCH):
-                    # the number of rows to export in the next batch fragment
-                    fragment_row_count = min(batch_size, max(export_limit - next_offset, 1))
-
-                    rows = process_rows(processor, data_export, fragment_row_count, next_offset)
-                    writer.writerows(rows)
-
-                    fragment_offset += len(rows)
-                    next_offset = offset + fragment_offset
-
-                    if (
-                        not rows
-                        or len(rows) < batch_size
-                        # the batch may exceed MAX_BATCH_SIZE but immediately stops
-                        or tf.tell() - starting_pos >= MAX_BATCH_SIZE
-                    ):
-                        break
+                started_at = time.monotonic()
+                with closing(
+                    fetch_fragments(processor, data_export, batch_size, offset, export_limit)
+                ) as fragments:
+                    for rows in fragments:
+                        writer.writerows(rows)
+
+                        fragment_offset += len(rows)
+                        next_offset = offset + fragment_offset
+
+                        if (
+                            not rows
+                            or len(rows) < batch_size
+                            # the batch may exceed MAX_BATCH_SIZE but immediately stops
+                            or tf.tell() - starting_pos >= MAX_BATCH_SIZE
+                        ):
+                            break
+
+                elapsed = time.monotonic() - started_at
+                if elapsed > 0:
+                    metrics.distribution(
+                        "dataexport.rows_per_second", fragment_offset / elapsed, sample_rate=1.0
+                    )
 
                 tf.seek(0)
                 new_bytes_written = store_export_chunk_as_blob(data_export, bytes_written, tf)
@@ -222,6 +233,54 @@ def get_processor(data_export, environment_id):
         raise
 
 
+def fetch_fragments(processor, data_export, batch_size, offset, export_limit):
+    """
+    Yields the rows of each fragment of the batch starting at `offset`, in order.
+
+    With `dataexport.fetch-concurrency` above 1, the fragments after the current one are
+    fetched while it is written. A fragment is only fetched ahead when all fragments before
+    it would be full, so the rows yielded are the same as when fetching one at a time.
+    """
+    fragments = []
+    fragment_offset = offset
+    for _ in range(MAX_FRAGMENTS_PER_BATCH):
+        # the number of rows to export in the batch fragment
+        fragment_row_count = min(batch_size, max(export_limit - fragment_offset, 1))
+        fragments.append((fragment_row_count, fragment_offset))
+        if fragment_row_count < batch_size:
+            break
+        fragment_offset += fragment_row_count
+
+    concurrency = options.get("dataexport.fetch-concurrency")
+    if concurrency <= 1:
+        for fragment_row_count, fragment_offset in fragments:
+            yield process_rows(processor, data_export, fragment_row_count, fragment_offset)
+        return
+
+    def fetch(fragment_row_count, fragment_offset):
+        try:
+            return process_rows(processor, data_export, fragment_row_count, fragment_offset)
+        finally:
+            # Each thread uses its own database connections
+            connections.close_all()
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        remaining = iter(fragments)
+        pending = deque(
+            executor.submit(fetch, *fragment) for _, fragment in zip(range(concurrency), remaining)
+        )
+        while pending:
+            rows = pending.popleft().result()
+            fragment = next(remaining, None)
+            if fragment is not None:
+                pending.append(executor.submit(fetch, *fragment))
+            yield rows
+    finally:
+        # Fragments past the end of the export are not waited for
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def process_rows(processor, data_export, batch_size, offset):
     try:
         if data_export.query_type == ExportQueryType.ISSUES_BY_TAG:
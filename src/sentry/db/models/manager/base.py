@@ -171,6 +171,10 @@ class BaseManager(_base_manager_base[M]):
         post_init.connect(self.__post_init, sender=sender, weak=False)
         post_save.connect(self.__post_save, sender=sender, weak=False)
         post_delete.connect(self.__post_delete, sender=sender, weak=False)
+        # Connected separately from `__post_save`, which also runs when the
+        # cache is filled.
+        post_save.connect(self.__invalidate_shared_cache, sender=sender, weak=False)
+        post_delete.connect(self.__invalidate_shared_cache, sender=sender, weak=False)
 
     def __cache_state(self, instance: M) -> None:
         """
@@ -258,6 +262,17 @@ class BaseManager(_base_manager_base[M]):
 
         self._execute_triggers(ModelManagerTriggerCondition.DELETE)
 
+    def __invalidate_shared_cache(self, instance: M, **kwargs: Any) -> None:
+        """
+        Invalidates the instance in the shared cache of the multiprocessing
+        consumer this process is a worker of, if any.
+        """
+        from sentry.utils.shared_model_cache import get_shared_model_cache
+
+        shared_cache = get_shared_model_cache(self.model)
+        if shared_cache is not None:
+            shared_cache.bump(self.model, instance.pk)
+
     def __get_lookup_cache_key(self, **kwargs: Any) -> str:
         return make_key(self.model, "modelcache", kwargs)
 
@@ -291,6 +306,8 @@ class BaseManager(_base_manager_base[M]):
         if not self.cache_fields:
             raise ValueError("We cannot cache this query. Just hit the database.")
 
+        from sentry.utils.shared_model_cache import get_shared_model_cache
+
         key, pk_name, value = self._get_cacheable_kv_from_kwargs(kwargs)
         if key not in self.cache_fields and key != pk_name:
             raise ValueError("We cannot cache this query. Just hit the database.")
@@ -316,6 +333,18 @@ class BaseManager(_base_manager_base[M]):
         if local_cache is not None and cache_key in local_cache:
             return validate_result(local_cache[cache_key])
 
+        # Multiprocessing consumers share hot rows between their workers, see
+        # `sentry.utils.shared_model_cache`.
+        shared_cache = get_shared_model_cache(self.model) if key == pk_name else None
+        shared_generation = 0
+        if shared_cache is not None:
+            shared_generation = shared_cache.generation(self.model, int(value))
+            shared_result = shared_cache.get(self.model, self.cache_version, int(value))
+            if shared_result is not None:
+                db_kwargs = {**kwargs, "replica": True} if use_replica else {**kwargs}
+                shared_result._state.db = router.db_for_read(self.model, **db_kwargs)
+                return validate_result(shared_result)
+
         retval = cache.get(cache_key, version=self.cache_version)
         # If we don't have a hit in the django level cache, collect
         # the result, and store it both in django and local caches.
@@ -326,6 +355,8 @@ class BaseManager(_base_manager_base[M]):
             self.__post_save(instance=result)
             if local_cache is not None:
                 local_cache[cache_key] = result
+            if shared_cache is not None:
+                shared_cache.set(result, self.cache_version, shared_generation)
             return validate_result(result)
 
         # If we didn't look up by pk we need to hit the reffed
@@ -337,6 +368,8 @@ class BaseManager(_base_manager_base[M]):
             return validate_result(result)
 
         retval = validate_result(retval)
+        if shared_cache is not None:
+            shared_cache.set(retval, self.cache_version, shared_generation)
 
         kwargs = {**kwargs, "replica": True} if use_replica else {**kwargs}
         retval._state.db = router.db_for_read(self.model, **kwargs)
@@ -188,6 +188,7 @@ class ModelDeletionTask(BaseDeletionTask[ModelT]):
         query: Mapping[str, Any],
         query_limit: int | None = None,
         order_by: str | None = None,
+        last_deleted_id: int | None = None,
         **kwargs: Any,
     ):
         super().__init__(manager, **kwargs)
@@ -195,6 +196,7 @@ class ModelDeletionTask(BaseDeletionTask[ModelT]):
         self.query = query
         self.query_limit = query_limit or self.DEFAULT_QUERY_LIMIT or self.chunk_size
         self.order_by = order_by
+        self.last_deleted_id = last_deleted_id
 
     def __repr__(self) -> str:
         return "<{}: model={} query={} order_by={} transaction_id={} actor_id={}>".format(
@@ -206,6 +208,16 @@ class ModelDeletionTask(BaseDeletionTask[ModelT]):
             self.actor_id,
         )
 
+    def _uses_id_cursor(self) -> bool:
+        """
+        Only walk the rows in primary key order when the query is bound by the
+        primary key. For any other filter, ``ORDER BY id LIMIT n`` can make
+        postgres scan the primary key index across the whole table.
+        """
+        if self.order_by:
+            return False
+        return any(key.split("__")[0] in ("id", "pk") for key in self.query)
+
     def chunk(self) -> bool:
         """
         Deletes a chunk of this instance's data. Return ``True`` if there is
@@ -213,18 +225,32 @@ class ModelDeletionTask(BaseDeletionTask[ModelT]):
         """
         query_limit = self.query_limit
         remaining = self.chunk_size
+        use_cursor = self._uses_id_cursor()
 
         while remaining > 0:
             queryset = getattr(self.model, self.manager_name).filter(**self.query)
             if self.order_by:
                 queryset = queryset.order_by(self.order_by)
+            elif use_cursor:
+                # Resume after the last row we removed. Re-running the filter
+                # would make postgres step over every dead tuple left behind by
+                # the previous batches before reaching live rows.
+                queryset = queryset.order_by("id")
+                if self.last_deleted_id is not None:
+                    queryset = queryset.filter(id__gt=self.last_deleted_id)
 
             queryset = list(queryset[:query_limit])
             # If there are no more rows we are all done.
             if not queryset:
                 return False
 
-            self.delete_bulk(queryset)
+            if self.delete_bulk(queryset):
+                # Children of this batch still need to be removed, the rows
+                # themselves will be picked up again on the next chunk.
+                return True
+
+            if use_cursor:
+                self.last_deleted_id = queryset[-1].id
             remaining = remaining - query_limit
         # We have more work to do as we didn't run out of rows to delete.
         return True
@@ -22,6 +22,7 @@ def delete_groups(
     object_ids: Sequence[int],
     transaction_id: str | None = None,
     eventstream_state: Mapping[str, Any] | None = None,
+    last_deleted_id: int | None = None,
     **kwargs: Any,
 ) -> None:
     from sentry import deletions, eventstream
@@ -41,7 +42,10 @@ def delete_groups(
     current_batch, rest = object_ids[:max_batch_size], object_ids[max_batch_size:]
 
     task = deletions.get(
-        model=Group, query={"id__in": current_batch}, transaction_id=transaction_id
+        model=Group,
+        query={"id__in": current_batch},
+        transaction_id=transaction_id,
+        last_deleted_id=last_deleted_id,
     )
     has_more = task.chunk()
     if has_more or rest:
@@ -50,6 +54,8 @@ def delete_groups(
                 "object_ids": object_ids if has_more else rest,
                 "transaction_id": transaction_id,
                 "eventstream_state": eventstream_state,
+                # Only resume within the batch that still has rows left.
+                "last_deleted_id": task.last_deleted_id if has_more else None,
             },
             countdown=15,
         )
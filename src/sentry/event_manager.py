@@ -1094,60 +1094,64 @@ def _nodestore_save_many(jobs: Sequence[Job], app_feature: str) -> None:
 
 
 def _eventstream_insert_many(jobs: Sequence[Job]) -> None:
-    for job in jobs:
+    with eventstream.backend.batch():
+        for job in jobs:
+            _eventstream_insert(job)
 
-        if job["event"].project_id == settings.SENTRY_PROJECT:
-            metrics.incr(
-                "internal.captured.eventstream_insert",
-                tags={"event_type": job["event"].data.get("type") or "null"},
-            )
 
-        # XXX: Temporary hack so that we keep this group info working for error issues. We'll need
-        # to change the format of eventstream to be able to handle data for multiple groups
-        if not job["groups"]:
-            group_states: list[GroupState] | None = None
-            is_new = False
-            is_regression = False
-            is_new_group_environment = False
-        else:
-            # error issues
-            group_info = job["groups"][0]
-            is_new = group_info.is_new
-            is_regression = group_info.is_regression
-            is_new_group_environment = group_info.is_new_group_environment
-
-            # performance issues with potentially multiple groups to a transaction
-            group_states = [
-                {
-                    "id": gi.group.id,
-                    "is_new": gi.is_new,
-                    "is_regression": gi.is_regression,
-                    "is_new_group_environment": gi.is_new_group_environment,
-                }
-                for gi in job["groups"]
-                if gi is not None
-            ]
-
-        # Skip running grouping for "transaction" events:
-        primary_hash = (
-            None if job["data"].get("type") == "transaction" else job["event"].get_primary_hash()
+def _eventstream_insert(job: Job) -> None:
+    if job["event"].project_id == settings.SENTRY_PROJECT:
+        metrics.incr(
+            "internal.captured.eventstream_insert",
+            tags={"event_type": job["event"].data.get("type") or "null"},
         )
 
-        eventstream.backend.insert(
-            event=job["event"],
-            is_new=is_new,
-            is_regression=is_regression,
-            is_new_group_environment=is_new_group_environment,
-            primary_hash=primary_hash,
-            received_timestamp=job["received_timestamp"],
-            # We are choosing to skip consuming the event back
-            # in the eventstream if it's flagged as raw.
-            # This means that we want to publish the event
-            # through the event stream, but we don't care
-            # about post processing and handling the commit.
-            skip_consume=job.get("raw", False),
-            group_states=group_states,
-        )
+    # XXX: Temporary hack so that we keep this group info working for error issues. We'll need
+    # to change the format of eventstream to be able to handle data for multiple groups
+    if not job["groups"]:
+        group_states: list[GroupState] | None = None
+        is_new = False
+        is_regression = False
+        is_new_group_environment = False
+    else:
+        # error issues
+        group_info = job["groups"][0]
+        is_new = group_info.is_new
+        is_regression = group_info.is_regression
+        is_new_group_environment = group_info.is_new_group_environment
+
+        # performance issues with potentially multiple groups to a transaction
+        group_states = [
+            {
+                "id": gi.group.id,
+                "is_new": gi.is_new,
+                "is_regression": gi.is_regression,
+                "is_new_group_environment": gi.is_new_group_environment,
+            }
+            for gi in job["groups"]
+            if gi is not None
+        ]
+
+    # Skip running grouping for "transaction" events:
+    primary_hash = (
+        None if job["data"].get("type") == "transaction" else job["event"].get_primary_hash()
+    )
+
+    eventstream.backend.insert(
+        event=job["event"],
+        is_new=is_new,
+        is_regression=is_regression,
+        is_new_group_environment=is_new_group_environment,
+        primary_hash=primary_hash,
+        received_timestamp=job["received_timestamp"],
+        # We are choosing to skip consuming the event back
+        # in the eventstream if it's flagged as raw.
+        # This means that we want to publish the event
+        # through the event stream, but we don't care
+        # about post processing and handling the commit.
+        skip_consume=job.get("raw", False),
+        group_states=group_states,
+    )
 
 
 def _track_outcome_accepted_many(jobs: Sequence[Job]) -> None:
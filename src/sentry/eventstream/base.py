@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Collection, Mapping, MutableMapping, Sequence
+from collections.abc import Collection, Generator, Mapping, MutableMapping, Sequence
+from contextlib import contextmanager
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional, TypedDict, cast
 
@@ -52,6 +53,7 @@ class EventStream(Service):
         "replace_group_unsafe",
         "exclude_groups",
         "requires_post_process_forwarder",
+        "batch",
         "_get_event_type",
     )
 
@@ -195,6 +197,15 @@ class EventStream(Service):
     def requires_post_process_forwarder(self) -> bool:
         return False
 
+    @contextmanager
+    def batch(self) -> Generator[None]:
+        """
+        Groups the inserts made within the block. Backends that produce to a
+        broker can use this to poll and flush once for the whole batch
+        instead of once per message.
+        """
+        yield
+
     @staticmethod
     def _get_event_type(event: Event | GroupEvent) -> EventStreamEventType:
         if getattr(event, "occurrence", None):
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
-from collections.abc import Mapping, MutableMapping, Sequence
+from collections.abc import Generator, Mapping, MutableMapping, Sequence
+from contextlib import contextmanager
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -32,6 +34,7 @@ class KafkaEventStream(SnubaProtocolEventStream):
         self.transactions_topic = Topic.TRANSACTIONS
         self.issue_platform_topic = Topic.EVENTSTREAM_GENERIC
         self.__producers: MutableMapping[Topic, Producer] = {}
+        self.__batch = threading.local()
         self.error_last_logged_time: int | None = None
 
     def get_transactions_topic(self, project_id: int) -> Topic:
@@ -45,6 +48,33 @@ class KafkaEventStream(SnubaProtocolEventStream):
 
         return self.__producers[topic]
 
+    @contextmanager
+    def batch(self) -> Generator[None]:
+        """
+        Defers polling and flushing the producers used within the block to
+        the end of it, so that a batch of inserts only pays for one poll (or
+        one flush, if any of the inserts was synchronous).
+        """
+        if getattr(self.__batch, "producers", None) is not None:
+            # Already batching, the outermost block takes care of flushing.
+            yield
+            return
+
+        self.__batch.producers = {}
+        self.__batch.flush = False
+        try:
+            yield
+        finally:
+            producers = self.__batch.producers
+            flush = self.__batch.flush
+            self.__batch.producers = None
+
+            for producer in producers.values():
+                if flush:
+                    producer.flush()
+                else:
+                    producer.poll(0.0)
+
     def delivery_callback(self, error: KafkaError | None, message: KafkaMessage) -> None:
         now = int(time.time())
         if error is not None:
@@ -198,6 +228,7 @@ class KafkaEventStream(SnubaProtocolEventStream):
             topic = self.topic
 
         producer = self.get_producer(topic)
+        batch_producers = getattr(self.__batch, "producers", None)
 
         # Polling the producer is required to ensure callbacks are fired. This
         # means that the latency between a message being delivered (or failing
@@ -209,7 +240,10 @@ class KafkaEventStream(SnubaProtocolEventStream):
         # a heartbeat for the purposes of any sort of session expiration.)
         # Note that this call to poll() is *only* dealing with earlier
         # asynchronous produce() calls from the same process.
-        producer.poll(0.0)
+        if batch_producers is None:
+            producer.poll(0.0)
+        else:
+            batch_producers[topic] = producer
 
         assert isinstance(extra_data, tuple)
 
@@ -228,8 +262,11 @@ class KafkaEventStream(SnubaProtocolEventStream):
             return
 
         if not asynchronous:
-            # flush() is a convenience method that calls poll() until len() is zero
-            producer.flush()
+            if batch_producers is None:
+                # flush() is a convenience method that calls poll() until len() is zero
+                producer.flush()
+            else:
+                self.__batch.flush = True
 
     def requires_post_process_forwarder(self) -> bool:
         return True
@@ -99,3 +99,37 @@ class BatchFeatureHandler(FeatureHandler):
     def has_for_batch(self, batch: FeatureCheckBatch) -> dict[Project, bool | None]:
         flag = self._check_for_batch(batch.feature_name, batch.subject, batch.actor)
         return {obj: flag for obj in batch.objects}
+
+    def batch_has(
+        self,
+        feature_names: Sequence[str],
+        actor: User | RpcUser | AnonymousUser | None,
+        projects: Sequence[Project] | None = None,
+        organization: Organization | None = None,
+        batch: bool = True,
+    ) -> dict[str, dict[str, bool | None]] | None:
+        # Checks only depend on the organization, so each feature is checked
+        # once per organization and shared by all of its projects.
+        names = [name for name in feature_names if name in self.features]
+
+        if projects:
+            results: dict[str, dict[str, bool | None]] = {}
+            flags_by_org: dict[int, dict[str, bool | None]] = {}
+            for project in projects:
+                flags = flags_by_org.get(project.organization_id)
+                if flags is None:
+                    flags = flags_by_org[project.organization_id] = {
+                        name: self._check_for_batch(name, project.organization, actor)
+                        for name in names
+                    }
+                results[f"project:{project.id}"] = dict(flags)
+            return results
+
+        if organization:
+            return {
+                f"organization:{organization.id}": {
+                    name: self._check_for_batch(name, organization, actor) for name in names
+                }
+            }
+
+        return {"unscoped": {name: self._check_for_batch(name, None, actor) for name in names}}
@@ -77,7 +77,7 @@ class RegisteredFeatureManager:
         name: str,
         organization: Organization,
         objects: Sequence[Project],
-        actor: User | None = None,
+        actor: User | RpcUser | AnonymousUser | None = None,
     ) -> dict[Project, bool | None]:
         """
         Determine if a feature is enabled for a batch of objects.
@@ -346,13 +346,13 @@ class FeatureManager(RegisteredFeatureManager):
                 # Fall back to default handler if no entity handler available.
                 project_features = [name for name in feature_names if name.startswith("projects:")]
                 if projects and project_features:
-                    results: dict[str, dict[str, bool | None]] = {}
-                    for project in projects:
-                        proj_results = results[f"project:{project.id}"] = {}
-                        for feature_name in project_features:
-                            proj_results[feature_name] = self.has(
-                                feature_name, project, actor=actor
-                            )
+                    results: dict[str, dict[str, bool | None]] = {
+                        f"project:{project.id}": {} for project in projects
+                    }
+                    for feature_name in project_features:
+                        flags = self._has_for_projects(feature_name, projects, actor)
+                        for project, flag in flags.items():
+                            results[f"project:{project.id}"][feature_name] = flag
                     return results
 
                 org_features = filter(lambda name: name.startswith("organizations:"), feature_names)
@@ -380,6 +380,41 @@ class FeatureManager(RegisteredFeatureManager):
                 sentry_sdk.capture_exception(e)
             return None
 
+    def _has_for_projects(
+        self,
+        name: str,
+        projects: Sequence[Project],
+        actor: User | RpcUser | AnonymousUser | None,
+    ) -> dict[Project, bool]:
+        """
+        Check a project feature for all projects at once.
+
+        The projects of each organization are checked as a single batch, so that
+        handlers which only depend on the organization evaluate the feature once
+        per organization instead of once per project.
+        """
+        try:
+            self._get_feature_class(name)
+        except FeatureNotRegistered:
+            return {project: False for project in projects}
+
+        projects_by_org: dict[int, list[Project]] = defaultdict(list)
+        for project in projects:
+            projects_by_org[project.organization_id].append(project)
+
+        result: dict[Project, bool] = {}
+        for org_projects in projects_by_org.values():
+            flags = self.has_for_batch(name, org_projects[0].organization, org_projects, actor)
+            for project in org_projects:
+                flag = flags.get(project)
+                if flag is None:
+                    # The batch failed, check the project on its own
+                    flag = self.has(name, project, actor=actor)
+                result[project] = flag
+
+        flag_pole_hook(name, any(result.values()))
+        return result
+
     @staticmethod
     def _shim_feature_strategy(
         entity_feature_strategy: bool | FeatureHandlerStrategy,
@@ -409,7 +444,7 @@ class FeatureCheckBatch:
         name: str,
         organization: Organization,
         objects: Iterable[Project],
-        actor: User | None,
+        actor: User | RpcUser | AnonymousUser | None,
     ) -> None:
         self._manager = manager
         self.feature_name = name
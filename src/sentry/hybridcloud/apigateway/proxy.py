@@ -5,7 +5,10 @@ Utilities related to proxying a request to a region silo
 from __future__ import annotations
 
 import logging
-from collections.abc import Generator, Iterator
+import threading
+import time
+from collections.abc import Callable, Generator, Iterator
+from http.cookiejar import DefaultCookiePolicy
 from urllib.parse import urljoin, urlparse
 from wsgiref.util import is_hop_by_hop
 
@@ -13,7 +16,8 @@ from django.conf import settings
 from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from django.http.response import HttpResponseBase
 from requests import Response as ExternalResponse
-from requests import request as external_request
+from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.exceptions import Timeout
 
 from sentry import options
@@ -49,17 +53,85 @@ ENDPOINT_TIMEOUT_OVERRIDE = {
 # stream 0.5 MB at a time
 PROXY_CHUNK_SIZE = 512 * 1024
 
+# How long a request waits for one of its region's slots before it is rejected
+REGION_SLOT_TIMEOUT = 5.0
 
-def _parse_response(response: ExternalResponse, remote_url: str) -> StreamingHttpResponse:
+# Upstream sessions by region name, so that connections to a region are kept alive and reused
+_region_sessions: dict[str, Session] = {}
+_region_sessions_lock = threading.Lock()
+
+_region_semaphores: dict[str, tuple[int, threading.BoundedSemaphore]] = {}
+_region_semaphores_lock = threading.Lock()
+
+
+def _get_region_session(region: Region) -> Session:
+    session = _region_sessions.get(region.name)
+    if session is not None:
+        return session
+
+    with _region_sessions_lock:
+        session = _region_sessions.get(region.name)
+        if session is None:
+            session = Session()
+            # Sessions are shared by the requests of all users, so cookies set by a
+            # response must never be sent along with later requests.
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            adapter = HTTPAdapter(pool_maxsize=settings.GATEWAY_PROXY_POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _region_sessions[region.name] = session
+        return session
+
+
+def _get_region_semaphore(region: Region) -> threading.BoundedSemaphore | None:
+    limit = options.get("hybridcloud.apigateway.region-concurrency-limits").get(region.name)
+    if not limit:
+        return None
+
+    with _region_semaphores_lock:
+        current = _region_semaphores.get(region.name)
+        if current is None or current[0] != limit:
+            current = _region_semaphores[region.name] = (limit, threading.BoundedSemaphore(limit))
+        return current[1]
+
+
+class _streamed_body:
     """
-    Convert the Responses class from requests into the drf Response
+    Relays the body of an upstream response in chunks as the client reads them, so that
+    slow clients don't make us buffer the whole body.
+
+    Once the body has been read, or the response is closed, the connection is returned
+    to the region's pool and `on_close` is called.
     """
 
-    def stream_response() -> Generator[bytes]:
-        yield from response.iter_content(PROXY_CHUNK_SIZE)
+    def __init__(self, response: ExternalResponse, on_close: Callable[[], None] | None = None):
+        self.response = response
+        self.on_close = on_close
+        self.closed = False
+
+    def __iter__(self) -> Generator[bytes]:
+        try:
+            yield from self.response.iter_content(PROXY_CHUNK_SIZE)
+        finally:
+            self.close()
 
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self.response.close()
+        if self.on_close is not None:
+            self.on_close()
+
+
+def _parse_response(
+    response: ExternalResponse, remote_url: str, on_close: Callable[[], None] | None = None
+) -> StreamingHttpResponse:
+    """
+    Convert the Responses class from requests into the drf Response
+    """
     streamed_response = StreamingHttpResponse(
-        streaming_content=stream_response(),
+        streaming_content=_streamed_body(response, on_close),
         status=response.status_code,
         content_type=response.headers.pop("Content-Type", None),
     )
@@ -181,14 +253,11 @@ def proxy_error_embed_request(
     return proxy_region_request(request, region, url_name)
 
 
-def proxy_region_request(
-    request: HttpRequest, region: Region, url_name: str
-) -> StreamingHttpResponse:
+def proxy_region_request(request: HttpRequest, region: Region, url_name: str) -> HttpResponseBase:
     """Take a django request object and proxy it to a region silo"""
     target_url = urljoin(region.address, request.path)
     header_dict = clean_proxy_headers(request.headers)
 
-    # TODO: use requests session for connection pooling capabilities
     assert request.method is not None
     query_params = request.GET
 
@@ -199,26 +268,54 @@ def proxy_region_request(
     if settings.APIGATEWAY_PROXY_SKIP_RELAY and request.path.startswith("/api/0/relays/"):
         return StreamingHttpResponse(streaming_content="relay proxy skipped", status=404)
 
+    semaphore = _get_region_semaphore(region)
+    if semaphore is not None:
+        queued_at = time.monotonic()
+        acquired = semaphore.acquire(timeout=REGION_SLOT_TIMEOUT)
+        metrics.timing(
+            "apigateway.proxy_request.queue_time",
+            time.monotonic() - queued_at,
+            tags={**metric_tags, "acquired": acquired},
+        )
+        if not acquired:
+            logger.info("apigateway.region_concurrency_limited", extra={"region": region.name})
+            return HttpResponse(status=503)
+
+    started_at = time.monotonic()
+
+    def on_close() -> None:
+        # Covers relaying the body to the client, unlike the request duration
+        metrics.timing(
+            "apigateway.proxy_response.duration", time.monotonic() - started_at, tags=metric_tags
+        )
+        if semaphore is not None:
+            semaphore.release()
+
     try:
         with metrics.timer("apigateway.proxy_request.duration", tags=metric_tags):
-            resp = external_request(
+            resp = _get_region_session(region).request(
                 request.method,
                 url=target_url,
                 headers=header_dict,
                 params=dict(query_params) if query_params is not None else None,
+                # Uploads are streamed to the region as they are read from the client
                 data=_body_with_length(request),
                 stream=True,
                 timeout=timeout,
-                # By default, external_request will resolve any redirects for any verb except for HEAD.
+                # By default, requests will resolve any redirects for any verb except for HEAD.
                 # We explicitly disable this behavior to avoid misrepresenting the original sentry.io request with the
                 # body response of the redirect.
                 allow_redirects=False,
             )
     except Timeout:
+        on_close()
         # remote silo timeout. Use DRF timeout instead
         raise RequestTimeout()
+    except Exception:
+        on_close()
+        raise
 
     new_headers = clean_outbound_headers(resp.headers)
     resp.headers.clear()
     resp.headers.update(new_headers)
-    return _parse_response(resp, target_url)
+    return _parse_response(resp, target_url, on_close)
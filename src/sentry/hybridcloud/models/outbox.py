@@ -90,20 +90,27 @@ class OutboxBase(Model):
                 return cursor.fetchone()[0]
 
     @classmethod
-    def find_scheduled_shards(cls, low: int = 0, hi: int | None = None) -> list[Mapping[str, Any]]:
+    def find_scheduled_shards(
+        cls, low: int = 0, hi: int | None = None, deepest_first: bool = False
+    ) -> list[Mapping[str, Any]]:
+        """
+        :param deepest_first: Orders the shards by the number of their messages in [low, hi)
+        before their scheduled order, so that the shards that take longest to drain are
+        started first.
+        """
         q = cls.objects.values(*cls.sharding_columns).filter(
             scheduled_for__lte=timezone.now(), id__gte=low
         )
         if hi is not None:
             q = q.filter(id__lt=hi)
 
-        return list(
-            {k: row[k] for k in cls.sharding_columns}
-            for row in q.annotate(
-                scheduled_for=Min("scheduled_for"),
-                max_id=Max("id"),
-            ).order_by("scheduled_for", "max_id")
-        )
+        q = q.annotate(scheduled_for=Min("scheduled_for"), max_id=Max("id"))
+        if deepest_first:
+            q = q.annotate(depth=Count("id")).order_by("-depth", "scheduled_for", "max_id")
+        else:
+            q = q.order_by("scheduled_for", "max_id")
+
+        return list({k: row[k] for k in cls.sharding_columns} for row in q)
 
     @classmethod
     def prepare_next_from_shard(cls, row: Mapping[str, Any]) -> Self | None:
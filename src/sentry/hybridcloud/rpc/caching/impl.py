@@ -1,9 +1,18 @@
-from collections.abc import Generator, Mapping
-from typing import TypeVar
+import dataclasses
+import math
+import random
+import threading
+import time
+from collections.abc import Callable, Generator, Mapping
+from concurrent.futures import Future
+from copy import deepcopy
+from typing import Any, TypeVar
 
+from cachetools import LRUCache
 from django.core.cache import cache
 from django.core.cache.backends.base import DEFAULT_TIMEOUT
 
+from sentry import options
 from sentry.hybridcloud.models.cacheversion import (
     CacheVersionBase,
     ControlCacheVersion,
@@ -11,9 +20,169 @@ from sentry.hybridcloud.models.cacheversion import (
 )
 from sentry.hybridcloud.rpc.caching.service import ControlCachingService, RegionCachingService
 from sentry.silo.base import SiloMode
+from sentry.utils import metrics
 
 _V = TypeVar("_V")
 
+LOCAL_CACHE_SIZE = 10000
+
+# How early entries of the local cache may be refreshed before they expire, as a fraction of
+# their ttl. Refreshing at a random point before expiry keeps the processes that read a hot
+# key from all going back to the shared cache at the same time.
+LOCAL_CACHE_EARLY_REFRESH = 0.1
+
+
+@dataclasses.dataclass(frozen=True)
+class _LocalEntry:
+    version: int
+    # None marks a key whose version was bumped by this process, so that values read at an
+    # older version by concurrent readers are not stored afterwards.
+    value: str | None
+    ttl: float
+    expires_at: float
+
+    def is_fresh(self, now: float) -> bool:
+        # 1 - random() is in (0, 1], which log is defined for
+        early = -self.ttl * LOCAL_CACHE_EARLY_REFRESH * math.log(1 - random.random())
+        return now + early < self.expires_at
+
+
+# Process local copies of shared cache values, along with the version of the key they were
+# read or written at. The copies are dropped when this process bumps the version of their key
+# and otherwise expire after `hybridcloud.caching.local_ttl` seconds, which bounds how long a
+# version bump made by another process can go unnoticed.
+_local_cache: LRUCache[str, _LocalEntry] = LRUCache(maxsize=LOCAL_CACHE_SIZE)
+_local_cache_lock = threading.Lock()
+
+# Callbacks that this process is currently running to fill a cache key, keyed by the
+# versioned key. Concurrent misses of the same key wait for these instead of repeating them.
+_inflight_fills: dict[str, Future[Any]] = {}
+_inflight_fills_lock = threading.Lock()
+
+
+def _get_local_ttl() -> float:
+    return options.get("hybridcloud.caching.local_ttl")
+
+
+def _set_local(key: str, value: str | None, version: int) -> None:
+    ttl = _get_local_ttl()
+    if ttl <= 0:
+        return
+    entry = _LocalEntry(version=version, value=value, ttl=ttl, expires_at=time.monotonic() + ttl)
+    with _local_cache_lock:
+        current = _local_cache.get(key)
+        # Never replace a value with one read at an older version
+        if current is None or current.version <= version:
+            _local_cache[key] = entry
+
+
+def _get_local_many(keys: list[str]) -> dict[str, str]:
+    if _get_local_ttl() <= 0:
+        return {}
+    now = time.monotonic()
+    result = {}
+    with _local_cache_lock:
+        for key in keys:
+            entry = _local_cache.get(key)
+            if entry is not None and entry.value is not None and entry.is_fresh(now):
+                result[key] = entry.value
+    return result
+
+
+def _delete_local(key: str, version: int) -> None:
+    if _get_local_ttl() <= 0:
+        with _local_cache_lock:
+            _local_cache.pop(key, None)
+        return
+    _set_local(key, None, version)
+
+
+def _fill_coalesced(key: str, version: int, cb: Callable[[], _V]) -> _V:
+    """
+    Calls `cb` to compute the value of a cache key, unless another thread of this process is
+    already doing so for the same version of the key, in which case its result is shared.
+    """
+    if not options.get("hybridcloud.caching.coalesce_fills"):
+        return cb()
+
+    versioned_key = _versioned_key(key, version)
+    with _inflight_fills_lock:
+        future = _inflight_fills.get(versioned_key)
+        leading = future is None
+        if future is None:
+            future = _inflight_fills[versioned_key] = Future()
+
+    if not leading:
+        metrics.incr("hybridcloud.caching.fill.coalesced")
+        # Callers are free to modify their results, so they can't share them
+        return deepcopy(future.result())
+
+    try:
+        result = cb()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_fills_lock:
+            if _inflight_fills.get(versioned_key) is future:
+                del _inflight_fills[versioned_key]
+
+
+def _fill_many_coalesced(
+    keys: Mapping[int, tuple[str, int]], cb: Callable[[list[int]], Mapping[int, _V]]
+) -> dict[int, _V]:
+    """
+    Like `_fill_coalesced`, for a batch of ids mapped to their cache key and version. `cb` is
+    called with the ids no other thread of this process is filling, and returns the values it
+    found by id. Values of the other ids are shared from the threads filling them.
+    """
+    if not options.get("hybridcloud.caching.coalesce_fills"):
+        return dict(cb(list(keys)))
+
+    leading: dict[int, tuple[str, Future[_V | None]]] = {}
+    following: dict[int, Future[_V | None]] = {}
+    with _inflight_fills_lock:
+        for object_id, (key, version) in keys.items():
+            versioned_key = _versioned_key(key, version)
+            future = _inflight_fills.get(versioned_key)
+            if future is None:
+                future = _inflight_fills[versioned_key] = Future()
+                leading[object_id] = (versioned_key, future)
+            else:
+                following[object_id] = future
+
+    result: dict[int, _V] = {}
+    try:
+        # Leading fills are completed before waiting on others, so two threads following each
+        # other's keys can't wait on each other.
+        if leading:
+            result = dict(cb(list(leading)))
+    except BaseException as e:
+        for _, future in leading.values():
+            future.set_exception(e)
+        raise
+    else:
+        for object_id, (_, future) in leading.items():
+            future.set_result(result.get(object_id))
+    finally:
+        with _inflight_fills_lock:
+            for versioned_key, future in leading.values():
+                if _inflight_fills.get(versioned_key) is future:
+                    del _inflight_fills[versioned_key]
+
+    if following:
+        metrics.incr("hybridcloud.caching.fill.coalesced", len(following))
+    for object_id, future in following.items():
+        value = future.result()
+        if value is not None:
+            # Callers are free to modify their results, so they can't share them
+            result[object_id] = deepcopy(value)
+    return result
+
+
 # Implementation uses generators so that testing concurrent read after writer properties is much easier.
 # In practice all generators are synchronously consumed, except for tests.
 
@@ -32,6 +201,8 @@ def _set_cache(
     if timeout is None:
         timeout = DEFAULT_TIMEOUT
     result = cache.add(_versioned_key(key, version), value, timeout=timeout)
+    if value is not None:
+        _set_local(key, value, version)
     yield
     return result
 
@@ -50,21 +221,29 @@ def _version_model(mode: SiloMode) -> type[CacheVersionBase]:
 
 def _delete_cache(key: str, mode: SiloMode) -> Generator[None, None, int]:
     version = _version_model(mode).incr_version(key)
+    _delete_local(key, version)
     yield
     return version
 
 
 def _get_cache(keys: list[str], mode: SiloMode) -> Generator[None, None, Mapping[str, str | int]]:
+    result: dict[str, str | int] = {}
+    result.update(_get_local_many(keys))
+    keys = [key for key in keys if key not in result]
+    if not keys:
+        return result
+
     versions = {cv.key: cv.version for cv in _version_model(mode).objects.filter(key__in=keys)}
     yield
 
     versioned_keys = [_versioned_key(key, versions.get(key, 0)) for key in keys]
     existing = cache.get_many(versioned_keys)
     yield
-    result: dict[str, str | int] = {}
     for k, versioned_key in zip(keys, versioned_keys):
         if versioned_key in existing:
             result[k] = existing[versioned_key]
+            if isinstance(existing[versioned_key], str):
+                _set_local(k, existing[versioned_key], versions.get(k, 0))
             continue
         result[k] = versions.get(k, 0)
     return result
@@ -81,7 +81,7 @@ class SiloCacheBackedCallable(Generic[_R]):
     def resolve_from(
         self, i: int, values: Mapping[str, int | str]
     ) -> Generator[None, None, _R | None]:
-        from .impl import _consume_generator, _delete_cache, _set_cache
+        from .impl import _consume_generator, _delete_cache, _fill_coalesced, _set_cache
 
         key = self.key_from(i)
         value = values[key]
@@ -96,7 +96,7 @@ class SiloCacheBackedCallable(Generic[_R]):
             version = value
 
         metrics.incr("hybridcloud.caching.one.rpc", tags={"base_key": self.base_key})
-        r = self.cb(i)
+        r = _fill_coalesced(key, version, lambda: self.cb(i))
         if r is not None:
             _consume_generator(_set_cache(key, r.json(), version, self.timeout))
         return r
@@ -153,7 +153,7 @@ class SiloCacheBackedListCallable(Generic[_R]):
     def resolve_from(
         self, object_id: int, values: Mapping[str, int | str]
     ) -> Generator[None, None, list[_R]]:
-        from .impl import _consume_generator, _delete_cache, _set_cache
+        from .impl import _consume_generator, _delete_cache, _fill_coalesced, _set_cache
 
         key = self.key_from(object_id)
         value = values[key]
@@ -168,7 +168,7 @@ class SiloCacheBackedListCallable(Generic[_R]):
             version = value
 
         metrics.incr("hybridcloud.caching.list.rpc", tags={"base_key": self.base_key})
-        result = self.cb(object_id)
+        result = _fill_coalesced(key, version, lambda: self.cb(object_id))
         if result is not None:
             cache_value = json.dumps([item.json() for item in result])
             _consume_generator(_set_cache(key, cache_value, version, self.timeout))
@@ -224,7 +224,13 @@ class SiloCacheManyBackedCallable(Generic[_R]):
         return f"{self.base_key}:{object_id}"
 
     def get_many(self, ids: list[int]) -> list[_R]:
-        from .impl import _consume_generator, _delete_cache, _get_cache, _set_cache
+        from .impl import (
+            _consume_generator,
+            _delete_cache,
+            _fill_many_coalesced,
+            _get_cache,
+            _set_cache,
+        )
 
         keys = {i: self.key_from(i) for i in ids}
         cache_values = _consume_generator(_get_cache(list(keys.values()), self.silo_mode))
@@ -256,19 +262,28 @@ class SiloCacheManyBackedCallable(Generic[_R]):
             "hybridcloud.caching.many.cached", len(found), tags={"base_key": self.base_key}
         )
 
-        # This result could have different order than missing_object_ids, or have gaps
-        cb_result = self.cb(missing_keys)
-        for record in cb_result:
-            # TODO(hybridcloud) The types/interfaces don't make reading this attribute safe.
-            # We rely on a convention of records having `id` for now. In the future
-            # this could become a decorator parameter instead.
-            record_id = getattr(record, "id")
-            if record_id is None:
-                continue
-            cache_key = keys[record_id]
-            record_version = missing[record_id]
-            _consume_generator(_set_cache(cache_key, record.json(), record_version, self.timeout))
-            found[record_id] = record
+        def fill(object_ids: list[int]) -> dict[int, _R]:
+            records: dict[int, _R] = {}
+            # This result could have different order than object_ids, or have gaps
+            for record in self.cb(object_ids):
+                # TODO(hybridcloud) The types/interfaces don't make reading this attribute safe.
+                # We rely on a convention of records having `id` for now. In the future
+                # this could become a decorator parameter instead.
+                record_id = getattr(record, "id")
+                if record_id is None:
+                    continue
+                cache_key = keys[record_id]
+                record_version = missing[record_id]
+                _consume_generator(
+                    _set_cache(cache_key, record.json(), record_version, self.timeout)
+                )
+                records[record_id] = record
+            return records
+
+        # Ids that another thread is already fetching at the same version share its result
+        found.update(
+            _fill_many_coalesced({i: (keys[i], version) for i, version in missing.items()}, fill)
+        )
 
         return [found[id] for id in ids if id in found]
 
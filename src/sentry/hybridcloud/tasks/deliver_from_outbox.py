@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import math
+from collections import deque
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import sentry_sdk
 from celery import Task
 from django.conf import settings
+from django.db import connections
 from django.db.models import Max, Min
 
+from sentry import options
 from sentry.hybridcloud.models.outbox import (
     ControlOutboxBase,
     OutboxBase,
@@ -174,33 +179,76 @@ def drain_outbox_shards_control(
 def process_outbox_batch(
     outbox_identifier_hi: int, outbox_identifier_low: int, outbox_model: type[OutboxBase]
 ) -> int:
-    processed_count: int = 0
-    for shard_attributes in outbox_model.find_scheduled_shards(
-        outbox_identifier_low, outbox_identifier_hi
-    ):
-        shard_outbox: OutboxBase | None = outbox_model.prepare_next_from_shard(shard_attributes)
-        if not shard_outbox:
-            continue
+    concurrency = options.get("hybridcloud.outbox.drain_shard_concurrency")
+    # Concurrent drains start with the deepest shards, which keeps a deep shard that is started
+    # last from extending the drain.
+    shards = outbox_model.find_scheduled_shards(
+        outbox_identifier_low, outbox_identifier_hi, deepest_first=concurrency > 1
+    )
+    if concurrency > 1 and len(shards) > 1:
+        return _process_shards_concurrently(shards, outbox_model, concurrency)
 
-        try:
+    processed_count: int = 0
+    for shard_attributes in shards:
+        if _process_shard(shard_attributes, outbox_model):
             processed_count += 1
-            shard_outbox.drain_shard(flush_all=True)
-        except Exception as e:
-            with sentry_sdk.isolation_scope() as scope:
-                if isinstance(e, OutboxFlushError):
-                    scope.set_tag("outbox.category", e.outbox.category)
-                    scope.set_tag("outbox.shard_scope", e.outbox.shard_scope)
-                    scope.set_context(
-                        "outbox",
-                        {
-                            "shard_identifier": e.outbox.shard_identifier,
-                            "object_identifier": e.outbox.object_identifier,
-                            "payload": e.outbox.payload,
-                        },
-                    )
-                sentry_sdk.capture_exception(e)
-                # In production, it's ok to just continue processing forward, but in tests we aim to surface
-                # problems aggressively.
-                if in_test_environment():
-                    raise
     return processed_count
+
+
+def _process_shards_concurrently(
+    shards: Sequence[Mapping[str, Any]], outbox_model: type[OutboxBase], concurrency: int
+) -> int:
+    """
+    Drains the shards on a thread pool. Each shard is drained by a single thread, so the
+    messages of a shard are still delivered in order.
+    """
+    pending = deque(shards)
+    num_workers = min(concurrency, len(shards))
+
+    def work() -> int:
+        processed_count = 0
+        try:
+            # Workers keep taking the next shard until none are left, so the deepest shards are
+            # still started first.
+            while True:
+                try:
+                    shard_attributes = pending.popleft()
+                except IndexError:
+                    return processed_count
+                if _process_shard(shard_attributes, outbox_model):
+                    processed_count += 1
+        finally:
+            # Each thread uses its own database connections
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(work) for _ in range(num_workers)]
+        return sum(future.result() for future in futures)
+
+
+def _process_shard(shard_attributes: Mapping[str, Any], outbox_model: type[OutboxBase]) -> bool:
+    shard_outbox: OutboxBase | None = outbox_model.prepare_next_from_shard(shard_attributes)
+    if not shard_outbox:
+        return False
+
+    try:
+        shard_outbox.drain_shard(flush_all=True)
+    except Exception as e:
+        with sentry_sdk.isolation_scope() as scope:
+            if isinstance(e, OutboxFlushError):
+                scope.set_tag("outbox.category", e.outbox.category)
+                scope.set_tag("outbox.shard_scope", e.outbox.shard_scope)
+                scope.set_context(
+                    "outbox",
+                    {
+                        "shard_identifier": e.outbox.shard_identifier,
+                        "object_identifier": e.outbox.object_identifier,
+                        "payload": e.outbox.payload,
+                    },
+                )
+            sentry_sdk.capture_exception(e)
+            # In production, it's ok to just continue processing forward, but in tests we aim to surface
+            # problems aggressively.
+            if in_test_environment():
+                raise
+    return True
@@ -156,6 +156,49 @@ class AlertRuleManager(BaseManager["AlertRule"]):
 
         return alert_rule
 
+    def get_for_subscriptions(self, subscriptions: Collection[Model]) -> dict[int, AlertRule]:
+        """
+        Fetches the AlertRules associated with many Subscriptions, keyed by subscription id.
+        Subscriptions without an AlertRule are left out. Attempts to fetch from cache then
+        hits the database once for any misses.
+        """
+        cache_keys = {
+            subscription.id: self.__build_subscription_cache_key(subscription.id)
+            for subscription in subscriptions
+        }
+        cached = cache.get_many(list(cache_keys.values()))
+        alert_rules = {
+            subscription_id: cached[cache_key]
+            for subscription_id, cache_key in cache_keys.items()
+            if cached.get(cache_key) is not None
+        }
+
+        missing = [
+            subscription for subscription in subscriptions if subscription.id not in alert_rules
+        ]
+        if missing:
+            by_snuba_query = {
+                alert_rule.snuba_query_id: alert_rule
+                for alert_rule in self.filter(
+                    snuba_query_id__in={subscription.snuba_query_id for subscription in missing}
+                )
+            }
+            fetched = {
+                subscription.id: by_snuba_query[subscription.snuba_query_id]
+                for subscription in missing
+                if subscription.snuba_query_id in by_snuba_query
+            }
+            cache.set_many(
+                {
+                    cache_keys[subscription_id]: alert_rule
+                    for subscription_id, alert_rule in fetched.items()
+                },
+                3600,
+            )
+            alert_rules.update(fetched)
+
+        return alert_rules
+
     @classmethod
     def clear_subscription_cache(cls, instance, **kwargs: Any) -> None:
         cache.delete(cls.__build_subscription_cache_key(instance.id))
@@ -407,6 +450,42 @@ class AlertRuleTriggerManager(BaseManager["AlertRuleTrigger"]):
             cache.set(cache_key, triggers, 3600)
         return triggers
 
+    def get_for_alert_rules(
+        self, alert_rules: Collection[AlertRule]
+    ) -> dict[int, list[AlertRuleTrigger]]:
+        """
+        Fetches the AlertRuleTriggers associated with many AlertRules, keyed by alert rule id.
+        Attempts to fetch from cache then hits the database once for any misses.
+        """
+        cache_keys = {
+            alert_rule.id: self._build_trigger_cache_key(alert_rule.id)
+            for alert_rule in alert_rules
+        }
+        cached = cache.get_many(list(cache_keys.values()))
+        triggers = {
+            alert_rule_id: cached[cache_key]
+            for alert_rule_id, cache_key in cache_keys.items()
+            if cached.get(cache_key) is not None
+        }
+
+        missing = [alert_rule_id for alert_rule_id in cache_keys if alert_rule_id not in triggers]
+        if missing:
+            fetched: dict[int, list[AlertRuleTrigger]] = {
+                alert_rule_id: [] for alert_rule_id in missing
+            }
+            for trigger in AlertRuleTrigger.objects.filter(alert_rule_id__in=missing):
+                fetched[trigger.alert_rule_id].append(trigger)
+            cache.set_many(
+                {
+                    cache_keys[alert_rule_id]: alert_rule_triggers
+                    for alert_rule_id, alert_rule_triggers in fetched.items()
+                },
+                3600,
+            )
+            triggers.update(fetched)
+
+        return triggers
+
     @classmethod
     def clear_trigger_cache(cls, instance: AlertRuleTrigger, **kwargs: Any) -> None:
         cache.delete(cls._build_trigger_cache_key(instance.alert_rule_id))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Collection
 from datetime import datetime
 from enum import Enum
 from typing import ClassVar
@@ -88,6 +89,29 @@ class IncidentManager(BaseManager["Incident"]):
 
         return incident
 
+    def get_cached_active_incidents(
+        self, alert_rule_subscriptions: Collection[tuple[int, Model]]
+    ) -> dict[int, Incident]:
+        """
+        fetches the active incidents for many (alert rule id, subscription) pairs from the cache
+        populated by `get_active_incident`, keyed by subscription id. Subscriptions without a
+        cached active incident are left out.
+        """
+        cache_keys = {
+            subscription.id: self._build_active_incident_cache_key(
+                alert_rule_id=alert_rule_id,
+                project_id=subscription.project_id,
+                subscription_id=subscription.id,
+            )
+            for alert_rule_id, subscription in alert_rule_subscriptions
+        }
+        cached = cache.get_many(list(cache_keys.values()))
+        return {
+            subscription_id: cached[cache_key]
+            for subscription_id, cache_key in cache_keys.items()
+            if cached.get(cache_key)
+        }
+
     @classmethod
     def clear_active_incident_cache(cls, instance, **kwargs):
         # instance is an Incident
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 import operator
-from collections.abc import Sequence
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
 from copy import deepcopy
 from datetime import datetime, timedelta
 from typing import TypeVar, cast
@@ -45,6 +46,7 @@ from sentry.incidents.tasks import handle_trigger_action
 from sentry.incidents.utils.metric_issue_poc import create_or_update_metric_issue
 from sentry.incidents.utils.types import QuerySubscriptionUpdate
 from sentry.models.project import Project
+from sentry.search.events.builder.base import BaseQueryBuilder
 from sentry.seer.anomaly_detection.get_anomaly_data import get_anomaly_data_from_seer
 from sentry.seer.anomaly_detection.utils import anomaly_has_confidence, has_anomaly
 from sentry.snuba.dataset import Dataset
@@ -54,9 +56,11 @@ from sentry.snuba.entity_subscription import (
     get_entity_subscription_from_snuba_query,
 )
 from sentry.snuba.models import QuerySubscription
+from sentry.snuba.query_subscriptions.consumer import BatchPartiallyHandledError
 from sentry.snuba.subscriptions import delete_snuba_subscription
 from sentry.utils import metrics, redis
 from sentry.utils.dates import to_datetime
+from sentry.utils.snuba import bulk_snuba_queries
 
 logger = logging.getLogger(__name__)
 REDIS_TTL = int(timedelta(days=7).total_seconds())
@@ -72,8 +76,13 @@ ALERT_RULE_TRIGGER_STAT_KEYS = ("alert_triggered", "resolve_triggered")
 #  functionality, then maybe we should move this to constants
 CRASH_RATE_ALERT_MINIMUM_THRESHOLD: int | None = None
 
+COMPARISON_QUERY_REFERRER = "subscription_processor.comparison_query"
+
 T = TypeVar("T")
 
+# The last update timestamp, and the consecutive alert and resolve counts per trigger id
+AlertRuleStats = tuple[datetime, dict[int, int], dict[int, int]]
+
 
 class SubscriptionProcessor:
     """
@@ -93,21 +102,46 @@ class SubscriptionProcessor:
         AlertRuleThresholdType.BELOW: (operator.lt, operator.gt),
     }
 
-    def __init__(self, subscription: QuerySubscription) -> None:
+    def __init__(
+        self,
+        subscription: QuerySubscription,
+        alert_rule: AlertRule | None = None,
+        triggers: list[AlertRuleTrigger] | None = None,
+        alert_rule_stats: AlertRuleStats | None = None,
+    ) -> None:
+        """
+        `alert_rule`, `triggers` and `alert_rule_stats` may be passed when they were already
+        loaded for a batch of updates, otherwise they're fetched for the subscription.
+        """
         self.subscription = subscription
-        try:
-            self.alert_rule = AlertRule.objects.get_for_subscription(subscription)
-        except AlertRule.DoesNotExist:
-            return
+        # Comparison query results fetched ahead of time, keyed by the update timestamp
+        self.comparison_aggregates: dict[datetime, float | None] = {}
+        # When set, stats are kept in `pending_alert_rule_stats` rather than written to redis
+        # so that the caller can write the stats of many processors together
+        self.defer_alert_rule_stats = False
+        self.pending_alert_rule_stats: AlertRuleStats | None = None
+
+        if alert_rule is None:
+            try:
+                alert_rule = AlertRule.objects.get_for_subscription(subscription)
+            except AlertRule.DoesNotExist:
+                return
+        self.alert_rule = alert_rule
 
-        self.triggers = AlertRuleTrigger.objects.get_for_alert_rule(self.alert_rule)
+        if triggers is None:
+            triggers = AlertRuleTrigger.objects.get_for_alert_rule(self.alert_rule)
+        self.triggers = triggers
         self.triggers.sort(key=lambda trigger: trigger.alert_threshold)
 
+        if alert_rule_stats is None:
+            alert_rule_stats = get_alert_rule_stats(
+                self.alert_rule, self.subscription, self.triggers
+            )
         (
             self.last_update,
             self.trigger_alert_counts,
             self.trigger_resolve_counts,
-        ) = get_alert_rule_stats(self.alert_rule, self.subscription, self.triggers)
+        ) = deepcopy(alert_rule_stats)
         self.orig_trigger_alert_counts = deepcopy(self.trigger_alert_counts)
         self.orig_trigger_resolve_counts = deepcopy(self.trigger_resolve_counts)
 
@@ -212,39 +246,15 @@ class SubscriptionProcessor:
     ) -> float | None:
         # For comparison alerts run a query over the comparison period and use it to calculate the
         # % change.
-        delta = timedelta(seconds=self.alert_rule.comparison_delta)
-        end = subscription_update["timestamp"] - delta
-        snuba_query = self.subscription.snuba_query
-        start = end - timedelta(seconds=snuba_query.time_window)
-
-        entity_subscription = get_entity_subscription_from_snuba_query(
-            snuba_query,
-            self.subscription.project.organization_id,
-        )
         try:
-            project_ids = [self.subscription.project_id]
-            # TODO: determine whether we need to include the subscription query_extra here
-            query_builder = entity_subscription.build_query_builder(
-                query=snuba_query.query,
-                project_ids=project_ids,
-                environment=snuba_query.environment,
-                params={
-                    "organization_id": self.subscription.project.organization.id,
-                    "project_id": project_ids,
-                    "start": start,
-                    "end": end,
-                },
-            )
-            time_col = ENTITY_TIME_COLUMNS[get_entity_key_from_query_builder(query_builder)]
-            query_builder.add_conditions(
-                [
-                    Condition(Column(time_col), Op.GTE, start),
-                    Condition(Column(time_col), Op.LT, end),
-                ]
-            )
-            query_builder.limit = Limit(1)
-            results = query_builder.run_query(referrer="subscription_processor.comparison_query")
-            comparison_aggregate = list(results["data"][0].values())[0]
+            if subscription_update["timestamp"] in self.comparison_aggregates:
+                comparison_aggregate = self.comparison_aggregates[subscription_update["timestamp"]]
+            else:
+                query_builder = build_comparison_query_builder(
+                    self.alert_rule, self.subscription, subscription_update
+                )
+                results = query_builder.run_query(referrer=COMPARISON_QUERY_REFERRER)
+                comparison_aggregate = list(results["data"][0].values())[0]
 
         except Exception:
             logger.exception(
@@ -828,6 +838,14 @@ class SubscriptionProcessor:
             if alert_count != self.orig_trigger_resolve_counts[trigger_id]
         }
 
+        if self.defer_alert_rule_stats:
+            self.pending_alert_rule_stats = (
+                self.last_update,
+                updated_trigger_alert_counts,
+                updated_trigger_resolve_counts,
+            )
+            return
+
         update_alert_rule_stats(
             self.alert_rule,
             self.subscription,
@@ -837,6 +855,253 @@ class SubscriptionProcessor:
         )
 
 
+def prefetch_comparison_aggregates(
+    updates: Sequence[tuple[QuerySubscriptionUpdate, QuerySubscription]],
+    alert_rules: Mapping[int, AlertRule],
+) -> dict[int, dict[datetime, float | None]]:
+    """
+    Runs the comparison queries needed by a batch of updates as a single snuba request. Returns
+    the comparison aggregates keyed by subscription id and then update timestamp. Queries that
+    can't be combined, or that fail, are left out so the processor runs them on its own.
+    """
+    pending: list[tuple[int, datetime, BaseQueryBuilder]] = []
+    for subscription_update, subscription in updates:
+        alert_rule = alert_rules.get(subscription.id)
+        if (
+            alert_rule is None
+            or not alert_rule.comparison_delta
+            or subscription.snuba_query.dataset == Dataset.Metrics.value
+        ):
+            continue
+
+        try:
+            query_builder = build_comparison_query_builder(
+                alert_rule, subscription, subscription_update
+            )
+        except Exception:
+            continue
+
+        # Some builders post process the results in `run_query`, so they can't be combined
+        if type(query_builder).run_query is not BaseQueryBuilder.run_query:
+            continue
+
+        pending.append((subscription.id, subscription_update["timestamp"], query_builder))
+
+    comparison_aggregates: dict[int, dict[datetime, float | None]] = defaultdict(dict)
+    if not pending:
+        return comparison_aggregates
+
+    try:
+        results = bulk_snuba_queries(
+            [query_builder.get_snql_query() for _, _, query_builder in pending],
+            referrer=COMPARISON_QUERY_REFERRER,
+        )
+    except Exception:
+        logger.exception("Failed to run comparison queries", extra={"count": len(pending)})
+        return comparison_aggregates
+
+    for (subscription_id, timestamp, _), result in zip(pending, results):
+        try:
+            comparison_aggregate = list(result["data"][0].values())[0]
+        except (IndexError, KeyError):
+            continue
+        comparison_aggregates[subscription_id][timestamp] = comparison_aggregate
+
+    return comparison_aggregates
+
+
+def process_updates(
+    updates: Sequence[tuple[QuerySubscriptionUpdate, QuerySubscription]],
+) -> None:
+    """
+    Processes a batch of subscription updates in order, with the same outcome as processing
+    each update with its own `SubscriptionProcessor`. Alert rules, triggers, cached active
+    incidents and trigger stats are loaded for the whole batch, comparison queries are combined
+    into a single snuba request, and the stats are written back in a single redis pipeline once
+    every update was processed.
+
+    If processing stops partway through the batch, the stats of the updates processed so far are
+    still written and `BatchPartiallyHandledError` is raised with the remaining updates, so that
+    triggers and actions never run twice for an update.
+    """
+    subscriptions = {subscription.id: subscription for _, subscription in updates}
+    alert_rules = AlertRule.objects.get_for_subscriptions(list(subscriptions.values()))
+    triggers = AlertRuleTrigger.objects.get_for_alert_rules(
+        list({alert_rule.id: alert_rule for alert_rule in alert_rules.values()}.values())
+    )
+
+    subscription_ids = list(alert_rules)
+    stats = dict(
+        zip(
+            subscription_ids,
+            get_alert_rule_stats_many(
+                [
+                    (
+                        alert_rules[subscription_id],
+                        subscriptions[subscription_id],
+                        triggers[alert_rules[subscription_id].id],
+                    )
+                    for subscription_id in subscription_ids
+                ]
+            ),
+        )
+    )
+    initial_stats = dict(stats)
+
+    active_incidents = Incident.objects.get_cached_active_incidents(
+        [
+            (alert_rules[subscription_id].id, subscriptions[subscription_id])
+            for subscription_id in subscription_ids
+        ]
+    )
+    comparison_aggregates = prefetch_comparison_aggregates(
+        [
+            (subscription_update, subscription)
+            for subscription_update, subscription in updates
+            if subscription.id in stats
+            and subscription_update["timestamp"] > stats[subscription.id][0]
+        ],
+        alert_rules,
+    )
+
+    processed: set[int] = set()
+    handled = 0
+    try:
+        for subscription_update, subscription in updates:
+            alert_rule = alert_rules.get(subscription.id)
+            if alert_rule is None:
+                # The processor takes care of cleaning up subscriptions without an alert rule
+                processor = SubscriptionProcessor(subscription)
+            else:
+                processor = SubscriptionProcessor(
+                    subscription,
+                    alert_rule=alert_rule,
+                    triggers=triggers[alert_rule.id],
+                    alert_rule_stats=stats[subscription.id],
+                )
+                processor.defer_alert_rule_stats = True
+                processor.comparison_aggregates = comparison_aggregates.get(subscription.id, {})
+                # Earlier updates in the batch may have changed the active incident
+                if subscription.id not in processed and subscription.id in active_incidents:
+                    processor.active_incident = active_incidents[subscription.id]
+                processed.add(subscription.id)
+
+            try:
+                with metrics.timer("incidents.subscription_procesor.process_update"):
+                    processor.process_update(subscription_update)
+            except Exception:
+                logger.exception(
+                    "Failed to process subscription update",
+                    extra={
+                        "subscription_id": subscription.id,
+                        "timestamp": subscription_update["timestamp"],
+                    },
+                )
+                handled += 1
+                continue
+
+            if processor.pending_alert_rule_stats is not None:
+                # Carry the stats over to the next update for this subscription, as if they had
+                # been written to and read back from redis
+                last_update, alert_counts, resolve_counts = processor.pending_alert_rule_stats
+                _, prev_alert_counts, prev_resolve_counts = stats[subscription.id]
+                stats[subscription.id] = (
+                    last_update,
+                    {**prev_alert_counts, **alert_counts},
+                    {**prev_resolve_counts, **resolve_counts},
+                )
+            handled += 1
+    except Exception as e:
+        _write_updated_alert_rule_stats(alert_rules, subscriptions, stats, initial_stats)
+        raise BatchPartiallyHandledError(updates[handled:]) from e
+
+    _write_updated_alert_rule_stats(alert_rules, subscriptions, stats, initial_stats)
+
+
+def _write_updated_alert_rule_stats(
+    alert_rules: Mapping[int, AlertRule],
+    subscriptions: Mapping[int, QuerySubscription],
+    stats: Mapping[int, AlertRuleStats],
+    initial_stats: Mapping[int, AlertRuleStats],
+) -> None:
+    """
+    Writes the stats that changed while processing a batch. The updates of the batch have already
+    run their triggers and actions, so a failure is only logged rather than having the updates
+    processed again.
+    """
+    updated_stats = []
+    for subscription_id, (last_update, alert_counts, resolve_counts) in stats.items():
+        if stats[subscription_id] is initial_stats[subscription_id]:
+            continue
+
+        _, initial_alert_counts, initial_resolve_counts = initial_stats[subscription_id]
+        updated_stats.append(
+            (
+                alert_rules[subscription_id],
+                subscriptions[subscription_id],
+                (
+                    last_update,
+                    {
+                        trigger_id: count
+                        for trigger_id, count in alert_counts.items()
+                        if count != initial_alert_counts.get(trigger_id)
+                    },
+                    {
+                        trigger_id: count
+                        for trigger_id, count in resolve_counts.items()
+                        if count != initial_resolve_counts.get(trigger_id)
+                    },
+                ),
+            )
+        )
+
+    try:
+        update_alert_rule_stats_many(updated_stats)
+    except Exception:
+        logger.exception("Failed to write alert rule stats", extra={"count": len(updated_stats)})
+
+
+def build_comparison_query_builder(
+    alert_rule: AlertRule,
+    subscription: QuerySubscription,
+    subscription_update: QuerySubscriptionUpdate,
+) -> BaseQueryBuilder:
+    """
+    Builds the query for the aggregate over the comparison period of a comparison alert rule
+    """
+    delta = timedelta(seconds=alert_rule.comparison_delta)
+    end = subscription_update["timestamp"] - delta
+    snuba_query = subscription.snuba_query
+    start = end - timedelta(seconds=snuba_query.time_window)
+
+    entity_subscription = get_entity_subscription_from_snuba_query(
+        snuba_query,
+        subscription.project.organization_id,
+    )
+    project_ids = [subscription.project_id]
+    # TODO: determine whether we need to include the subscription query_extra here
+    query_builder = entity_subscription.build_query_builder(
+        query=snuba_query.query,
+        project_ids=project_ids,
+        environment=snuba_query.environment,
+        params={
+            "organization_id": subscription.project.organization.id,
+            "project_id": project_ids,
+            "start": start,
+            "end": end,
+        },
+    )
+    time_col = ENTITY_TIME_COLUMNS[get_entity_key_from_query_builder(query_builder)]
+    query_builder.add_conditions(
+        [
+            Condition(Column(time_col), Op.GTE, start),
+            Condition(Column(time_col), Op.LT, end),
+        ]
+    )
+    query_builder.limit = Limit(1)
+    return query_builder
+
+
 def build_alert_rule_stat_keys(alert_rule: AlertRule, subscription: QuerySubscription) -> list[str]:
     """
     Builds keys for fetching stats about alert rules
@@ -882,7 +1147,7 @@ def partition(iterable: Sequence[T], n: int) -> Sequence[Sequence[T]]:
 
 def get_alert_rule_stats(
     alert_rule: AlertRule, subscription: QuerySubscription, triggers: list[AlertRuleTrigger]
-) -> tuple[datetime, dict[str, int], dict[str, int]]:
+) -> AlertRuleStats:
     """
     Fetches stats about the alert rule, specific to the current subscription
     :return: A tuple containing the stats about the alert rule and subscription.
@@ -894,22 +1159,43 @@ def get_alert_rule_stats(
        trigger id, and the value is an int representing how many consecutive times we
        have triggered the resolve threshold
     """
-    alert_rule_keys = build_alert_rule_stat_keys(alert_rule, subscription)
-    trigger_keys = build_trigger_stat_keys(alert_rule, subscription, triggers)
-    results = get_redis_client().mget(alert_rule_keys + trigger_keys)
-    results = tuple(0 if result is None else int(result) for result in results)
-    last_update = to_datetime(results[0])
-    trigger_results = results[1:]
-    trigger_alert_counts = {}
-    trigger_resolve_counts = {}
+    return get_alert_rule_stats_many([(alert_rule, subscription, triggers)])[0]
+
+
+def get_alert_rule_stats_many(
+    items: Sequence[tuple[AlertRule, QuerySubscription, list[AlertRuleTrigger]]],
+) -> list[AlertRuleStats]:
+    """
+    Fetches the stats of many alert rule and subscription pairs with a single redis call.
+    Returns the stats in the same order as `items`, see `get_alert_rule_stats`.
+    """
+    keys: list[str] = []
+    for alert_rule, subscription, triggers in items:
+        keys.extend(build_alert_rule_stat_keys(alert_rule, subscription))
+        keys.extend(build_trigger_stat_keys(alert_rule, subscription, triggers))
+
+    results = get_redis_client().mget(keys) if keys else []
+    results = [0 if result is None else int(result) for result in results]
+
+    stats: list[AlertRuleStats] = []
+    offset = 0
+    for _, _, triggers in items:
+        end = offset + len(ALERT_RULE_STAT_KEYS) + len(triggers) * len(ALERT_RULE_TRIGGER_STAT_KEYS)
+        last_update = to_datetime(results[offset])
+        trigger_results = results[offset + len(ALERT_RULE_STAT_KEYS) : end]
+        offset = end
+
+        trigger_alert_counts = {}
+        trigger_resolve_counts = {}
+        for trigger, trigger_result in zip(
+            triggers, partition(trigger_results, len(ALERT_RULE_TRIGGER_STAT_KEYS))
+        ):
+            trigger_alert_counts[trigger.id] = trigger_result[0]
+            trigger_resolve_counts[trigger.id] = trigger_result[1]
 
-    for trigger, trigger_result in zip(
-        triggers, partition(trigger_results, len(ALERT_RULE_TRIGGER_STAT_KEYS))
-    ):
-        trigger_alert_counts[trigger.id] = trigger_result[0]
-        trigger_resolve_counts[trigger.id] = trigger_result[1]
+        stats.append((last_update, trigger_alert_counts, trigger_resolve_counts))
 
-    return last_update, trigger_alert_counts, trigger_resolve_counts
+    return stats
 
 
 def update_alert_rule_stats(
@@ -922,21 +1208,38 @@ def update_alert_rule_stats(
     """
     Updates stats about the alert rule, subscription and triggers if they've changed.
     """
+    update_alert_rule_stats_many(
+        [(alert_rule, subscription, (last_update, alert_counts, resolve_counts))]
+    )
+
+
+def update_alert_rule_stats_many(
+    items: Sequence[tuple[AlertRule, QuerySubscription, AlertRuleStats]],
+) -> None:
+    """
+    Updates the stats of many alert rule and subscription pairs with a single redis pipeline.
+    Only the trigger counts that are passed are written, see `update_alert_rule_stats`.
+    """
+    if not items:
+        return
+
     pipeline = get_redis_client().pipeline()
 
-    counts_with_stat_keys = zip(ALERT_RULE_TRIGGER_STAT_KEYS, (alert_counts, resolve_counts))
-    for stat_key, trigger_counts in counts_with_stat_keys:
-        for trigger_id, alert_count in trigger_counts.items():
-            pipeline.set(
-                build_alert_rule_trigger_stat_key(
-                    alert_rule.id, subscription.project_id, trigger_id, stat_key
-                ),
-                alert_count,
-                ex=REDIS_TTL,
-            )
+    for alert_rule, subscription, (last_update, alert_counts, resolve_counts) in items:
+        counts_with_stat_keys = zip(ALERT_RULE_TRIGGER_STAT_KEYS, (alert_counts, resolve_counts))
+        for stat_key, trigger_counts in counts_with_stat_keys:
+            for trigger_id, alert_count in trigger_counts.items():
+                pipeline.set(
+                    build_alert_rule_trigger_stat_key(
+                        alert_rule.id, subscription.project_id, trigger_id, stat_key
+                    ),
+                    alert_count,
+                    ex=REDIS_TTL,
+                )
+
+        last_update_key = build_alert_rule_stat_keys(alert_rule, subscription)[0]
+        pipeline.set(last_update_key, int(last_update.timestamp()), ex=REDIS_TTL)
 
-    last_update_key = build_alert_rule_stat_keys(alert_rule, subscription)[0]
-    pipeline.set(last_update_key, int(last_update.timestamp()), ex=REDIS_TTL)
     pipeline.execute()
 
 
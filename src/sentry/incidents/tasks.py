@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from typing import Any
 
 from sentry.incidents.models.alert_rule import (
@@ -23,7 +24,10 @@ from sentry.models.project import Project
 from sentry.silo.base import SiloMode
 from sentry.snuba.dataset import Dataset
 from sentry.snuba.models import QuerySubscription
-from sentry.snuba.query_subscriptions.consumer import register_subscriber
+from sentry.snuba.query_subscriptions.consumer import (
+    register_batch_subscriber,
+    register_subscriber,
+)
 from sentry.tasks.base import instrumented_task
 from sentry.utils import metrics
 
@@ -74,6 +78,19 @@ def handle_snuba_query_update(
         SubscriptionProcessor(subscription).process_update(subscription_update)
 
 
+@register_batch_subscriber(INCIDENTS_SNUBA_SUBSCRIPTION_TYPE)
+def handle_snuba_query_updates(
+    updates: Sequence[tuple[QuerySubscriptionUpdate, QuerySubscription]],
+) -> None:
+    """
+    Handles a batch of subscription updates for `QuerySubscription`s.
+    """
+    from sentry.incidents.subscription_processor import process_updates
+
+    with metrics.timer("incidents.subscription_procesor.process_updates"):
+        process_updates(updates)
+
+
 @instrumented_task(
     name="sentry.incidents.tasks.handle_trigger_action",
     queue="incidents",
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from arroyo.backends.kafka import KafkaPayload
 from django.db.models import Q
 from sentry_kafka_schemas.schema_types.monitors_clock_tasks_v1 import MarkMissing
 
 from sentry.constants import ObjectStatus
+from sentry.monitors import timing_wheel
 from sentry.monitors.logic.mark_failed import mark_failed
 from sentry.monitors.models import (
     CheckInStatus,
@@ -24,6 +25,11 @@ from .producer import MONITORS_CLOCK_TASKS_CODEC, produce_task
 logger = logging.getLogger(__name__)
 
 
+# Seconds after which due candidates of the timing wheel that are ignored, for
+# example because their monitor is disabled, are checked again. This picks up
+# monitors that are enabled again on the next tick.
+IGNORED_RECHECK_DELAY = 60
+
 # This is the MAXIMUM number of MONITOR this job will check.
 #
 # NOTE: We should keep an eye on this as we have more and more usage of
@@ -55,13 +61,17 @@ def dispatch_check_missing(ts: datetime):
 
     This will dispatch MarkMissing messages into monitors-clock-tasks.
     """
-    missed_envs = list(
-        MonitorEnvironment.objects.filter(
-            IGNORE_MONITORS,
-            monitor__type__in=[MonitorType.CRON_JOB],
-            next_checkin_latest__lte=ts,
-        ).values("id")[:MONITOR_LIMIT]
-    )
+    # The timing wheel is only used once it has been rebuilt completely
+    if timing_wheel.is_enabled() and timing_wheel.is_built():
+        missed_envs = _find_missed_from_timing_wheel(ts)
+    else:
+        missed_envs = list(
+            MonitorEnvironment.objects.filter(
+                IGNORE_MONITORS,
+                monitor__type__in=[MonitorType.CRON_JOB],
+                next_checkin_latest__lte=ts,
+            ).values("id")[:MONITOR_LIMIT]
+        )
 
     metrics.gauge(
         "sentry.monitors.tasks.check_missing.count",
@@ -87,6 +97,56 @@ def dispatch_check_missing(ts: datetime):
         produce_task(payload)
 
 
+def _find_missed_from_timing_wheel(ts: datetime) -> list[dict[str, int]]:
+    """
+    Pops the monitor environments that are due according to the timing wheel
+    and verifies them against the database. Environments whose
+    next_checkin_latest has moved into the future are scheduled again.
+    Environments that are ignored, for example because their monitor is
+    disabled, are checked again after `IGNORED_RECHECK_DELAY`, as the database
+    scan would pick them up once they're enabled again.
+    """
+    candidate_ids = timing_wheel.pop_due_missed(ts, MONITOR_LIMIT)
+    if not candidate_ids:
+        return []
+
+    candidates = MonitorEnvironment.objects.filter(
+        IGNORE_MONITORS,
+        monitor__type__in=[MonitorType.CRON_JOB],
+        id__in=candidate_ids,
+        next_checkin_latest__isnull=False,
+    ).values_list("id", "next_checkin_latest")
+
+    missed_envs = []
+    checked_ids = set()
+    for monitor_environment_id, next_checkin_latest in candidates:
+        checked_ids.add(monitor_environment_id)
+        if next_checkin_latest <= ts:
+            missed_envs.append({"id": monitor_environment_id})
+        else:
+            timing_wheel.schedule_missed(monitor_environment_id, next_checkin_latest)
+
+    ignored_ids = [
+        monitor_environment_id
+        for monitor_environment_id in candidate_ids
+        if monitor_environment_id not in checked_ids
+    ]
+    if ignored_ids:
+        recheck_at = ts + timedelta(seconds=IGNORED_RECHECK_DELAY)
+        # Environments that were deleted or no longer expect a check-in are
+        # dropped
+        ignored = MonitorEnvironment.objects.filter(
+            id__in=ignored_ids,
+            next_checkin_latest__isnull=False,
+        ).values_list("id", "next_checkin_latest")
+        for monitor_environment_id, next_checkin_latest in ignored:
+            timing_wheel.schedule_missed(
+                monitor_environment_id, max(next_checkin_latest, recheck_at)
+            )
+
+    return missed_envs
+
+
 def mark_environment_missing(monitor_environment_id: int, ts: datetime):
     logger.info("mark_missing", extra={"monitor_environment_id": monitor_environment_id})
 
@@ -6,6 +6,7 @@ from datetime import datetime
 from arroyo.backends.kafka import KafkaPayload
 from sentry_kafka_schemas.schema_types.monitors_clock_tasks_v1 import MarkTimeout
 
+from sentry.monitors import timing_wheel
 from sentry.monitors.logic.mark_failed import mark_failed
 from sentry.monitors.models import CheckInStatus, MonitorCheckIn
 from sentry.monitors.schedule import get_prev_schedule
@@ -29,14 +30,16 @@ def dispatch_check_timeout(ts: datetime):
 
     This will dispatch MarkTimeout messages into monitors-clock-tasks.
     """
-    timed_out_checkins = list(
-        MonitorCheckIn.objects.filter(
-            status=CheckInStatus.IN_PROGRESS,
-            timeout_at__lte=ts,
-        ).values(
-            "id", "monitor_environment_id"
-        )[:CHECKINS_LIMIT]
-    )
+    # The timing wheel is only used once it has been rebuilt completely
+    if timing_wheel.is_enabled() and timing_wheel.is_built():
+        timed_out_checkins = _find_timeouts_from_timing_wheel(ts)
+    else:
+        timed_out_checkins = list(
+            MonitorCheckIn.objects.filter(
+                status=CheckInStatus.IN_PROGRESS,
+                timeout_at__lte=ts,
+            ).values("id", "monitor_environment_id")[:CHECKINS_LIMIT]
+        )
 
     metrics.gauge(
         "sentry.monitors.tasks.check_timeout.count",
@@ -64,6 +67,34 @@ def dispatch_check_timeout(ts: datetime):
         produce_task(payload)
 
 
+def _find_timeouts_from_timing_wheel(ts: datetime) -> list[dict[str, int]]:
+    """
+    Pops the check-ins that are due according to the timing wheel and
+    verifies them against the database. Check-ins whose timeout_at has been
+    bumped into the future are scheduled again.
+    """
+    candidates = timing_wheel.pop_due_timeouts(ts, CHECKINS_LIMIT)
+    if not candidates:
+        return []
+
+    checkins = MonitorCheckIn.objects.filter(
+        id__in=[checkin_id for checkin_id, _ in candidates],
+        status=CheckInStatus.IN_PROGRESS,
+        timeout_at__isnull=False,
+    ).values_list("id", "monitor_environment_id", "timeout_at")
+
+    timed_out_checkins = []
+    for checkin_id, monitor_environment_id, timeout_at in checkins:
+        if timeout_at <= ts:
+            timed_out_checkins.append(
+                {"id": checkin_id, "monitor_environment_id": monitor_environment_id}
+            )
+        else:
+            timing_wheel.schedule_timeout(checkin_id, monitor_environment_id, timeout_at)
+
+    return timed_out_checkins
+
+
 def mark_checkin_timeout(checkin_id: int, ts: datetime) -> None:
     logger.info("checkin_timeout", extra={"checkin_id": checkin_id})
 
@@ -3,11 +3,12 @@ from __future__ import annotations
 import logging
 import uuid
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from concurrent.futures import ThreadPoolExecutor, wait
 from copy import deepcopy
 from datetime import datetime, timedelta
-from functools import partial
+from functools import partial, reduce
+from operator import or_
 from typing import Literal
 
 import sentry_sdk
@@ -18,11 +19,12 @@ from arroyo.processing.strategies.commit import CommitOffsets
 from arroyo.processing.strategies.run_task import RunTask
 from arroyo.types import BrokerValue, Commit, FilteredPayload, Message, Partition
 from django.db import router, transaction
+from django.db.models import Q
 from sentry_kafka_schemas.codecs import Codec
 from sentry_kafka_schemas.schema_types.ingest_monitors_v1 import IngestMonitorMessage
 from sentry_sdk.tracing import Span, Transaction
 
-from sentry import quotas, ratelimits
+from sentry import options, quotas, ratelimits
 from sentry.conf.types.kafka_definition import Topic, get_topic_codec
 from sentry.constants import DataCategory, ObjectStatus
 from sentry.db.postgres.transactions import in_test_hide_transaction_boundary
@@ -65,6 +67,7 @@ from sentry.monitors.processing_errors.errors import (
 )
 from sentry.monitors.processing_errors.manager import handle_processing_errors
 from sentry.monitors.system_incidents import update_check_in_volume
+from sentry.monitors.timing_wheel import schedule_timeout
 from sentry.monitors.types import CheckinItem
 from sentry.monitors.utils import (
     get_new_timeout_at,
@@ -91,15 +94,19 @@ def _ensure_monitor_with_config(
     project: Project,
     monitor_slug: str,
     config: Mapping | None,
+    preloaded_monitor: Monitor | None = None,
 ):
-    try:
-        monitor = Monitor.objects.get(
-            slug=monitor_slug,
-            project_id=project.id,
-            organization_id=project.organization_id,
-        )
-    except Monitor.DoesNotExist:
-        monitor = None
+    if preloaded_monitor and preloaded_monitor.organization_id == project.organization_id:
+        monitor: Monitor | None = preloaded_monitor
+    else:
+        try:
+            monitor = Monitor.objects.get(
+                slug=monitor_slug,
+                project_id=project.id,
+                organization_id=project.organization_id,
+            )
+        except Monitor.DoesNotExist:
+            monitor = None
 
     if not config:
         return monitor
@@ -406,8 +413,17 @@ def update_existing_check_in(
 
     existing_check_in.update(**updated_checkin)
 
+    if updated_checkin["timeout_at"] is not None:
+        schedule_timeout(
+            existing_check_in.id, monitor_environment.id, updated_checkin["timeout_at"]
+        )
+
 
-def _process_checkin(item: CheckinItem, txn: Transaction | Span):
+def _process_checkin(
+    item: CheckinItem,
+    txn: Transaction | Span,
+    preloaded_monitor: Monitor | None = None,
+):
     params = item.payload
 
     start_time = to_datetime(float(item.message["start_time"]))
@@ -553,6 +569,7 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span):
             project,
             monitor_slug,
             monitor_config,
+            preloaded_monitor,
         )
     except ProcessingErrorsException as e:
         ensure_config_errors = list(e.processing_errors)
@@ -855,6 +872,8 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span):
                     )
                 else:
                     txn.set_tag("outcome", "create_new_checkin")
+                    if timeout_at is not None:
+                        schedule_timeout(check_in.id, monitor_environment.id, timeout_at)
                     with in_test_hide_transaction_boundary():
                         signal_first_checkin(project, monitor)
                     metrics.incr(
@@ -914,7 +933,7 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span):
         logger.exception("Failed to process check-in")
 
 
-def process_checkin(item: CheckinItem):
+def process_checkin(item: CheckinItem, preloaded_monitor: Monitor | None = None):
     """
     Process an individual check-in
     """
@@ -925,20 +944,53 @@ def process_checkin(item: CheckinItem):
         ) as txn:
             # Deepcopy the checkin here so that it's not modified. We need the original when we get a
             # `ProcessingErrorsException`
-            _process_checkin(deepcopy(item), txn)
+            _process_checkin(deepcopy(item), txn, preloaded_monitor)
     except ProcessingErrorsException as e:
         handle_processing_errors(item, e)
     except Exception:
         logger.exception("Failed to process check-in")
 
 
-def process_checkin_group(items: list[CheckinItem]):
+def process_checkin_group(items: list[CheckinItem], preloaded_monitor: Monitor | None = None):
     """
     Process a group of related check-ins (all part of the same monitor)
     completely serially.
+
+    When the monitor of the group was already loaded it is used for every
+    check-in of the group, instead of each check-in looking it up again.
     """
     for item in items:
-        process_checkin(item)
+        process_checkin(item, preloaded_monitor)
+
+
+def _monitor_key(item: CheckinItem) -> tuple[int, str]:
+    return int(item.message["project_id"]), item.valid_monitor_slug
+
+
+def preload_monitors(items: Iterable[CheckinItem]) -> dict[tuple[int, str], Monitor]:
+    """
+    Fetches the monitors of all of the check-ins in a batch using a single
+    query. Monitors which do not exist yet (and may be upserted while
+    processing) are not included.
+    """
+    slugs_by_project: dict[int, set[str]] = defaultdict(set)
+    for item in items:
+        project_id, monitor_slug = _monitor_key(item)
+        slugs_by_project[project_id].add(monitor_slug)
+
+    if not slugs_by_project:
+        return {}
+
+    query = reduce(
+        or_,
+        (
+            Q(project_id=project_id, slug__in=monitor_slugs)
+            for project_id, monitor_slugs in slugs_by_project.items()
+        ),
+    )
+    return {
+        (monitor.project_id, monitor.slug): monitor for monitor in Monitor.objects.filter(query)
+    }
 
 
 def process_batch(executor: ThreadPoolExecutor, message: Message[ValuesBatch[KafkaPayload]]):
@@ -988,8 +1040,20 @@ def process_batch(executor: ThreadPoolExecutor, message: Message[ValuesBatch[Kaf
 
     # Submit check-in groups for processing
     with sentry_sdk.start_transaction(op="process_batch", name="monitors.monitor_consumer"):
+        preloaded_monitors: Mapping[tuple[int, str], Monitor] = {}
+        if options.get("crons.consumer.preload_monitors"):
+            preloaded_monitors = preload_monitors(group[0] for group in checkin_mapping.values())
+
+        # XXX: Groups of different environments share the same monitor. Each
+        # group gets its own copy since groups are processed in parallel and
+        # processing a check-in may modify the monitor.
         futures = [
-            executor.submit(process_checkin_group, group) for group in checkin_mapping.values()
+            executor.submit(
+                process_checkin_group,
+                group,
+                deepcopy(preloaded_monitors.get(_monitor_key(group[0]))),
+            )
+            for group in checkin_mapping.values()
         ]
         wait(futures)
 
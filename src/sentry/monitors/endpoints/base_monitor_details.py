@@ -17,6 +17,7 @@ from sentry.deletions.models.scheduleddeletion import RegionScheduledDeletion
 from sentry.models.environment import Environment
 from sentry.models.project import Project
 from sentry.models.rule import Rule, RuleActivity, RuleActivityType
+from sentry.monitors import timing_wheel
 from sentry.monitors.models import (
     CheckInStatus,
     Monitor,
@@ -117,6 +118,10 @@ class MonitorDetailsMixin(BaseEndpointMixin):
                     monitor_id=monitor.id, status=CheckInStatus.IN_PROGRESS
                 ).update(timeout_at=TruncMinute(F("date_added")) + get_max_runtime(max_runtime))
 
+            # The bulk updates above bypass the timing wheel
+            if checkin_margin != existing_margin or max_runtime != existing_max_runtime:
+                timing_wheel.schedule_monitor(monitor.id)
+
         if "project" in result and result["project"].id != monitor.project_id:
             raise ParameterValidationError("existing monitors may not be moved between projects")
 
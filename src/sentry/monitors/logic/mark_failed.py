@@ -7,6 +7,7 @@ from django.db.models import Q
 
 from sentry.monitors.logic.incidents import try_incident_threshold
 from sentry.monitors.models import CheckInStatus, MonitorCheckIn, MonitorEnvironment
+from sentry.monitors.timing_wheel import schedule_missed
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +73,8 @@ def mark_failed(
     if not affected:
         return False
 
+    schedule_missed(monitor_env.id, next_checkin_latest)
+
     # refresh the object from the database so we have the updated values in our
     # cached instance
     monitor_env.refresh_from_db()
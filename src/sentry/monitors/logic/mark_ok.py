@@ -6,6 +6,7 @@ from typing import NotRequired, TypedDict
 
 from sentry.monitors.logic.incidents import try_incident_resolution
 from sentry.monitors.models import MonitorCheckIn, MonitorEnvironment, MonitorStatus
+from sentry.monitors.timing_wheel import schedule_missed
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +46,11 @@ def mark_ok(checkin: MonitorCheckIn, succeeded_at: datetime) -> None:
     if incident_resolved:
         params["status"] = MonitorStatus.OK
 
-    MonitorEnvironment.objects.filter(id=monitor_env.id).exclude(
-        last_checkin__gt=succeeded_at
-    ).update(**params)
+    affected = (
+        MonitorEnvironment.objects.filter(id=monitor_env.id)
+        .exclude(last_checkin__gt=succeeded_at)
+        .update(**params)
+    )
+
+    if affected:
+        schedule_missed(monitor_env.id, next_checkin_latest)
@@ -1,4 +1,7 @@
-from datetime import datetime
+import re
+from bisect import bisect_left, bisect_right
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 
 from cronsim import CronSim
 from dateutil import rrule
@@ -14,6 +17,87 @@ SCHEDULE_INTERVAL_MAP: dict[IntervalUnit, int] = {
     "minute": rrule.MINUTELY,
 }
 
+# Interval units with a fixed length. Their schedules can be computed with
+# plain datetime arithmetic (which, like rrule, operates on the wall clock)
+# instead of by iterating over an rrule.
+FIXED_INTERVAL_DELTAS: dict[IntervalUnit, timedelta] = {
+    "week": timedelta(weeks=1),
+    "day": timedelta(days=1),
+    "hour": timedelta(hours=1),
+    "minute": timedelta(minutes=1),
+}
+
+MINUTE_RE = re.compile(r"[0-9]+")
+
+
+@lru_cache(maxsize=1024)
+def _compile_minute_crontab(crontab: str) -> tuple[int, ...] | None:
+    """
+    Returns the sorted minutes of the hour a crontab runs at when it only
+    constrains the minute field (such as `*/5 * * * *` or `0,30 * * * *`).
+    Returns None for any other crontab, those are handled by CronSim.
+    """
+    parts = crontab.split()
+    if len(parts) != 5 or parts[1:] != ["*", "*", "*", "*"]:
+        return None
+
+    field = parts[0]
+    if field == "*":
+        return tuple(range(60))
+
+    if field.startswith("*/"):
+        step = field[2:]
+        if not MINUTE_RE.fullmatch(step) or not 0 < int(step) < 60:
+            return None
+        return tuple(range(0, 60, int(step)))
+
+    minutes = set()
+    for item in field.split(","):
+        if not MINUTE_RE.fullmatch(item) or int(item) > 59:
+            return None
+        minutes.add(int(item))
+    return tuple(sorted(minutes))
+
+
+def _shift_minutes(ts: datetime, minutes: int) -> datetime:
+    """
+    Moves the timestamp by a number of minutes in absolute time, matching how
+    CronSim ticks for crontabs that run every hour.
+    """
+    if ts.tzinfo is None:
+        return ts + timedelta(minutes=minutes)
+    return (ts.astimezone(UTC) + timedelta(minutes=minutes)).astimezone(ts.tzinfo)
+
+
+def _next_minute_crontab(reference_ts: datetime, minutes: tuple[int, ...]) -> datetime | None:
+    ts = reference_ts.replace(second=0, microsecond=0)
+    idx = bisect_right(minutes, ts.minute)
+    target = minutes[idx] if idx < len(minutes) else minutes[0] + 60
+    next_ts = _shift_minutes(ts, target - ts.minute)
+
+    # The UTC offset changed in between (such as a DST transition), the local
+    # minutes no longer line up. Let CronSim deal with it.
+    if next_ts.utcoffset() != ts.utcoffset():
+        return None
+    return next_ts
+
+
+def _prev_minute_crontab(reference_ts: datetime, minutes: tuple[int, ...]) -> datetime | None:
+    ts = reference_ts.replace(second=0, microsecond=0)
+    # The minute the reference falls into is itself before the reference,
+    # unless the reference is on the whole minute. Like CronSim, microseconds
+    # of the reference are ignored.
+    if ts == reference_ts.replace(microsecond=0):
+        idx = bisect_left(minutes, ts.minute) - 1
+    else:
+        idx = bisect_right(minutes, ts.minute) - 1
+    target = minutes[idx] if idx >= 0 else minutes[-1] - 60
+    prev_ts = _shift_minutes(ts, target - ts.minute)
+
+    if prev_ts.utcoffset() != ts.utcoffset():
+        return None
+    return prev_ts
+
 
 def get_next_schedule(
     reference_ts: datetime,
@@ -38,10 +122,22 @@ def get_next_schedule(
     # of granularity we're able to support
 
     if schedule.type == "crontab":
+        minutes = _compile_minute_crontab(schedule.crontab)
+        if minutes is not None:
+            next_ts = _next_minute_crontab(reference_ts, minutes)
+            if next_ts is not None:
+                return next_ts
+
         iter = CronSim(schedule.crontab, reference_ts)
         return next(iter).replace(second=0, microsecond=0)
 
     if schedule.type == "interval":
+        if schedule.unit in FIXED_INTERVAL_DELTAS:
+            # rrule starts at the reference_ts (without its microseconds) so
+            # the next occurrence is exactly one interval later.
+            interval = FIXED_INTERVAL_DELTAS[schedule.unit] * schedule.interval
+            return (reference_ts + interval).replace(second=0, microsecond=0)
+
         rule = rrule.rrule(
             freq=SCHEDULE_INTERVAL_MAP[schedule.unit],
             interval=schedule.interval,
@@ -77,10 +173,28 @@ def get_prev_schedule(
     >>> 05:30
     """
     if schedule.type == "crontab":
+        minutes = _compile_minute_crontab(schedule.crontab)
+        if minutes is not None:
+            prev_ts = _prev_minute_crontab(reference_ts, minutes)
+            if prev_ts is not None:
+                return prev_ts
+
         iter = CronSim(schedule.crontab, reference_ts, reverse=True)
         return next(iter).replace(second=0, microsecond=0)
 
     if schedule.type == "interval":
+        if schedule.unit in FIXED_INTERVAL_DELTAS and start_ts.tzinfo is reference_ts.tzinfo:
+            # Jump straight to the last occurrence before the reference_ts
+            # instead of iterating over every occurrence since start_ts.
+            # Occurrences are compared using the wall clock, as rrule does.
+            start = start_ts.replace(microsecond=0, tzinfo=None)
+            elapsed = reference_ts.replace(tzinfo=None) - start
+            interval = FIXED_INTERVAL_DELTAS[schedule.unit] * schedule.interval
+            if elapsed > timedelta(0):
+                count = -(-elapsed // interval) - 1
+                prev_ts = start + interval * count
+                return prev_ts.replace(second=0, tzinfo=start_ts.tzinfo)
+
         rule = rrule.rrule(
             freq=SCHEDULE_INTERVAL_MAP[schedule.unit],
             interval=schedule.interval,
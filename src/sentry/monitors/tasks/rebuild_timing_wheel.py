@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import logging
+
+from sentry.locks import locks
+from sentry.monitors import timing_wheel
+from sentry.silo.base import SiloMode
+from sentry.tasks.base import instrumented_task
+from sentry.utils.locking import UnableToAcquireLock
+
+logger = logging.getLogger("sentry")
+
+
+@instrumented_task(
+    name="sentry.monitors.tasks.rebuild_timing_wheel",
+    silo_mode=SiloMode.REGION,
+    max_retries=0,
+    time_limit=15 * 60,
+    soft_time_limit=10 * 60,
+)
+def rebuild_timing_wheel():
+    """
+    Rebuilds the monitors timing wheel from the database when it is
+    incomplete or due for a periodic rebuild. This runs outside of the clock
+    tick, which scans the database itself until the index is complete.
+    """
+    lock = locks.get("monitors:rebuild_timing_wheel", duration=15 * 60, name="monitors")
+    try:
+        with lock.acquire():
+            timing_wheel.maybe_rebuild()
+    except UnableToAcquireLock:
+        logger.info("monitors.timing_wheel.rebuild_in_progress")
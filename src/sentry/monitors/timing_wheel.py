@@ -0,0 +1,238 @@
+"""
+A redis backed index of the points in time at which monitor environments
+become due to be marked as missed, and in-progress check-ins become due to
+be marked as timed out.
+
+The clock tasks would otherwise have to scan `MonitorEnvironment` and
+`MonitorCheckIn` on every tick to find the rows that are due. Instead each
+index is a sorted set scored by the due timestamp that is updated whenever a
+check-in is processed, so a tick only has to pop the entries that are due.
+
+The index only produces *candidates*. Callers must verify popped entries
+against the database, since an entry may be outdated (for example when a
+monitor was disabled), and schedule entries that are still pending again.
+Entries that are missing from the index, for example because redis lost its
+state, are picked up by periodically rebuilding the index from the database
+in the `rebuild_timing_wheel` task. Until the index has been rebuilt the
+clock tasks keep scanning the database.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterable
+from datetime import datetime
+
+from django.conf import settings
+
+from sentry import options
+from sentry.monitors.models import CheckInStatus, MonitorCheckIn, MonitorEnvironment
+from sentry.utils import metrics, redis
+from sentry.utils.query import RangeQuerySetWrapper
+from sentry.utils.redis import load_redis_script
+
+logger = logging.getLogger(__name__)
+
+# Sorted set of monitor environment ids scored by their `next_checkin_latest`
+MISSED_KEY = "sentry.monitors.timing_wheel.missed"
+
+# Sorted set of `<checkin_id>:<monitor_environment_id>` scored by the
+# check-in's `timeout_at`
+TIMEOUT_KEY = "sentry.monitors.timing_wheel.timeout"
+
+# Set to the time of the last complete rebuild of the index. While it is
+# missing the index is not complete and must not be used.
+REBUILT_KEY = "sentry.monitors.timing_wheel.rebuilt"
+
+REBUILD_INTERVAL = 60 * 60
+
+REBUILD_BATCH_SIZE = 1000
+
+pop_due_script = load_redis_script("monitors/pop_due.lua")
+
+
+def _get_redis_client():
+    return redis.redis_clusters.get(settings.SENTRY_MONITORS_REDIS_CLUSTER)
+
+
+def is_enabled() -> bool:
+    return options.get("crons.timing_wheel.enabled")
+
+
+def _timeout_member(checkin_id: int, monitor_environment_id: int) -> str:
+    return f"{checkin_id}:{monitor_environment_id}"
+
+
+def schedule_missed(monitor_environment_id: int, next_checkin_latest: datetime) -> None:
+    """
+    Record when the monitor environment is due to be marked as missed.
+    """
+    if not is_enabled():
+        return
+
+    _get_redis_client().zadd(
+        MISSED_KEY, {str(monitor_environment_id): next_checkin_latest.timestamp()}
+    )
+
+
+def schedule_timeout(checkin_id: int, monitor_environment_id: int, timeout_at: datetime) -> None:
+    """
+    Record when the in-progress check-in is due to be marked as timed out.
+    """
+    if not is_enabled():
+        return
+
+    _get_redis_client().zadd(
+        TIMEOUT_KEY,
+        {_timeout_member(checkin_id, monitor_environment_id): timeout_at.timestamp()},
+    )
+
+
+def _pop_due(key: str, ts: datetime, limit: int) -> list[str]:
+    # Popped atomically, so that concurrent clock ticks never pop the same
+    # entry twice
+    members: list[str] = pop_due_script([key], [ts.timestamp(), limit], _get_redis_client())
+    return members
+
+
+def pop_due_missed(ts: datetime, limit: int) -> list[int]:
+    """
+    Removes and returns up to `limit` monitor environment ids that were due
+    to check in at or before `ts`.
+    """
+    return [int(member) for member in _pop_due(MISSED_KEY, ts, limit)]
+
+
+def pop_due_timeouts(ts: datetime, limit: int) -> list[tuple[int, int]]:
+    """
+    Removes and returns up to `limit` `(checkin_id, monitor_environment_id)`
+    pairs of check-ins that were due to time out at or before `ts`.
+    """
+    pairs = []
+    for member in _pop_due(TIMEOUT_KEY, ts, limit):
+        checkin_id, monitor_environment_id = member.split(":")
+        pairs.append((int(checkin_id), int(monitor_environment_id)))
+    return pairs
+
+
+def _zadd_batched(key: str, entries: Iterable[tuple[str, datetime]]) -> int:
+    client = _get_redis_client()
+    count = 0
+    batch: dict[str, float] = {}
+    for member, due in entries:
+        batch[member] = due.timestamp()
+        count += 1
+        if len(batch) >= REBUILD_BATCH_SIZE:
+            client.zadd(key, batch)
+            batch = {}
+    if batch:
+        client.zadd(key, batch)
+    return count
+
+
+def schedule_monitor(monitor_id: int) -> None:
+    """
+    Records the due times of all environments and in-progress check-ins of a
+    monitor, after they were changed in bulk.
+    """
+    if not is_enabled():
+        return
+
+    _zadd_batched(
+        MISSED_KEY,
+        (
+            (str(monitor_environment_id), next_checkin_latest)
+            for monitor_environment_id, next_checkin_latest in MonitorEnvironment.objects.filter(
+                monitor_id=monitor_id, next_checkin_latest__isnull=False
+            ).values_list("id", "next_checkin_latest")
+        ),
+    )
+    _zadd_batched(
+        TIMEOUT_KEY,
+        (
+            (_timeout_member(checkin_id, monitor_environment_id), timeout_at)
+            for checkin_id, monitor_environment_id, timeout_at in MonitorCheckIn.objects.filter(
+                monitor_id=monitor_id,
+                status=CheckInStatus.IN_PROGRESS,
+                timeout_at__isnull=False,
+                monitor_environment__isnull=False,
+            ).values_list("id", "monitor_environment_id", "timeout_at")
+        ),
+    )
+
+
+def rebuild() -> None:
+    """
+    Adds every monitor environment and in-progress check-in that has a due
+    time to the index.
+    """
+    missed = _zadd_batched(
+        MISSED_KEY,
+        (
+            (str(monitor_environment.id), monitor_environment.next_checkin_latest)
+            for monitor_environment in RangeQuerySetWrapper(
+                MonitorEnvironment.objects.filter(next_checkin_latest__isnull=False).only(
+                    "id", "next_checkin_latest"
+                ),
+                step=REBUILD_BATCH_SIZE,
+            )
+        ),
+    )
+    timeouts = _zadd_batched(
+        TIMEOUT_KEY,
+        (
+            (_timeout_member(checkin.id, checkin.monitor_environment_id), checkin.timeout_at)
+            for checkin in RangeQuerySetWrapper(
+                MonitorCheckIn.objects.filter(
+                    status=CheckInStatus.IN_PROGRESS,
+                    timeout_at__isnull=False,
+                    monitor_environment__isnull=False,
+                ).only("id", "monitor_environment_id", "timeout_at"),
+                step=REBUILD_BATCH_SIZE,
+            )
+        ),
+    )
+
+    logger.info("monitors.timing_wheel.rebuilt", extra={"missed": missed, "timeouts": timeouts})
+    metrics.incr("monitors.timing_wheel.rebuilt", sample_rate=1.0)
+
+
+def invalidate() -> None:
+    """
+    Marks the index as incomplete until it is rebuilt.
+    """
+    _get_redis_client().delete(REBUILT_KEY)
+
+
+def is_built() -> bool:
+    """
+    Whether the index is complete and can be used by the clock tasks.
+    """
+    return bool(_get_redis_client().exists(REBUILT_KEY))
+
+
+def maybe_rebuild() -> None:
+    """
+    Rebuilds the index if it is incomplete or has not been rebuilt within the
+    last `REBUILD_INTERVAL`, which also covers redis having lost the index.
+
+    While the index is disabled it is invalidated instead, since it is not
+    kept up to date during that time.
+    """
+    client = _get_redis_client()
+    if not is_enabled():
+        if client.exists(REBUILT_KEY):
+            invalidate()
+        return
+
+    rebuilt_at = client.get(REBUILT_KEY)
+    if rebuilt_at is not None and time.time() - float(rebuilt_at) < REBUILD_INTERVAL:
+        return
+
+    started_at = time.time()
+    rebuild()
+    # Only mark the index as complete once the rebuild succeeded, and not if
+    # it was disabled in the meantime.
+    if is_enabled():
+        client.set(REBUILT_KEY, str(started_at))
@@ -676,6 +676,36 @@ register("snuba.search.max-chunk-size", default=2000, flags=FLAG_AUTOMATOR_MODIF
 register("snuba.search.max-total-chunk-time-seconds", default=30.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("snuba.search.hits-sample-size", default=100, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("snuba.track-outcomes-sample-rate", default=0.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Identical snuba requests made while one is in flight wait for and share its result rather
+# than being sent again, within a process and with `cross-process` also across processes
+register(
+    "snuba.coalesce-requests.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "snuba.coalesce-requests.cross-process",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Maximum number of queries with a given referrer that a single process sends to snuba at the
+# same time, as a mapping of referrer to limit. Further queries wait for a slot.
+register(
+    "snuba.referrer-concurrency-limits",
+    type=Dict,
+    default={},
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Decode snuba responses with orjson straight from the response bytes, so that large result
+# sets aren't held in memory as a string and as decoded rows at once
+register(
+    "snuba.compact-result-decoding.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # The percentage of tagkeys that we want to cache. Set to 1.0 in order to cache everything, <=0.0 to stop caching
 register(
@@ -1938,6 +1968,11 @@ register("hybridcloud.integrationproxy.retries", default=5, flags=FLAG_AUTOMATOR
 register("hybridcloud.endpoint_flag_logging", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("hybridcloud.rpc.method_retry_overrides", default={}, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("hybridcloud.rpc.method_timeout_overrides", default={}, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Seconds for which values read from silo backed rpc caches are also kept in process memory.
+# Version bumps made by other processes can go unnoticed for this long. 0 disables it.
+register("hybridcloud.caching.local_ttl", default=0.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Concurrent cache misses of the same key within a process share a single rpc call
+register("hybridcloud.caching.coalesce_fills", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
 # Webhook processing controls
 register(
     "hybridcloud.webhookpayload.worker_threads",
@@ -1945,6 +1980,22 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Number of outbox shards a drain task processes at the same time. Messages within a shard are
+# still delivered in order.
+register(
+    "hybridcloud.outbox.drain_shard_concurrency",
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Maximum number of requests a single process proxies to a region at the same time through the
+# api gateway, as a mapping of region name to limit. Further requests wait for a slot.
+register(
+    "hybridcloud.apigateway.region-concurrency-limits",
+    type=Dict,
+    default={},
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Break glass controls
 register("hybrid_cloud.rpc.disabled-service-methods", default=[], flags=FLAG_AUTOMATOR_MODIFIABLE)
 # == End hybrid cloud subsystem
@@ -1971,6 +2022,18 @@ register("backpressure.checking.enabled", default=False, flags=FLAG_AUTOMATOR_MO
 register("backpressure.checking.interval", default=5, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
 
+# Enables gradual throttling of consumers instead of halting them as soon as they are unhealthy.
+register("backpressure.throttling.enabled", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Factor the admission rate of a consumer is multiplied with on every unhealthy check.
+register("backpressure.throttling.decrease_factor", default=0.5, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Amount the admission rate of a consumer recovers by on every healthy check.
+register("backpressure.throttling.increase_step", default=0.1, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Admission rate below which a consumer is halted entirely.
+register("backpressure.throttling.min_rate", default=0.05, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Throughput in messages per second that the admission rate of a throttled consumer is applied to
+# at least, so that consumers that had little or no traffic before being throttled aren't halted.
+register("backpressure.throttling.min_throughput", default=10.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+
 # How long a status is persisted, which means that updates to health status can be paused for that long before consumers will assume things are unhealthy
 register("backpressure.status_ttl", default=60, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
@@ -2063,6 +2126,25 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Enables loading the monitors of all check-ins in a batch using a single
+# query when the monitor consumer runs in parallel mode.
+register(
+    "crons.consumer.preload_monitors",
+    default=False,
+    flags=FLAG_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Enables finding missed and timed out check-ins using the redis timing wheel
+# index instead of scanning the monitor environment and check-in tables on
+# every clock tick.
+#
+# See the `monitors.timing_wheel` module for more details
+register(
+    "crons.timing_wheel.enabled",
+    default=False,
+    flags=FLAG_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 
 # Sets the timeout for webhooks
 register(
@@ -2959,3 +3041,11 @@ register(
     type=Float,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+
+# Number of batch fragments a data export task fetches at the same time. Fragments past the
+# current one are fetched while it is written, and discarded if the export ends before them.
+register(
+    "dataexport.fetch-concurrency",
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
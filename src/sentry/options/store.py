@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import dataclasses
 import logging
+import threading
+from collections.abc import Mapping
 from random import random
 from time import time
+from types import MappingProxyType
 from typing import Any
+from uuid import uuid4
 
 from django.conf import settings
 from django.db.utils import OperationalError, ProgrammingError
@@ -16,6 +20,10 @@ from sentry.options.manager import UpdateChannel
 CACHE_FETCH_ERR = "Unable to fetch option cache for %s"
 CACHE_UPDATE_ERR = "Unable to update option cache for %s"
 
+# Holds a `(token, updated_at)` pair that is replaced whenever a stored option
+# changes, signalling every process to reload its options snapshot.
+SNAPSHOT_VERSION_KEY = "o:snapshot-version"
+
 logger = logging.getLogger("sentry")
 
 
@@ -51,6 +59,19 @@ class Key:
         return False
 
 
+@dataclasses.dataclass(frozen=True)
+class OptionsSnapshot:
+    """
+    An immutable view of every option stored in the database.
+    """
+
+    values: Mapping[str, Any]
+    # The snapshot version token the values were loaded at
+    version: str | None
+    model: type
+    loaded_at: float
+
+
 def _make_cache_value(key, value):
     now = int(time())
     return (value, now + key.ttl, now + key.ttl + key.grace)
@@ -71,6 +92,7 @@ class OptionsStore:
     def __init__(self, cache=None, ttl=None):
         self.cache = cache
         self.ttl = ttl
+        self._snapshot_lock = threading.Lock()
         self.flush_local_cache()
 
     @property
@@ -90,6 +112,11 @@ class OptionsStore:
         """
         Fetches a value from the options store.
         """
+        if settings.SENTRY_OPTIONS_SNAPSHOT:
+            snapshot = self.get_snapshot(silent=silent)
+            if snapshot is not None:
+                return snapshot.values.get(key.name)
+
         result = self.get_cache(key, silent=silent)
         if result is not None:
             return result
@@ -172,6 +199,108 @@ class OptionsStore:
         # in grace, too bad. The value is considered bad.
         return None
 
+    def get_snapshot(self, silent=False) -> OptionsSnapshot | None:
+        """
+        Returns the snapshot of stored options, reloading it if the snapshot
+        version changed since it was loaded.
+
+        Only one thread reloads the snapshot at a time, the others keep reading
+        the current one. None is returned if no snapshot could be loaded.
+        """
+        snapshot = self._snapshot
+        now = time()
+        if (
+            snapshot is not None
+            and now < self._snapshot_checked_at + settings.SENTRY_OPTIONS_SNAPSHOT_CHECK_INTERVAL
+        ):
+            return snapshot
+
+        if not self._snapshot_lock.acquire(blocking=snapshot is None):
+            return snapshot
+        try:
+            if self._snapshot is not snapshot:
+                # Another thread reloaded it while we were waiting
+                return self._snapshot
+            self._snapshot_checked_at = now
+            return self._refresh_snapshot(snapshot, silent=silent)
+        finally:
+            self._snapshot_lock.release()
+
+    def _refresh_snapshot(
+        self, snapshot: OptionsSnapshot | None, silent=False
+    ) -> OptionsSnapshot | None:
+        from sentry.utils import metrics
+
+        version, updated_at = self._get_snapshot_version(silent=silent)
+        model = self.model_cls()
+        now = time()
+        if (
+            snapshot is not None
+            and snapshot.model is model
+            and version is not None
+            and snapshot.version == version
+            and now < snapshot.loaded_at + settings.SENTRY_OPTIONS_SNAPSHOT_MAX_AGE
+        ):
+            return snapshot
+
+        try:
+            with in_test_hide_transaction_boundary():
+                values = dict(model.objects.values_list("key", "value"))
+        except (ProgrammingError, OperationalError):
+            # Keep serving the previous snapshot until the database is back
+            return snapshot
+        except Exception:
+            if settings.SENTRY_OPTIONS_COMPLAIN_ON_ERRORS:
+                raise
+            elif not silent:
+                logger.exception("option.failed-snapshot")
+            return snapshot
+
+        self._snapshot = OptionsSnapshot(
+            values=MappingProxyType(values), version=version, model=model, loaded_at=now
+        )
+        metrics.incr("options.snapshot.reload", sample_rate=1.0)
+        if updated_at is not None and snapshot is not None and snapshot.version != version:
+            # How long the last option change took to reach this process
+            metrics.timing("options.snapshot.staleness", now - updated_at, sample_rate=1.0)
+        return self._snapshot
+
+    def _get_snapshot_version(self, silent=False) -> tuple[str | None, float | None]:
+        if self.cache is None:
+            return None, None
+
+        try:
+            version = self.cache.get(SNAPSHOT_VERSION_KEY)
+            if version is None:
+                # Nothing has changed since the version was evicted, so any
+                # version will do until the next change.
+                self.cache.add(SNAPSHOT_VERSION_KEY, (uuid4().hex, None), None)
+                version = self.cache.get(SNAPSHOT_VERSION_KEY)
+        except Exception:
+            if not silent:
+                logger.warning(CACHE_FETCH_ERR, SNAPSHOT_VERSION_KEY, exc_info=True)
+            return None, None
+
+        if version is None:
+            return None, None
+        token, updated_at = version
+        return token, updated_at
+
+    def bump_snapshot_version(self) -> None:
+        """
+        Signal every process that stored options changed, so that they
+        reload their snapshots.
+        """
+        # Make our own writes visible to this process on the next read
+        self._snapshot_checked_at = float("-inf")
+
+        if self.cache is None:
+            return
+        try:
+            self.cache.set(SNAPSHOT_VERSION_KEY, (uuid4().hex, time()), None)
+        except Exception:
+            logger.warning(CACHE_UPDATE_ERR, SNAPSHOT_VERSION_KEY, exc_info=True)
+
     def get_store(self, key, silent=False):
         """
         Attempt to fetch value from the database. If successful,
@@ -234,6 +363,7 @@ class OptionsStore:
         assert self.cache is not None, "cache must be configured before mutating options"
 
         self.set_store(key, value, channel)
+        self.bump_snapshot_version()
         return self.set_cache(key, value)
 
     def set_store(self, key, value, channel: UpdateChannel):
@@ -275,6 +405,7 @@ class OptionsStore:
         assert self.cache is not None, "cache must be configured before mutating options"
 
         self.delete_store(key)
+        self.bump_snapshot_version()
         return self.delete_cache(key)
 
     def delete_store(self, key):
@@ -324,9 +455,11 @@ class OptionsStore:
 
     def flush_local_cache(self):
         """
-        Empty store's local in-process cache.
+        Empty store's local in-process cache and options snapshot.
         """
         self._local_cache = {}
+        self._snapshot: OptionsSnapshot | None = None
+        self._snapshot_checked_at = float("-inf")
 
     def maybe_clean_local_cache(self, **kwargs):
         # Periodically force an expire on the local cache.
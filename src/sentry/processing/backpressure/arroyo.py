@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Iterable
 from typing import TypeVar
 
 from arroyo.processing.strategies import MessageRejected, ProcessingStrategy, RunTask
@@ -10,24 +11,134 @@ from sentry import options
 from sentry.processing.backpressure.health import is_consumer_healthy
 
 
+def next_admission_rate(
+    current_rate: float,
+    is_healthy: bool,
+    decrease_factor: float,
+    increase_step: float,
+    min_rate: float,
+) -> float:
+    """
+    Computes the share of messages a consumer should admit after a health
+    check, using additive-increase/multiplicative-decrease.
+
+    While unhealthy the rate is cut by `decrease_factor` on every check until
+    it drops below `min_rate`, at which point the consumer is fully halted.
+    Once healthy again the rate recovers by `increase_step` per check, so that
+    consumers do not all resume at full speed at the same time.
+    """
+    if is_healthy:
+        return min(1.0, current_rate + increase_step)
+
+    rate = current_rate * decrease_factor
+    return rate if rate >= min_rate else 0.0
+
+
+def simulate_admission_rates(
+    health: Iterable[bool],
+    decrease_factor: float,
+    increase_step: float,
+    min_rate: float,
+) -> list[float]:
+    """
+    Replays a sequence of health check results and returns the admission
+    rate after every check. Used to tune the throttling options offline
+    against recorded or synthetic health timelines.
+    """
+    rate = 1.0
+    rates = []
+    for is_healthy in health:
+        rate = next_admission_rate(rate, is_healthy, decrease_factor, increase_step, min_rate)
+        rates.append(rate)
+    return rates
+
+
 class HealthChecker:
     def __init__(self, consumer_name: str = "default"):
         self.consumer_name = consumer_name
         self.last_check: float = 0
         # Queue is healthy by default
         self.is_queue_healthy = True
+        self.admission_rate = 1.0
+        # Messages per second the consumer admitted while it was not throttled.
+        # Throttling admits `admission_rate` times this throughput.
+        self.observed_throughput = 0.0
+        self.admitted = 0
+        self.tokens = 0.0
+        self.last_refill: float = 0
 
     def is_healthy(self) -> bool:
         now = time.time()
         # Check queue health if it's been more than the interval
         if now - self.last_check >= options.get("backpressure.checking.interval"):
+            # Only measure throughput while unthrottled, as measuring it while
+            # throttled would shrink the baseline on every check. An idle
+            # interval keeps the last throughput that was measured.
+            if (
+                self.last_check
+                and self.admission_rate >= 1.0
+                and self.admitted
+                and now > self.last_check
+            ):
+                self.observed_throughput = self.admitted / (now - self.last_check)
+            self.admitted = 0
+
             self.is_queue_healthy = is_consumer_healthy(self.consumer_name)
+            self.admission_rate = next_admission_rate(
+                self.admission_rate,
+                self.is_queue_healthy,
+                decrease_factor=options.get("backpressure.throttling.decrease_factor"),
+                increase_step=options.get("backpressure.throttling.increase_step"),
+                min_rate=options.get("backpressure.throttling.min_rate"),
+            )
 
             # We don't count the time it took to check as part of the interval
             self.last_check = now
 
         return self.is_queue_healthy
 
+    def should_admit(self) -> bool:
+        """
+        Whether the next message should be processed. Without throttling this
+        is a plain on/off switch on the consumer health. With throttling the
+        consumer is slowed down gradually to the admission rate times the
+        throughput it had before being throttled, see `next_admission_rate`.
+        That throughput is at least `backpressure.throttling.min_throughput`,
+        so that a consumer with little traffic isn't halted entirely.
+
+        Rejected messages are retried by arroyo, so throttling has to be based
+        on time rather than on a share of the calls to this method.
+        """
+        is_healthy = self.is_healthy()
+        if not options.get("backpressure.throttling.enabled"):
+            return is_healthy
+
+        if self.admission_rate >= 1.0:
+            self.admitted += 1
+            return True
+        if self.admission_rate <= 0.0:
+            return False
+        if self._take_token():
+            self.admitted += 1
+            return True
+        return False
+
+    def _take_token(self) -> bool:
+        now = time.time()
+        throughput = max(
+            self.observed_throughput, options.get("backpressure.throttling.min_throughput")
+        )
+        allowed_rate = throughput * self.admission_rate
+        # Allow bursts of up to one second worth of messages
+        capacity = max(1.0, allowed_rate)
+        self.tokens = min(capacity, self.tokens + (now - self.last_refill) * allowed_rate)
+        self.last_refill = now
+
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
 
 TPayload = TypeVar("TPayload")
 
@@ -44,7 +155,7 @@ def create_backpressure_step(
     """
 
     def ensure_healthy_queue(message: Message[TPayload]) -> TPayload:
-        if not health_checker.is_healthy():
+        if not health_checker.should_admit():
             raise MessageRejected()
 
         return message.payload
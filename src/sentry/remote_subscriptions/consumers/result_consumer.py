@@ -2,17 +2,21 @@ from __future__ import annotations
 
 import abc
 import logging
-from collections.abc import Mapping
-from typing import Generic, TypeVar
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Generic, Literal, TypeVar
 
 from arroyo.backends.kafka.consumer import KafkaPayload
 from arroyo.processing.strategies.abstract import ProcessingStrategy, ProcessingStrategyFactory
+from arroyo.processing.strategies.batching import BatchStep, ValuesBatch
 from arroyo.processing.strategies.commit import CommitOffsets
 from arroyo.processing.strategies.run_task import RunTask
-from arroyo.types import Commit, FilteredPayload, Message, Partition
+from arroyo.types import BrokerValue, Commit, FilteredPayload, Message, Partition
 
 from sentry.conf.types.kafka_definition import Topic, get_topic_codec
 from sentry.remote_subscriptions.models import BaseRemoteSubscription
+from sentry.utils import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +40,17 @@ class ResultProcessor(abc.ABC, Generic[T, U]):
         except Exception:
             logger.exception("Failed to process message result")
 
+    def process_group(self, subscription: U | None, results: Sequence[T]):
+        """
+        Process a group of results that all belong to the same subscription,
+        in order.
+        """
+        for result in results:
+            try:
+                self.handle_result(subscription, result)
+            except Exception:
+                logger.exception("Failed to process message result")
+
     def get_subscription(self, result: T) -> U | None:
         try:
             return self.subscription_model.objects.get_from_cache(
@@ -44,6 +59,16 @@ class ResultProcessor(abc.ABC, Generic[T, U]):
         except self.subscription_model.DoesNotExist:
             return None
 
+    def get_subscriptions(self, subscription_ids: Sequence[str]) -> dict[str, U]:
+        """
+        Fetches the subscriptions for a batch of results at once. Subscriptions
+        which no longer exist are not included.
+        """
+        subscriptions = self.subscription_model.objects.get_many_from_cache(
+            subscription_ids, key="subscription_id"
+        )
+        return {subscription.subscription_id: subscription for subscription in subscriptions}
+
     @abc.abstractmethod
     def get_subscription_id(self, result: T) -> str:
         pass
@@ -54,10 +79,46 @@ class ResultProcessor(abc.ABC, Generic[T, U]):
 
 
 class ResultsStrategyFactory(ProcessingStrategyFactory[KafkaPayload], Generic[T, U]):
-    def __init__(self) -> None:
+    parallel_executor: ThreadPoolExecutor | None = None
+
+    parallel = False
+    """
+    Does the consumer process results of unrelated subscriptions in parallel?
+    """
+
+    max_batch_size = 500
+    """
+    How many messages will be batched at once when in parallel mode.
+    """
+
+    max_batch_time = 10
+    """
+    The maximum time in seconds to accumulate a batch of results.
+    """
+
+    def __init__(
+        self,
+        mode: Literal["parallel", "serial"] | None = None,
+        max_batch_size: int | None = None,
+        max_batch_time: int | None = None,
+        max_workers: int | None = None,
+    ) -> None:
         self.result_processor = self.result_processor_cls()
         self.codec = get_topic_codec(self.topic_for_codec)
 
+        if mode == "parallel":
+            self.parallel = True
+            self.parallel_executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        if max_batch_size is not None:
+            self.max_batch_size = max_batch_size
+        if max_batch_time is not None:
+            self.max_batch_time = max_batch_time
+
+    def shutdown(self) -> None:
+        if self.parallel_executor:
+            self.parallel_executor.shutdown()
+
     @property
     @abc.abstractmethod
     def topic_for_codec(self) -> Topic:
@@ -84,15 +145,66 @@ class ResultsStrategyFactory(ProcessingStrategyFactory[KafkaPayload], Generic[T,
         if result is not None:
             self.result_processor(result)
 
+    def process_batch(self, message: Message[ValuesBatch[KafkaPayload]]):
+        """
+        Receives batches of result messages. The results are grouped by their
+        subscription (preserving order), the subscriptions of the whole batch
+        are fetched at once, and each group is then processed using the thread
+        pool.
+
+        This allows results to be processed in parallel while guaranteeing
+        that results of the same subscription are never processed out of
+        order.
+        """
+        assert self.parallel_executor is not None
+
+        groups: dict[str, list[T]] = defaultdict(list)
+        for item in message.payload:
+            assert isinstance(item, BrokerValue)
+            result = self.decode_payload(item.payload)
+            if result is not None:
+                groups[self.result_processor.get_subscription_id(result)].append(result)
+
+        metrics.gauge(
+            "remote_subscriptions.result_consumer.parallel_batch_count", len(message.payload)
+        )
+        metrics.gauge("remote_subscriptions.result_consumer.parallel_batch_groups", len(groups))
+
+        subscriptions = self.result_processor.get_subscriptions(list(groups.keys()))
+
+        futures = [
+            self.parallel_executor.submit(
+                self.result_processor.process_group,
+                subscriptions.get(subscription_id),
+                results,
+            )
+            for subscription_id, results in groups.items()
+        ]
+        wait(futures)
+
     def create_serial_worker(self, commit: Commit) -> ProcessingStrategy[KafkaPayload]:
         return RunTask(
             function=self.process_single,
             next_step=CommitOffsets(commit),
         )
 
+    def create_parallel_worker(self, commit: Commit) -> ProcessingStrategy[KafkaPayload]:
+        batch_processor = RunTask(
+            function=self.process_batch,
+            next_step=CommitOffsets(commit),
+        )
+        return BatchStep(
+            max_batch_size=self.max_batch_size,
+            max_batch_time=self.max_batch_time,
+            next_step=batch_processor,
+        )
+
     def create_with_partitions(
         self,
         commit: Commit,
         partitions: Mapping[Partition, int],
     ) -> ProcessingStrategy[KafkaPayload]:
-        return self.create_serial_worker(commit)
+        if self.parallel:
+            return self.create_parallel_worker(commit)
+        else:
+            return self.create_serial_worker(commit)
@@ -82,7 +82,7 @@ instead of group deletion is:
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping, MutableMapping
+from collections.abc import Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Literal, overload
@@ -90,6 +90,7 @@ from typing import Any, Literal, overload
 import sentry_sdk
 from django.conf import settings
 from django.db import router
+from django.utils import timezone
 
 from sentry import eventstore, models, nodestore, options
 from sentry.attachments import CachedAttachment, attachment_cache
@@ -195,12 +196,75 @@ def pull_event_data(project_id: int, event_id: str) -> ReprocessableEvent:
     return ReprocessableEvent(event=event, data=data, attachments=attachments)
 
 
+def pull_event_data_bulk(
+    project_id: int, events: Sequence[Event | GroupEvent]
+) -> dict[str, ReprocessableEvent | CannotReprocess]:
+    """
+    Like `pull_event_data`, but for a page of events that was already fetched
+    from eventstore. Unprocessed payloads are read with a single nodestore
+    `get_multi` and required attachments with a single query, instead of
+    one round trip of each per event.
+
+    Returns a mapping of event ID to either the reprocessable event or the
+    reason why it cannot be reprocessed.
+    """
+    from sentry.lang.native.processing import get_required_attachment_types
+
+    if not events:
+        return {}
+
+    node_ids = {
+        event.event_id: Event.generate_node_id(project_id, event.event_id) for event in events
+    }
+    with sentry_sdk.start_span(op="reprocess_events.nodestore.get_multi"):
+        nodes = nodestore.backend.get_multi(list(node_ids.values()), subkey="unprocessed")
+
+    rv: dict[str, ReprocessableEvent | CannotReprocess] = {}
+    required_attachment_types: dict[str, set[str]] = {}
+    for event in events:
+        data = nodes.get(node_ids[event.event_id])
+        if data is None:
+            rv[event.event_id] = CannotReprocess("unprocessed_event.not_found")
+            continue
+
+        rv[event.event_id] = ReprocessableEvent(event=event, data=data, attachments=[])
+        required_types = get_required_attachment_types(data)
+        if required_types:
+            required_attachment_types[event.event_id] = required_types
+
+    if required_attachment_types:
+        with sentry_sdk.start_span(op="reprocess_events.attachments.get"):
+            attachments = EventAttachment.objects.filter(
+                project_id=project_id,
+                event_id__in=list(required_attachment_types),
+                type__in=list(set().union(*required_attachment_types.values())),
+            )
+            for attachment in attachments:
+                reprocessable_event = rv[attachment.event_id]
+                assert isinstance(reprocessable_event, ReprocessableEvent)
+                if attachment.type in required_attachment_types[attachment.event_id]:
+                    reprocessable_event.attachments.append(attachment)
+
+        for event_id, required_types in required_attachment_types.items():
+            reprocessable_event = rv[event_id]
+            assert isinstance(reprocessable_event, ReprocessableEvent)
+            if required_types - {ea.type for ea in reprocessable_event.attachments}:
+                rv[event_id] = CannotReprocess("attachment.not_found")
+
+    return rv
+
+
 def reprocess_event(project_id: int, event_id: str, start_time: float) -> None:
+    reprocessable_event = pull_event_data(project_id, event_id)
+    resubmit_reprocessable_event(reprocessable_event, start_time=start_time)
+
+
+def resubmit_reprocessable_event(
+    reprocessable_event: ReprocessableEvent, start_time: float
+) -> None:
     from sentry.ingest.consumer.processors import CACHE_TIMEOUT
     from sentry.tasks.store import preprocess_event_from_reprocessing
 
-    reprocessable_event = pull_event_data(project_id, event_id)
-
     data = reprocessable_event.data
     event = reprocessable_event.event
     attachments = reprocessable_event.attachments
@@ -237,7 +301,7 @@ def reprocess_event(project_id: int, event_id: str, start_time: float) -> None:
     preprocess_event_from_reprocessing(
         cache_key=cache_key,
         start_time=start_time,
-        event_id=event_id,
+        event_id=event.event_id,
         data=data,
     )
 
@@ -639,4 +703,14 @@ def get_progress(group_id: int, project_id: int | None = None) -> tuple[int, Any
     # progressbar in the frontend goes until max_events. Advance progressbar
     # proportionally.
     _pending = int(int(pending) * info["totalEvents"] / float(info.get("syncCount") or 1))
+
+    # Surface throughput so that slow or stuck reprocessing is visible without
+    # having to poll the pending counter over time.
+    processed = max(info["totalEvents"] - _pending, 0)
+    info = {**info, "processedEvents": processed, "eventsPerSecond": None}
+    if info.get("dateCreated"):
+        elapsed = (timezone.now() - datetime.fromisoformat(info["dateCreated"])).total_seconds()
+        if elapsed > 0:
+            info["eventsPerSecond"] = round(processed / elapsed, 2)
+
     return _pending, info
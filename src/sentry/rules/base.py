@@ -3,7 +3,7 @@ from __future__ import annotations
 import abc
 import logging
 from collections import namedtuple
-from collections.abc import Callable, MutableMapping, Sequence
+from collections.abc import Callable, Hashable, MutableMapping, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from django import forms
@@ -120,9 +120,13 @@ class EventState:
         is_new_group_environment: bool,
         has_reappeared: bool,
         has_escalated: bool,
+        attribute_cache: dict[Hashable, Any] | None = None,
     ) -> None:
         self.is_new = is_new
         self.is_regression = is_regression
         self.is_new_group_environment = is_new_group_environment
         self.has_reappeared = has_reappeared
         self.has_escalated = has_escalated
+        # Values extracted from the event by conditions and filters, shared by every rule
+        # evaluated against the same event.
+        self.attribute_cache = {} if attribute_cache is None else attribute_cache
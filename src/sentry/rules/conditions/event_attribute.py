@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -37,6 +38,31 @@ class AttributeHandler(ABC):
 attribute_registry = Registry[AttributeHandler]()
 
 
+@functools.lru_cache(maxsize=1024)
+def get_attribute_accessor(attribute: str) -> Callable[[GroupEvent], list[str]]:
+    """
+    Resolves the handler for an attribute path once, returning a function that extracts
+    the attribute's values from an event.
+    """
+    path = attribute.split(".")
+    try:
+        attr_handler = attribute_registry.get(path[0])
+    except NoRegistrationExistsError:
+        return lambda event: []
+
+    if len(path) < attr_handler.minimum_path_length:
+        return lambda event: []
+
+    def accessor(event: GroupEvent) -> list[str]:
+        try:
+            return attr_handler._handle(path, event)
+        except KeyError as e:
+            sentry_sdk.capture_exception(e)
+            return []
+
+    return accessor
+
+
 # Maps attributes to snuba columns
 ATTR_CHOICES = {
     "message": Columns.MESSAGE,
@@ -138,22 +164,13 @@ class EventAttributeCondition(EventCondition):
 
     def passes(self, event: GroupEvent, state: EventState, **kwargs: Any) -> bool:
         attr = self.get_option("attribute", "")
-        path = attr.split(".")
-
-        first_attr = path[0]
+        cache_key = ("event_attribute", attr)
         try:
-            attr_handler = attribute_registry.get(first_attr)
-        except NoRegistrationExistsError:
-            attr_handler = None
-
-        if not attr_handler:
-            attribute_values = []
-        else:
-            try:
-                attribute_values = attr_handler.handle(path, event)
-            except KeyError as e:
-                attribute_values = []
-                sentry_sdk.capture_exception(e)
+            attribute_values = state.attribute_cache[cache_key]
+        except KeyError:
+            attribute_values = state.attribute_cache[cache_key] = get_attribute_accessor(attr)(
+                event
+            )
 
         return self._passes(attribute_values)
 
@@ -233,10 +250,8 @@ class ExtraAttributeHandler(AttributeHandler):
 
     @classmethod
     def _handle(cls, path: list[str], event: GroupEvent) -> list[str]:
-        path.pop(0)
         value = event.data.get("extra", {})
-        while path:
-            bit = path.pop(0)
+        for bit in path[1:]:
             value = value.get(bit)
             if not value:
                 return []
@@ -15,6 +15,14 @@ from sentry.snuba.events import Columns
 from sentry.types.condition_activity import ConditionActivity
 
 
+def normalize_tags(raw_tags: Sequence[tuple[str, Any]]) -> list[tuple[str, str, Any]]:
+    """
+    Resolves the lower cased and standardized key of every tag once, so that they can be
+    matched against any number of conditions.
+    """
+    return [(k.lower(), tagstore.backend.get_standardized_key(k), v) for k, v in raw_tags]
+
+
 class TaggedEventForm(forms.Form):
     key = forms.CharField(widget=forms.TextInput())
     match = forms.ChoiceField(choices=list(MATCH_CHOICES.items()), widget=forms.Select())
@@ -46,6 +54,9 @@ class TaggedEventCondition(EventCondition):
     }
 
     def _passes(self, raw_tags: Sequence[tuple[str, Any]]) -> bool:
+        return self._passes_normalized(normalize_tags(raw_tags))
+
+    def _passes_normalized(self, tags: Sequence[tuple[str, str, Any]]) -> bool:
         option_key = self.get_option("key")
         option_match = self.get_option("match")
         option_value = self.get_option("value")
@@ -55,21 +66,12 @@ class TaggedEventCondition(EventCondition):
 
         option_key = option_key.lower()
 
-        tag_keys = (
-            k
-            for gen in (
-                (k.lower() for k, v in raw_tags),
-                (tagstore.backend.get_standardized_key(k) for k, v in raw_tags),
-            )
-            for k in gen
-        )
-
         # NOTE: IS_SET condition differs btw tagged_event and event_attribute so not handled by match_values
         if option_match == MatchType.IS_SET:
-            return option_key in tag_keys
+            return any(option_key in (k, standardized_k) for k, standardized_k, v in tags)
 
         elif option_match == MatchType.NOT_SET:
-            return option_key not in tag_keys
+            return not any(option_key in (k, standardized_k) for k, standardized_k, v in tags)
 
         if not option_value:
             return False
@@ -79,9 +81,7 @@ class TaggedEventCondition(EventCondition):
         # This represents the fetched tag values given the provided key
         # so eg. if the key is 'environment' and the tag_value is 'production'
         tag_values = (
-            v.lower()
-            for k, v in raw_tags
-            if k.lower() == option_key or tagstore.backend.get_standardized_key(k) == option_key
+            v.lower() for k, standardized_k, v in tags if option_key in (k, standardized_k)
         )
 
         return match_values(
@@ -89,7 +89,11 @@ class TaggedEventCondition(EventCondition):
         )
 
     def passes(self, event: GroupEvent, state: EventState, **kwargs: Any) -> bool:
-        return self._passes(event.tags)
+        try:
+            tags = state.attribute_cache["tagged_event"]
+        except KeyError:
+            tags = state.attribute_cache["tagged_event"] = normalize_tags(event.tags)
+        return self._passes_normalized(tags)
 
     def passes_activity(
         self, condition_activity: ConditionActivity, event_map: dict[str, Any]
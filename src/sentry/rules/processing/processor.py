@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import uuid
-from collections.abc import Callable, Collection, Mapping, MutableMapping, Sequence
+from collections.abc import Callable, Collection, Hashable, Mapping, MutableMapping, Sequence
 from datetime import timedelta
 from random import randrange
 from typing import Any
@@ -204,6 +204,8 @@ class RuleProcessor:
         self.grouped_futures: MutableMapping[
             str, tuple[Callable[[GroupEvent, Sequence[RuleFuture]], None], list[RuleFuture]]
         ] = {}
+        # Shared by the states of all rules, so that each value is extracted from the event once
+        self.attribute_cache: dict[Hashable, Any] = {}
 
     def get_rules(self) -> Sequence[Rule]:
         """Get all of the rules for this project from the DB (or cache)."""
@@ -234,6 +236,7 @@ class RuleProcessor:
             is_new_group_environment=self.is_new_group_environment,
             has_reappeared=self.has_reappeared,
             has_escalated=self.has_escalated,
+            attribute_cache=self.attribute_cache,
         )
 
     def group_conditions_by_speed(
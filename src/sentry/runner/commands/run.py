@@ -246,14 +246,46 @@ def worker(ignore_unknown_queues: bool, **options: Any) -> None:
 @click.option(
     "--namespace", help="The dedicated task namespace that taskworker operates on", default=None
 )
+@click.option(
+    "--concurrency",
+    help="Number of child processes executing tasks at the same time",
+    default=1,
+    type=int,
+)
+@click.option(
+    "--prefetch",
+    help="Number of task activations fetched ahead of time when concurrency is above 1",
+    default=0,
+    type=int,
+)
+@click.option(
+    "--io-threads",
+    help="Number of threads executing I/O bound tasks in a separate child process",
+    default=0,
+    type=int,
+)
 @log_options()
 @configuration
-def taskworker(rpc_host: str, max_task_count: int, namespace: str | None, **options: Any) -> None:
+def taskworker(
+    rpc_host: str,
+    max_task_count: int,
+    namespace: str | None,
+    concurrency: int,
+    prefetch: int,
+    io_threads: int,
+    **options: Any,
+) -> None:
     from sentry.taskworker.worker import TaskWorker
 
     with managed_bgtasks(role="taskworker"):
         worker = TaskWorker(
-            rpc_host=rpc_host, max_task_count=max_task_count, namespace=namespace, **options
+            rpc_host=rpc_host,
+            max_task_count=max_task_count,
+            namespace=namespace,
+            concurrency=concurrency,
+            prefetch=prefetch,
+            io_threads=io_threads,
+            **options,
         )
         exitcode = worker.start()
         raise SystemExit(exitcode)
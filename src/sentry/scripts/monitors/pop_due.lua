@@ -0,0 +1,18 @@
+-- Remove and return up to a limit of the members of a sorted set that are
+-- scored at or below a maximum score, in a single step.
+assert(#KEYS == 1, "provide exactly one sorted set key")
+assert(#ARGV == 2, "provide a maximum score and a limit")
+
+local key = KEYS[1]
+local max_score = ARGV[1]
+local limit = tonumber(ARGV[2])
+
+local members = redis.call("ZRANGEBYSCORE", key, "-inf", max_score, "LIMIT", 0, limit)
+
+-- Remove in batches, unpacking too many members at once exceeds the Lua stack
+local batch_size = 1000
+for i = 1, #members, batch_size do
+    redis.call("ZREM", key, unpack(members, i, math.min(i + batch_size - 1, #members)))
+end
+
+return members
@@ -1585,20 +1585,28 @@ class BaseQueryBuilder:
                         if field_key not in field_meta:
                             field_meta[field_key] = "string"
 
-            # process the field results
+            # process the field results, every row has the same columns so each column is only
+            # resolved once
+            resolved_columns: dict[str, tuple[str, Callable[[Any], Any] | None]] = {}
+
+            def resolve_column(key: str) -> tuple[str, Callable[[Any], Any] | None]:
+                resolved_key = translated_columns.get(key, key)
+                if not self.builder_config.skip_tag_resolution:
+                    resolved_key = self.prefixed_to_tag_map.get(resolved_key, resolved_key)
+                return resolved_key, self.value_resolver_map.get(key)
+
             def get_row(row: dict[str, Any]) -> dict[str, Any]:
                 transformed = {}
                 for key, value in row.items():
+                    resolved = resolved_columns.get(key)
+                    if resolved is None:
+                        resolved = resolved_columns[key] = resolve_column(key)
+                    resolved_key, value_resolver = resolved
+
                     value = process_value(value)
-                    if key in self.value_resolver_map:
-                        new_value = self.value_resolver_map[key](value)
-                    else:
-                        new_value = value
-
-                    resolved_key = translated_columns.get(key, key)
-                    if not self.builder_config.skip_tag_resolution:
-                        resolved_key = self.prefixed_to_tag_map.get(resolved_key, resolved_key)
-                    transformed[resolved_key] = new_value
+                    if value_resolver is not None:
+                        value = value_resolver(value)
+                    transformed[resolved_key] = value
 
                 return transformed
 
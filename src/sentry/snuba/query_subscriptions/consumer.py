@@ -1,5 +1,6 @@
 import logging
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Callable, Sequence
 from datetime import timezone
 
 import sentry_sdk
@@ -17,7 +18,25 @@ from sentry.utils import metrics
 logger = logging.getLogger(__name__)
 TQuerySubscriptionCallable = Callable[[QuerySubscriptionUpdate, QuerySubscription], None]
 
+TQuerySubscriptionBatchCallable = Callable[
+    [Sequence[tuple[QuerySubscriptionUpdate, QuerySubscription]]], None
+]
+
 subscriber_registry: dict[str, TQuerySubscriptionCallable] = {}
+batch_subscriber_registry: dict[str, TQuerySubscriptionBatchCallable] = {}
+
+
+class BatchPartiallyHandledError(Exception):
+    """
+    Raised by batch callbacks that fail after they already handled some of the updates, so that
+    only the updates that weren't handled yet are passed to the regular subscriber.
+    """
+
+    def __init__(
+        self, unhandled: Sequence[tuple[QuerySubscriptionUpdate, QuerySubscription]]
+    ) -> None:
+        super().__init__(f"{len(unhandled)} updates of the batch weren't handled")
+        self.unhandled = unhandled
 
 
 def register_subscriber(
@@ -32,6 +51,24 @@ def register_subscriber(
     return inner
 
 
+def register_batch_subscriber(
+    subscriber_key: str,
+) -> Callable[[TQuerySubscriptionBatchCallable], TQuerySubscriptionBatchCallable]:
+    """
+    Registers a callback that receives all updates for the subscription type from a batch of
+    messages, used when the consumer runs in batched mode. A regular subscriber must be
+    registered for the type as well.
+    """
+
+    def inner(func: TQuerySubscriptionBatchCallable) -> TQuerySubscriptionBatchCallable:
+        if subscriber_key in batch_subscriber_registry:
+            raise Exception("Batch handler already registered for %s" % subscriber_key)
+        batch_subscriber_registry[subscriber_key] = func
+        return func
+
+    return inner
+
+
 def parse_message_value(
     value: bytes, jsoncodec: Codec[SubscriptionResult]
 ) -> QuerySubscriptionUpdate:
@@ -61,6 +98,97 @@ def parse_message_value(
     }
 
 
+def _parse_message(
+    message_value: bytes,
+    message_offset: int,
+    message_partition: int,
+    dataset: str,
+    jsoncodec: Codec[SubscriptionResult],
+) -> QuerySubscriptionUpdate | None:
+    try:
+        with metrics.timer("snuba_query_subscriber.parse_message_value", tags={"dataset": dataset}):
+            return parse_message_value(message_value, jsoncodec)
+    except InvalidMessageError:
+        # If the message is in an invalid format, just log the error
+        # and continue
+        logger.exception(
+            "Subscription update could not be parsed",
+            extra={
+                "offset": message_offset,
+                "partition": message_partition,
+                "value": message_value,
+            },
+        )
+        return None
+
+
+def _check_subscription(
+    contents: QuerySubscriptionUpdate,
+    subscription: QuerySubscription | None,
+    message_value: bytes,
+    message_offset: int,
+    message_partition: int,
+    topic: str,
+    dataset: str,
+) -> bool:
+    """
+    Returns whether the update should be passed to the callback of the subscription. Cleans up
+    the subscription in snuba if it no longer exists.
+    """
+    if subscription is None:
+        metrics.incr("snuba_query_subscriber.subscription_doesnt_exist", tags={"dataset": dataset})
+        logger.warning(
+            "Received subscription update, but subscription does not exist",
+            extra={
+                "offset": message_offset,
+                "partition": message_partition,
+                "value": message_value,
+            },
+        )
+        try:
+            if topic in topic_to_dataset:
+                _delete_from_snuba(
+                    topic_to_dataset[topic],
+                    contents["subscription_id"],
+                    EntityKey(contents["entity"]),
+                )
+            else:
+                logger.exception(
+                    "Topic not registered with QuerySubscriptionConsumer, can't remove "
+                    "non-existent subscription from Snuba",
+                    extra={"topic": topic, "subscription_id": contents["subscription_id"]},
+                )
+        except InvalidMessageError as e:
+            logger.exception(str(e))
+        except Exception:
+            logger.exception("Failed to delete unused subscription from snuba.")
+        return False
+
+    if subscription.status != QuerySubscription.Status.ACTIVE.value:
+        metrics.incr("snuba_query_subscriber.subscription_inactive")
+        return False
+
+    if subscription.snuba_query is None:
+        metrics.incr("snuba_query_subscriber.subscription_snuba_query_missing")
+        return False
+
+    if subscription.type not in subscriber_registry:
+        metrics.incr(
+            "snuba_query_subscriber.subscription_type_not_registered", tags={"dataset": dataset}
+        )
+        logger.error(
+            "Received subscription update, but no subscription handler registered",
+            extra={
+                "offset": message_offset,
+                "partition": message_partition,
+                "value": message_value,
+            },
+        )
+        return False
+
+    return True
+
+
 def handle_message(
     message_value: bytes,
     message_offset: int,
@@ -77,25 +205,14 @@ def handle_message(
     :return:
     """
     with sentry_sdk.isolation_scope() as scope:
-        try:
-            with metrics.timer(
-                "snuba_query_subscriber.parse_message_value", tags={"dataset": dataset}
-            ):
-                contents = parse_message_value(message_value, jsoncodec)
-        except InvalidMessageError:
-            # If the message is in an invalid format, just log the error
-            # and continue
-            logger.exception(
-                "Subscription update could not be parsed",
-                extra={
-                    "offset": message_offset,
-                    "partition": message_partition,
-                    "value": message_value,
-                },
-            )
+        contents = _parse_message(
+            message_value, message_offset, message_partition, dataset, jsoncodec
+        )
+        if contents is None:
             return
         scope.set_tag("query_subscription_id", contents["subscription_id"])
 
+        subscription: QuerySubscription | None
         try:
             with metrics.timer(
                 "snuba_query_subscriber.fetch_subscription", tags={"dataset": dataset}
@@ -103,57 +220,20 @@ def handle_message(
                 subscription = QuerySubscription.objects.get_from_cache(
                     subscription_id=contents["subscription_id"]
                 )
-                if subscription.status != QuerySubscription.Status.ACTIVE.value:
-                    metrics.incr("snuba_query_subscriber.subscription_inactive")
-                    return
         except QuerySubscription.DoesNotExist:
-            metrics.incr(
-                "snuba_query_subscriber.subscription_doesnt_exist", tags={"dataset": dataset}
-            )
-            logger.warning(
-                "Received subscription update, but subscription does not exist",
-                extra={
-                    "offset": message_offset,
-                    "partition": message_partition,
-                    "value": message_value,
-                },
-            )
-            try:
-                if topic in topic_to_dataset:
-                    _delete_from_snuba(
-                        topic_to_dataset[topic],
-                        contents["subscription_id"],
-                        EntityKey(contents["entity"]),
-                    )
-                else:
-                    logger.exception(
-                        "Topic not registered with QuerySubscriptionConsumer, can't remove "
-                        "non-existent subscription from Snuba",
-                        extra={"topic": topic, "subscription_id": contents["subscription_id"]},
-                    )
-            except InvalidMessageError as e:
-                logger.exception(str(e))
-            except Exception:
-                logger.exception("Failed to delete unused subscription from snuba.")
-            return
+            subscription = None
 
-        if subscription.snuba_query is None:
-            metrics.incr("snuba_query_subscriber.subscription_snuba_query_missing")
-            return
-
-        if subscription.type not in subscriber_registry:
-            metrics.incr(
-                "snuba_query_subscriber.subscription_type_not_registered", tags={"dataset": dataset}
-            )
-            logger.error(
-                "Received subscription update, but no subscription handler registered",
-                extra={
-                    "offset": message_offset,
-                    "partition": message_partition,
-                    "value": message_value,
-                },
-            )
+        if not _check_subscription(
+            contents,
+            subscription,
+            message_value,
+            message_offset,
+            message_partition,
+            topic,
+            dataset,
+        ):
             return
+        assert subscription is not None
 
         sentry_sdk.set_tag("project_id", subscription.project_id)
         sentry_sdk.set_tag("query_subscription_id", contents["subscription_id"])
@@ -180,6 +260,96 @@ def handle_message(
             callback(contents, subscription)
 
 
+def handle_message_batch(
+    messages: Sequence[tuple[bytes, int, int]],
+    topic: str,
+    dataset: str,
+    jsoncodec: Codec[SubscriptionResult],
+) -> None:
+    """
+    Parses a batch of `(value, offset, partition)` messages from Kafka and passes the payloads
+    to the callbacks defined by their subscriptions, like `handle_message`. Subscriptions are
+    fetched together, and subscription types with a batch callback registered receive all of
+    their updates from the batch in a single call, in the order they were received.
+    """
+    parsed: list[tuple[QuerySubscriptionUpdate, bytes, int, int]] = []
+    for message_value, message_offset, message_partition in messages:
+        contents = _parse_message(
+            message_value, message_offset, message_partition, dataset, jsoncodec
+        )
+        if contents is not None:
+            parsed.append((contents, message_value, message_offset, message_partition))
+
+    with metrics.timer("snuba_query_subscriber.fetch_subscriptions", tags={"dataset": dataset}):
+        subscriptions = {
+            subscription.subscription_id: subscription
+            for subscription in QuerySubscription.objects.get_many_from_cache(
+                list({contents["subscription_id"] for contents, *_ in parsed}),
+                key="subscription_id",
+            )
+        }
+
+    updates_by_type: dict[str, list[tuple[QuerySubscriptionUpdate, QuerySubscription]]] = (
+        defaultdict(list)
+    )
+    for contents, message_value, message_offset, message_partition in parsed:
+        subscription = subscriptions.get(contents["subscription_id"])
+        if not _check_subscription(
+            contents,
+            subscription,
+            message_value,
+            message_offset,
+            message_partition,
+            topic,
+            dataset,
+        ):
+            continue
+        assert subscription is not None
+        updates_by_type[subscription.type].append((contents, subscription))
+
+    for subscription_type, updates in updates_by_type.items():
+        batch_callback = batch_subscriber_registry.get(subscription_type)
+        if batch_callback is not None:
+            try:
+                with metrics.timer(
+                    "snuba_query_subscriber.batch_callback.duration",
+                    instance=subscription_type,
+                    tags={"dataset": dataset},
+                ):
+                    batch_callback(updates)
+                continue
+            except Exception as e:
+                # Fall back to handling the updates one by one below, so that a single failure
+                # doesn't drop every update of the batch. Updates the callback already handled
+                # aren't handled again.
+                if isinstance(e, BatchPartiallyHandledError):
+                    updates = list(e.unhandled)
+                logger.exception(
+                    "Unexpected error while handling subscription update batch",
+                    extra={"subscription_type": subscription_type, "count": len(updates)},
+                )
+                metrics.incr(
+                    "snuba_query_subscriber.batch_callback.fallback",
+                    tags={"dataset": dataset, "subscription_type": subscription_type},
+                )
+
+        callback = subscriber_registry[subscription_type]
+        for contents, subscription in updates:
+            try:
+                with metrics.timer(
+                    "snuba_query_subscriber.callback.duration",
+                    instance=subscription_type,
+                    tags={"dataset": dataset},
+                ):
+                    callback(contents, subscription)
+            except Exception:
+                # Don't let a single update fail the rest of the batch
+                logger.exception(
+                    "Unexpected error while handling subscription update",
+                    extra={"subscription_id": contents["subscription_id"]},
+                )
+
+
 class InvalidMessageError(Exception):
     pass
 
@@ -1,15 +1,18 @@
 import logging
 from collections.abc import Mapping
 from functools import partial
+from typing import Literal
 
 import sentry_sdk
 from arroyo.backends.kafka.consumer import KafkaPayload
 from arroyo.processing.strategies import (
+    BatchStep,
     CommitOffsets,
     ProcessingStrategy,
     ProcessingStrategyFactory,
     RunTask,
 )
+from arroyo.processing.strategies.batching import ValuesBatch
 from arroyo.types import BrokerValue, Commit, Message, Partition
 from sentry_kafka_schemas import get_codec
 
@@ -33,6 +36,7 @@ class QuerySubscriptionStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         input_block_size: int | None,
         output_block_size: int | None,
         multi_proc: bool = True,
+        mode: Literal["serial", "batched"] = "serial",
     ):
         self.dataset = Dataset(dataset)
         self.logical_topic = dataset_to_logical_topic[self.dataset]
@@ -42,15 +46,29 @@ class QuerySubscriptionStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         self.input_block_size = input_block_size
         self.output_block_size = output_block_size
         self.multi_proc = multi_proc
-        self.pool = MultiprocessingPool(num_processes)
+        self.mode = mode
+        # The batched mode processes messages in the consumer process
+        self.pool = MultiprocessingPool(num_processes) if mode != "batched" else None
 
     def create_with_partitions(
         self,
         commit: Commit,
         partitions: Mapping[Partition, int],
     ) -> ProcessingStrategy[KafkaPayload]:
+        if self.mode == "batched":
+            batch_processor = RunTask(
+                function=partial(process_batch, self.dataset, self.topic, self.logical_topic),
+                next_step=CommitOffsets(commit),
+            )
+            return BatchStep(
+                max_batch_size=self.max_batch_size,
+                max_batch_time=self.max_batch_time,
+                next_step=batch_processor,
+            )
+
         callable = partial(process_message, self.dataset, self.topic, self.logical_topic)
         if self.multi_proc:
+            assert self.pool is not None
             return run_task_with_multiprocessing(
                 function=callable,
                 next_step=CommitOffsets(commit),
@@ -64,7 +82,8 @@ class QuerySubscriptionStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
             return RunTask(callable, CommitOffsets(commit))
 
     def shutdown(self) -> None:
-        self.pool.close()
+        if self.pool is not None:
+            self.pool.close()
 
 
 def process_message(
@@ -107,3 +126,39 @@ def process_message(
                     "value": message_value,
                 },
             )
+
+
+def process_batch(
+    dataset: Dataset,
+    topic: str,
+    logical_topic: str,
+    message: Message[ValuesBatch[KafkaPayload]],
+) -> None:
+    from sentry.snuba.query_subscriptions.consumer import handle_message_batch
+    from sentry.utils import metrics
+
+    messages = []
+    for item in message.payload:
+        assert isinstance(item, BrokerValue)
+        messages.append((item.payload.value, item.offset, item.partition.index))
+
+    with (
+        sentry_sdk.start_transaction(
+            op="handle_message_batch",
+            name="query_subscription_consumer_process_batch",
+            custom_sampling_context={"sample_rate": options.get("subscriptions-query.sample-rate")},
+        ),
+        metrics.timer(
+            "snuba_query_subscriber.handle_message_batch", tags={"dataset": dataset.value}
+        ),
+    ):
+        try:
+            handle_message_batch(messages, topic, dataset.value, get_codec(logical_topic))
+        except Exception:
+            # This is a failsafe to make sure that no batch will block this consumer. If we see
+            # errors occurring here they need to be investigated to make sure that we're not
+            # dropping legitimate messages.
+            logger.exception(
+                "Unexpected error while handling batch in QuerySubscriptionStrategy. Skipping batch.",
+                extra={"count": len(messages)},
+            )
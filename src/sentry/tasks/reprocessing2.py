@@ -41,9 +41,12 @@ def reprocess_group(
 
     from sentry.reprocessing2 import (
         CannotReprocess,
+        ReprocessableEvent,
         buffered_handle_remaining_events,
         logger,
+        pull_event_data_bulk,
         reprocess_event,
+        resubmit_reprocessable_event,
         start_group_reprocessing,
     )
 
@@ -90,15 +93,31 @@ def reprocess_group(
 
     remaining_event_ids = []
 
+    pulled_events: dict[str, ReprocessableEvent | CannotReprocess] = {}
+    if max_events is None or max_events > 0:
+        with sentry_sdk.start_span(op="pull_event_data_bulk"):
+            try:
+                pulled_events = pull_event_data_bulk(project_id, events)
+            except Exception:
+                sentry_sdk.capture_exception()
+
     for event in events:
         if max_events is None or max_events > 0:
             with sentry_sdk.start_span(op="reprocess_event"):
                 try:
-                    reprocess_event(
-                        project_id=project_id,
-                        event_id=event.event_id,
-                        start_time=start_time,
-                    )
+                    reprocessable_event = pulled_events.get(event.event_id)
+                    if reprocessable_event is None:
+                        # Fall back to fetching the event individually if the
+                        # bulk fetch did not return it.
+                        reprocess_event(
+                            project_id=project_id,
+                            event_id=event.event_id,
+                            start_time=start_time,
+                        )
+                    elif isinstance(reprocessable_event, CannotReprocess):
+                        raise reprocessable_event
+                    else:
+                        resubmit_reprocessable_event(reprocessable_event, start_time=start_time)
                 except CannotReprocess as e:
                     logger.error("reprocessing2.%s", str(e))
                 except Exception:
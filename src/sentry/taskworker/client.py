@@ -44,12 +44,16 @@ class TaskworkerClient:
         return None
 
     def update_task(
-        self, task_id: str, status: TaskActivationStatus.ValueType, fetch_next_task: FetchNextTask
+        self,
+        task_id: str,
+        status: TaskActivationStatus.ValueType,
+        fetch_next_task: FetchNextTask | None,
     ) -> TaskActivation | None:
         """
         Update the status for a given task activation.
 
-        The return value is the next task that should be executed.
+        The return value is the next task that should be executed, if
+        `fetch_next_task` was provided.
         """
         request = SetTaskStatusRequest(
             id=task_id,
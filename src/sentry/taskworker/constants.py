@@ -1,5 +1,24 @@
+from enum import StrEnum
+
 DEFAULT_PROCESSING_DEADLINE = 5
 """
 The fallback/default processing_deadline that tasks
 will use if neither the TaskNamespace or Task define a deadline
 """
+
+
+class ExecutionClass(StrEnum):
+    """
+    How a task spends its time, which determines where a worker executes it.
+    """
+
+    CPU = "cpu"
+    """
+    Tasks are executed one at a time per worker slot, each in its own child process.
+    """
+
+    IO = "io"
+    """
+    Tasks mostly wait on the network. Workers with I/O threads execute them on a
+    thread pool inside a shared child process.
+    """
@@ -12,7 +12,7 @@ from django.conf import settings
 from sentry_protos.sentry.v1.taskworker_pb2 import TaskActivation
 
 from sentry.conf.types.kafka_definition import Topic
-from sentry.taskworker.constants import DEFAULT_PROCESSING_DEADLINE
+from sentry.taskworker.constants import DEFAULT_PROCESSING_DEADLINE, ExecutionClass
 from sentry.taskworker.retry import Retry
 from sentry.taskworker.router import TaskRouter
 from sentry.taskworker.task import P, R, Task
@@ -37,12 +37,17 @@ class TaskNamespace:
         retry: Retry | None,
         expires: int | datetime.timedelta | None = None,
         processing_deadline_duration: int = DEFAULT_PROCESSING_DEADLINE,
+        execution_class: ExecutionClass = ExecutionClass.CPU,
+        io_concurrency: int | None = None,
     ):
         self.name = name
         self.topic = topic
         self.default_retry = retry
         self.default_expires = expires  # seconds
         self.default_processing_deadline_duration = processing_deadline_duration  # seconds
+        self.default_execution_class = execution_class
+        # Maximum number of I/O tasks of the namespace a worker executes at once
+        self.io_concurrency = io_concurrency
         self._registered_tasks: dict[str, Task[Any, Any]] = {}
         self._producer: KafkaProducer | None = None
 
@@ -80,6 +85,7 @@ class TaskNamespace:
         expires: int | datetime.timedelta | None = None,
         processing_deadline_duration: int | datetime.timedelta | None = None,
         at_most_once: bool = False,
+        execution_class: ExecutionClass | None = None,
     ) -> Callable[[Callable[P, R]], Task[P, R]]:
         """
         Register a task.
@@ -102,6 +108,9 @@ class TaskNamespace:
             Enable at-most-once execution. Tasks with `at_most_once` cannot
             define retry policies, and use a worker side idempotency key to
             prevent processing deadline based retries.
+        execution_class : ExecutionClass | None
+            Whether the task is CPU or I/O bound. I/O bound tasks can be executed
+            concurrently on threads by workers. If none the namespace default is used.
         """
 
         def wrapped(func: Callable[P, R]) -> Task[P, R]:
@@ -118,6 +127,7 @@ class TaskNamespace:
                     processing_deadline_duration or self.default_processing_deadline_duration
                 ),
                 at_most_once=at_most_once,
+                execution_class=execution_class or self.default_execution_class,
             )
             # TODO(taskworker) tasks should be registered into the registry
             # so that we can ensure task names are globally unique
@@ -175,6 +185,8 @@ class TaskRegistry:
         retry: Retry | None = None,
         expires: int | datetime.timedelta | None = None,
         processing_deadline_duration: int = DEFAULT_PROCESSING_DEADLINE,
+        execution_class: ExecutionClass = ExecutionClass.CPU,
+        io_concurrency: int | None = None,
     ) -> TaskNamespace:
         """
         Create a namespaces.
@@ -182,7 +194,9 @@ class TaskRegistry:
         Namespaces are mapped onto topics through the configured router allowing
         infrastructure to be scaled based on a region's requirements.
 
-        Namespaces can define default behavior for tasks defined within a namespace.
+        Namespaces can define default behavior for tasks defined within a namespace,
+        and limit how many of their I/O tasks a worker executes at once with
+        `io_concurrency`.
         """
         topic = self._router.route_namespace(name)
         namespace = TaskNamespace(
@@ -191,6 +205,8 @@ class TaskRegistry:
             retry=retry,
             expires=expires,
             processing_deadline_duration=processing_deadline_duration,
+            execution_class=execution_class,
+            io_concurrency=io_concurrency,
         )
         self._namespaces[name] = namespace
 
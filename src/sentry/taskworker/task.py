@@ -13,7 +13,7 @@ from django.utils import timezone
 from google.protobuf.timestamp_pb2 import Timestamp
 from sentry_protos.sentry.v1.taskworker_pb2 import RetryState, TaskActivation
 
-from sentry.taskworker.constants import DEFAULT_PROCESSING_DEADLINE
+from sentry.taskworker.constants import DEFAULT_PROCESSING_DEADLINE, ExecutionClass
 from sentry.taskworker.retry import Retry
 
 if TYPE_CHECKING:
@@ -34,6 +34,7 @@ class Task(Generic[P, R]):
         expires: int | datetime.timedelta | None = None,
         processing_deadline_duration: int | datetime.timedelta | None = None,
         at_most_once: bool = False,
+        execution_class: ExecutionClass = ExecutionClass.CPU,
     ):
         self.name = name
         self._func = func
@@ -52,6 +53,7 @@ class Task(Generic[P, R]):
             )
         self._retry = retry
         self.at_most_once = at_most_once
+        self.execution_class = execution_class
         update_wrapper(self, func)
 
     @property
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import dataclasses
 import logging
 import multiprocessing
+import pickle
+import queue
 import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing.context import TimeoutError
-from multiprocessing.pool import Pool
+from multiprocessing.pool import AsyncResult, Pool
+from multiprocessing.process import BaseProcess
+from multiprocessing.queues import Queue
 from typing import Any
 from uuid import uuid4
 
@@ -19,10 +26,13 @@ from sentry_protos.sentry.v1.taskworker_pb2 import (
     TASK_ACTIVATION_STATUS_RETRY,
     FetchNextTask,
     TaskActivation,
+    TaskActivationStatus,
 )
 
 from sentry.taskworker.client import TaskworkerClient
+from sentry.taskworker.constants import ExecutionClass
 from sentry.taskworker.registry import taskregistry
+from sentry.taskworker.retry import RetryError
 from sentry.taskworker.task import Task
 from sentry.utils import metrics
 
@@ -48,6 +58,38 @@ def _process_activation(activation: TaskActivation) -> None:
         taskregistry.get(activation.namespace).get(activation.taskname)(*args, **kwargs)
 
 
+def _process_io_activations(
+    activations: Queue[TaskActivation | None],
+    results: Queue[tuple[str, Exception | None]],
+    threads: int,
+) -> None:
+    """
+    Main loop of the child process of an I/O slot. Activations are executed
+    on a thread pool and `(activation_id, error)` is reported once each of them
+    completes, with `error` being None on success.
+    """
+
+    def run(activation: TaskActivation) -> None:
+        error: Exception | None = None
+        try:
+            _process_activation(activation)
+        except Exception as err:
+            error = err
+            try:
+                pickle.dumps(error)
+            except Exception:
+                # The error has to be sent back to the worker
+                error = Exception(repr(err))
+        results.put((activation.id, error))
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        while True:
+            activation = activations.get()
+            if activation is None:
+                return
+            executor.submit(run, activation)
+
+
 AT_MOST_ONCE_TIMEOUT = 60 * 60 * 24  # 1 day
 
 
@@ -56,6 +98,64 @@ def get_at_most_once_key(namespace: str, taskname: str, task_id: str) -> str:
     return f"tw:amo:{namespace}:{taskname}:{task_id}"
 
 
+# Bounds for how long a concurrent worker waits before polling again when it
+# made no progress. The interval doubles while the worker stays idle.
+POLL_INTERVAL_MIN = 0.01
+POLL_INTERVAL_MAX = 1.0
+# Upper bound of the poll interval while tasks are executing, so that
+# completed tasks are reported promptly.
+BUSY_POLL_INTERVAL_MAX = 0.1
+
+
+@dataclasses.dataclass
+class _WorkerSlot:
+    """
+    A child process of a concurrent worker, executing one activation at a time.
+    Each slot has its own pool so that a task timing out only kills its own
+    process.
+    """
+
+    pool: Pool
+    activation: TaskActivation | None = None
+    result: AsyncResult[None] | None = None
+    start_time: float = 0.0
+    deadline: float = 0.0
+
+
+@dataclasses.dataclass
+class _IoSlot:
+    """
+    A child process of a concurrent worker that executes I/O bound activations
+    on a thread pool. Threads can't be interrupted, so when an activation
+    exceeds its processing deadline the whole process is replaced.
+    """
+
+    process: BaseProcess
+    activations: Queue[TaskActivation | None]
+    results: Queue[tuple[str, Exception | None]]
+    # Executing activations by id, along with the time they were started at
+    # and their processing deadline
+    running: dict[str, tuple[TaskActivation, float, float]] = dataclasses.field(
+        default_factory=dict
+    )
+
+
+@dataclasses.dataclass
+class _BufferedActivation:
+    """
+    An activation waiting in the buffer of a concurrent worker. The RPC host
+    starts its processing deadline as soon as it is fetched, so the deadline
+    is tracked from that point rather than from when it starts executing.
+    """
+
+    activation: TaskActivation
+    fetched_at: float = dataclasses.field(default_factory=time.time)
+
+    @property
+    def deadline(self) -> float:
+        return self.fetched_at + self.activation.processing_deadline_duration
+
+
 class TaskWorker:
     """
     A TaskWorker fetches tasks from a taskworker RPC host and handles executing task activations.
@@ -65,6 +165,12 @@ class TaskWorker:
     will be fetched.
 
     Taskworkers can be run with `sentry run taskworker`
+
+    With a `concurrency` above 1 the worker executes that many activations at
+    once, each in its own child process, and keeps up to `prefetch` further
+    activations buffered so that a slot becoming free doesn't have to wait for
+    a round trip to the RPC host. With `io_threads` I/O bound tasks are
+    executed separately on that many threads of another child process.
     """
 
     def __init__(
@@ -72,6 +178,9 @@ class TaskWorker:
         rpc_host: str,
         max_task_count: int | None = None,
         namespace: str | None = None,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        io_threads: int = 0,
         **options: dict[str, Any],
     ) -> None:
         self.options = options
@@ -79,15 +188,39 @@ class TaskWorker:
         self._worker_id = uuid4().hex
         self._max_task_count = max_task_count
         self._namespace = namespace
+        self._concurrency = concurrency
+        self._prefetch = prefetch
+        self._io_threads = io_threads
+        self._concurrent = concurrency > 1 or io_threads > 0
+        self._poll_interval = POLL_INTERVAL_MIN
+        # Number of buffered activations waiting for their namespace's
+        # io_concurrency, as of the last dispatch
+        self._held_back = 0
         self.client = TaskworkerClient(rpc_host)
         self._pool: Pool | None = None
+        self._slots: list[_WorkerSlot] = []
+        self._io_slot: _IoSlot | None = None
         self._build_pool()
 
     def __del__(self) -> None:
         if self._pool:
             self._pool.terminate()
+        for slot in self._slots:
+            slot.pool.terminate()
+        if self._io_slot:
+            self._io_slot.process.terminate()
 
     def _build_pool(self) -> None:
+        if self._concurrent:
+            for slot in self._slots:
+                slot.pool.terminate()
+            self._slots = [
+                _WorkerSlot(pool=mp_context.Pool(processes=1)) for _ in range(self._concurrency)
+            ]
+            if self._io_threads:
+                self._build_io_slot()
+            return
+
         if self._pool:
             self._pool.terminate()
         self._pool = mp_context.Pool(processes=1)
@@ -105,6 +238,9 @@ class TaskWorker:
         completes its max_task_count when it shuts down.
         """
         self.do_imports()
+        if self._concurrent:
+            return self._start_concurrent()
+
         next_task: TaskActivation | None = None
         task: TaskActivation | None = None
         try:
@@ -175,31 +311,12 @@ class TaskWorker:
         assert self._pool
         task = self._get_known_task(activation)
         if not task:
-            metrics.incr(
-                "taskworker.worker.unknown_task",
-                tags={"namespace": activation.namespace, "taskname": activation.taskname},
-            )
-            self._execution_count += 1
-            return self.client.update_task(
-                task_id=activation.id,
-                status=TASK_ACTIVATION_STATUS_FAILURE,
-                fetch_next_task=FetchNextTask(namespace=self._namespace),
-            )
+            return self._fail_unknown_task(activation, FetchNextTask(namespace=self._namespace))
 
-        if task.at_most_once:
-            key = get_at_most_once_key(activation.namespace, activation.taskname, activation.id)
-            if cache.add(key, "1", timeout=AT_MOST_ONCE_TIMEOUT):  # The key didn't exist
-                metrics.incr(
-                    "taskworker.task.at_most_once.executed", tags={"task": activation.taskname}
-                )
-            else:
-                metrics.incr(
-                    "taskworker.worker.at_most_once.skipped", tags={"task": activation.taskname}
-                )
-                return None
+        if task.at_most_once and not self._claim_at_most_once(activation):
+            return None
 
         processing_timeout = activation.processing_deadline_duration
-        namespace = taskregistry.get(activation.namespace)
         next_state = TASK_ACTIVATION_STATUS_FAILURE
         result = None
         execution_start_time = 0.0
@@ -226,15 +343,64 @@ class TaskWorker:
             # stdlib multiprocessing.Pool doesn't expose ways to terminate individual tasks.
             self._build_pool()
         except Exception as err:
-            if namespace.get(activation.taskname).should_retry(activation.retry_state, err):
-                logger.info("taskworker.task.retry", extra={"task": activation.taskname})
-                next_state = TASK_ACTIVATION_STATUS_RETRY
+            next_state = self._get_error_status(activation, err)
 
-            if next_state != TASK_ACTIVATION_STATUS_RETRY:
-                logger.info(
-                    "taskworker.task_errored", extra={"type": str(err.__class__), "error": str(err)}
-                )
+        self._record_execution(activation, next_state, execution_start_time)
+
+        return self.client.update_task(
+            task_id=activation.id,
+            status=next_state,
+            fetch_next_task=FetchNextTask(namespace=self._namespace),
+        )
+
+    def _fail_unknown_task(
+        self, activation: TaskActivation, fetch_next_task: FetchNextTask | None
+    ) -> TaskActivation | None:
+        metrics.incr(
+            "taskworker.worker.unknown_task",
+            tags={"namespace": activation.namespace, "taskname": activation.taskname},
+        )
+        self._execution_count += 1
+        return self.client.update_task(
+            task_id=activation.id,
+            status=TASK_ACTIVATION_STATUS_FAILURE,
+            fetch_next_task=fetch_next_task,
+        )
 
+    def _claim_at_most_once(self, activation: TaskActivation) -> bool:
+        """
+        Returns whether an at most once task should be executed, which is only
+        the case for the first worker that sees the activation.
+        """
+        key = get_at_most_once_key(activation.namespace, activation.taskname, activation.id)
+        if cache.add(key, "1", timeout=AT_MOST_ONCE_TIMEOUT):  # The key didn't exist
+            metrics.incr(
+                "taskworker.task.at_most_once.executed", tags={"task": activation.taskname}
+            )
+            return True
+
+        metrics.incr("taskworker.worker.at_most_once.skipped", tags={"task": activation.taskname})
+        return False
+
+    def _get_error_status(
+        self, activation: TaskActivation, err: Exception
+    ) -> TaskActivationStatus.ValueType:
+        namespace = taskregistry.get(activation.namespace)
+        if namespace.get(activation.taskname).should_retry(activation.retry_state, err):
+            logger.info("taskworker.task.retry", extra={"task": activation.taskname})
+            return TASK_ACTIVATION_STATUS_RETRY
+
+        logger.info(
+            "taskworker.task_errored", extra={"type": str(err.__class__), "error": str(err)}
+        )
+        return TASK_ACTIVATION_STATUS_FAILURE
+
+    def _record_execution(
+        self,
+        activation: TaskActivation,
+        next_state: TaskActivationStatus.ValueType,
+        execution_start_time: float,
+    ) -> None:
         execution_complete_time = time.time()
         self._execution_count += 1
 
@@ -268,8 +434,328 @@ class TaskWorker:
             tags={"namespace": activation.namespace},
         )
 
-        return self.client.update_task(
+    def _start_concurrent(self) -> int:
+        """
+        Main loop of a worker with several slots. Activations returned when
+        reporting the status of a task are buffered along with those fetched
+        explicitly, up to `prefetch` activations beyond the free slots.
+        """
+        buffer: deque[_BufferedActivation] = deque()
+        try:
+            while True:
+                progressed = False
+
+                for slot in self._slots:
+                    if slot.activation is not None and self._collect_slot(slot, buffer):
+                        progressed = True
+                if self._io_slot and self._collect_io_slot(buffer):
+                    progressed = True
+
+                if self._dispatch_buffered(buffer):
+                    progressed = True
+
+                if self._reached_max_task_count():
+                    if self._slots_busy():
+                        # Let the tasks that are still executing finish first
+                        self._wait(busy=True)
+                        continue
+                    metrics.incr(
+                        "taskworker.worker.max_task_count_reached",
+                        tags={"count": self._execution_count},
+                    )
+                    logger.info("Max task execution count reached. Terminating")
+                    return 0
+
+                if self._wants_activation(buffer):
+                    activation = self.fetch_task()
+                    if activation:
+                        buffer.append(_BufferedActivation(activation))
+                        progressed = True
+
+                if progressed:
+                    metrics.gauge("taskworker.worker.prefetch_buffer", len(buffer))
+                    self._poll_interval = POLL_INTERVAL_MIN
+                else:
+                    if not self._slots_busy():
+                        metrics.incr("taskworker.worker.no_task.pause")
+                    self._wait(busy=self._slots_busy())
+
+        except KeyboardInterrupt:
+            return 1
+        except Exception:
+            logger.exception("Worker process crashed")
+            return 2
+
+    def _busy_count(self) -> int:
+        busy = sum(1 for slot in self._slots if slot.activation is not None)
+        if self._io_slot:
+            busy += len(self._io_slot.running)
+        return busy
+
+    def _slots_busy(self) -> bool:
+        return self._busy_count() > 0
+
+    def _reached_max_task_count(self) -> bool:
+        return self._max_task_count is not None and self._max_task_count <= self._execution_count
+
+    def _wants_activation(self, buffer: deque[_BufferedActivation]) -> bool:
+        """
+        Whether another activation should be fetched: there is room in the
+        buffer, and it won't take the worker past its max_task_count.
+
+        Activations held back by their namespace's io_concurrency don't take
+        up room, so that they don't keep idle slots from being filled. At most
+        as many of them as the worker has room for are buffered though.
+        """
+        pending = self._busy_count() + len(buffer)
+        if self._max_task_count is not None:
+            if self._execution_count + pending >= self._max_task_count:
+                return False
+
+        capacity = self._concurrency + self._io_threads + self._prefetch
+        held_back = min(self._held_back, len(buffer))
+        if held_back >= capacity:
+            return False
+        return pending - held_back < capacity
+
+    def _wait(self, busy: bool) -> None:
+        """
+        Backs off exponentially while the worker makes no progress, waking up
+        early when an executing task completes.
+        """
+        if busy:
+            interval = min(self._poll_interval, BUSY_POLL_INTERVAL_MAX)
+            for slot in self._slots:
+                if slot.result is not None:
+                    slot.result.wait(timeout=interval)
+                    break
+            else:
+                time.sleep(interval)
+        else:
+            time.sleep(self._poll_interval)
+        self._poll_interval = min(self._poll_interval * 2, POLL_INTERVAL_MAX)
+
+    def _dispatch_buffered(self, buffer: deque[_BufferedActivation]) -> bool:
+        """
+        Starts executing the buffered activations that there is capacity for.
+        Activations that have to wait, such as I/O tasks of a namespace that is
+        at its concurrency limit, keep their place in the buffer.
+        """
+        progressed = False
+        held_back = 0
+        for _ in range(len(buffer)):
+            buffered = buffer.popleft()
+            if time.time() >= buffered.deadline:
+                # The RPC host hands the activation to another worker once its
+                # deadline has passed, so it must not be executed here as well.
+                logger.info(
+                    "taskworker.buffered_deadline_exceeded",
+                    extra={
+                        "taskname": buffered.activation.taskname,
+                        "processing_deadline": buffered.activation.processing_deadline_duration,
+                    },
+                )
+                metrics.incr(
+                    "taskworker.worker.buffered_deadline_exceeded",
+                    tags={"namespace": buffered.activation.namespace},
+                )
+                progressed = True
+            elif self._dispatch(buffered, buffer):
+                progressed = True
+            else:
+                buffer.append(buffered)
+                if self._is_held_back(buffered.activation):
+                    held_back += 1
+        self._held_back = held_back
+        return progressed
+
+    def _dispatch(self, buffered: _BufferedActivation, buffer: deque[_BufferedActivation]) -> bool:
+        """
+        Returns whether the activation was handled, or has to wait for capacity.
+        """
+        activation = buffered.activation
+        task = self._get_known_task(activation)
+        if not task:
+            next_task = self._fail_unknown_task(activation, self._next_task_request(buffer))
+            if next_task:
+                buffer.append(_BufferedActivation(next_task))
+            return True
+
+        io_slot = self._io_slot if task.execution_class == ExecutionClass.IO else None
+        slot: _WorkerSlot | None = None
+        if io_slot:
+            if not self._has_io_capacity(io_slot, activation):
+                return False
+        else:
+            slot = next((slot for slot in self._slots if slot.activation is None), None)
+            if slot is None:
+                return False
+
+        if task.at_most_once and not self._claim_at_most_once(activation):
+            return True
+
+        if io_slot:
+            io_slot.running[activation.id] = (activation, time.time(), buffered.deadline)
+            io_slot.activations.put(activation)
+        else:
+            assert slot is not None
+            slot.activation = activation
+            slot.start_time = time.time()
+            slot.deadline = buffered.deadline
+            slot.result = slot.pool.apply_async(func=_process_activation, args=(activation,))
+        return True
+
+    def _build_io_slot(self) -> None:
+        if self._io_slot:
+            self._io_slot.process.terminate()
+        activations: Queue[TaskActivation | None] = mp_context.Queue()
+        results: Queue[tuple[str, Exception | None]] = mp_context.Queue()
+        process = mp_context.Process(
+            target=_process_io_activations,
+            args=(activations, results, self._io_threads),
+            daemon=True,
+        )
+        process.start()
+        self._io_slot = _IoSlot(process=process, activations=activations, results=results)
+
+    def _has_io_capacity(self, io_slot: _IoSlot, activation: TaskActivation) -> bool:
+        if len(io_slot.running) >= self._io_threads:
+            return False
+        return not self._at_io_concurrency_limit(io_slot, activation)
+
+    def _at_io_concurrency_limit(self, io_slot: _IoSlot, activation: TaskActivation) -> bool:
+        limit = taskregistry.get(activation.namespace).io_concurrency
+        if limit is None:
+            return False
+        running = Counter(running.namespace for running, _, _ in io_slot.running.values())
+        return running[activation.namespace] >= limit
+
+    def _is_held_back(self, activation: TaskActivation) -> bool:
+        """
+        Whether a buffered activation waits for its namespace's io_concurrency
+        rather than for a free slot.
+        """
+        if self._io_slot is None:
+            return False
+        task = self._get_known_task(activation)
+        return (
+            task is not None
+            and task.execution_class == ExecutionClass.IO
+            and self._at_io_concurrency_limit(self._io_slot, activation)
+        )
+
+    def _collect_io_slot(self, buffer: deque[_BufferedActivation]) -> bool:
+        """
+        Reports the status of the I/O activations that completed, and replaces
+        the child process if an activation exceeded its processing deadline.
+        Returns whether any activation was reported.
+        """
+        io_slot = self._io_slot
+        assert io_slot is not None
+
+        progressed = False
+        while True:
+            try:
+                activation_id, error = io_slot.results.get_nowait()
+            except queue.Empty:
+                break
+            running = io_slot.running.pop(activation_id, None)
+            if running is None:
+                continue
+            activation, start_time, _ = running
+            if error is None:
+                next_state = TASK_ACTIVATION_STATUS_COMPLETE
+            else:
+                next_state = self._get_error_status(activation, error)
+            self._complete_activation(activation, next_state, start_time, buffer)
+            progressed = True
+
+        now = time.time()
+        timed_out = {
+            activation_id
+            for activation_id, (_, _, deadline) in io_slot.running.items()
+            if now >= deadline
+        }
+        if not timed_out and io_slot.process.is_alive():
+            return progressed
+
+        # Threads can't be stopped, so the whole process has to be replaced. The
+        # activations that were executing alongside the ones that timed out are
+        # retried where their retry policy allows it.
+        running_activations = list(io_slot.running.values())
+        io_slot.running.clear()
+        self._build_io_slot()
+        for activation, start_time, _ in running_activations:
+            if activation.id in timed_out:
+                logger.info(
+                    "taskworker.task_execution_timeout",
+                    extra={
+                        "taskname": activation.taskname,
+                        "processing_deadline": activation.processing_deadline_duration,
+                    },
+                )
+                next_state = TASK_ACTIVATION_STATUS_FAILURE
+            else:
+                next_state = self._get_error_status(activation, RetryError())
+            self._complete_activation(activation, next_state, start_time, buffer)
+        return True
+
+    def _collect_slot(self, slot: _WorkerSlot, buffer: deque[_BufferedActivation]) -> bool:
+        """
+        Reports the status of the slot's activation once it has completed or
+        timed out, buffering the next activation returned by the RPC host.
+        Returns whether the slot is free again.
+        """
+        activation = slot.activation
+        assert activation is not None and slot.result is not None
+
+        processing_timeout = activation.processing_deadline_duration
+        if slot.result.ready():
+            try:
+                slot.result.get()
+                next_state = TASK_ACTIVATION_STATUS_COMPLETE
+            except Exception as err:
+                next_state = self._get_error_status(activation, err)
+        elif time.time() >= slot.deadline:
+            logger.info(
+                "taskworker.task_execution_timeout",
+                extra={
+                    "taskname": activation.taskname,
+                    "processing_deadline": processing_timeout,
+                },
+            )
+            # Only the process of this slot has to be replaced
+            slot.pool.terminate()
+            slot.pool = mp_context.Pool(processes=1)
+            next_state = TASK_ACTIVATION_STATUS_FAILURE
+        else:
+            return False
+
+        start_time = slot.start_time
+        slot.activation = None
+        slot.result = None
+        self._complete_activation(activation, next_state, start_time, buffer)
+        return True
+
+    def _complete_activation(
+        self,
+        activation: TaskActivation,
+        next_state: TaskActivationStatus.ValueType,
+        start_time: float,
+        buffer: deque[_BufferedActivation],
+    ) -> None:
+        self._record_execution(activation, next_state, start_time)
+        next_task = self.client.update_task(
             task_id=activation.id,
             status=next_state,
-            fetch_next_task=FetchNextTask(namespace=self._namespace),
+            fetch_next_task=self._next_task_request(buffer),
         )
+        if next_task:
+            buffer.append(_BufferedActivation(next_task))
+
+    def _next_task_request(self, buffer: deque[_BufferedActivation]) -> FetchNextTask | None:
+        # Only ask for another activation along with a status update when
+        # there is room for it, otherwise it would sit in the buffer unbounded.
+        if self._wants_activation(buffer):
+            return FetchNextTask(namespace=self._namespace)
+        return None
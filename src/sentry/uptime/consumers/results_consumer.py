@@ -243,19 +243,36 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
     def handle_result_for_project_active_mode(
         self, project_subscription: ProjectUptimeSubscription, result: CheckResult
     ):
-        redis = _get_cluster()
+        is_status_change = (
+            project_subscription.uptime_status == UptimeStatus.OK
+            and result["status"] == CHECKSTATUS_FAILURE
+        ) or (
+            project_subscription.uptime_status == UptimeStatus.FAILED
+            and result["status"] == CHECKSTATUS_SUCCESS
+        )
         delete_status = (
             CHECKSTATUS_FAILURE if result["status"] == CHECKSTATUS_SUCCESS else CHECKSTATUS_SUCCESS
         )
+
+        pipeline = _get_cluster().pipeline()
         # Delete any consecutive results we have for the opposing status, since we received this status
-        redis.delete(build_active_consecutive_status_key(project_subscription, delete_status))
+        pipeline.delete(build_active_consecutive_status_key(project_subscription, delete_status))
+        # Count this status when it may change the uptime status. Both happen in a single round
+        # trip to redis.
+        if is_status_change:
+            key = build_active_consecutive_status_key(project_subscription, result["status"])
+            pipeline.incr(key)
+            pipeline.expire(key, ACTIVE_THRESHOLD_REDIS_TTL)
+        pipeline_results = pipeline.execute()
 
-        if (
-            project_subscription.uptime_status == UptimeStatus.OK
-            and result["status"] == CHECKSTATUS_FAILURE
-        ):
-            if not self.has_reached_status_threshold(project_subscription, result["status"]):
-                return
+        if not is_status_change:
+            return
+
+        status_count = int(pipeline_results[1])
+        if not self.has_reached_status_threshold(result["status"], status_count):
+            return
+
+        if result["status"] == CHECKSTATUS_FAILURE:
 
             issue_creation_flag_enabled = features.has(
                 "organizations:uptime-create-issues",
@@ -288,13 +305,7 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
                     },
                 )
             project_subscription.update(uptime_status=UptimeStatus.FAILED)
-        elif (
-            project_subscription.uptime_status == UptimeStatus.FAILED
-            and result["status"] == CHECKSTATUS_SUCCESS
-        ):
-            if not self.has_reached_status_threshold(project_subscription, result["status"]):
-                return
-
+        else:
             if features.has(
                 "organizations:uptime-create-issues", project_subscription.project.organization
             ):
@@ -310,14 +321,7 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
                 )
             project_subscription.update(uptime_status=UptimeStatus.OK)
 
-    def has_reached_status_threshold(
-        self, project_subscription: ProjectUptimeSubscription, status: str
-    ) -> bool:
-        pipeline = _get_cluster().pipeline()
-        key = build_active_consecutive_status_key(project_subscription, status)
-        pipeline.incr(key)
-        pipeline.expire(key, ACTIVE_THRESHOLD_REDIS_TTL)
-        status_count = int(pipeline.execute()[0])
+    def has_reached_status_threshold(self, status: str, status_count: int) -> bool:
         result = (status == CHECKSTATUS_FAILURE and status_count >= ACTIVE_FAILURE_THRESHOLD) or (
             status == CHECKSTATUS_SUCCESS and status_count >= ACTIVE_RECOVERY_THRESHOLD
         )
@@ -3,7 +3,7 @@ from __future__ import annotations
 import pickle
 from collections.abc import Callable, Mapping
 from functools import partial
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from arroyo.processing.strategies.run_task import RunTask
 from arroyo.processing.strategies.run_task_with_multiprocessing import (
@@ -19,6 +19,9 @@ from django.conf import settings
 
 from sentry.metrics.base import MetricsBackend
 
+if TYPE_CHECKING:
+    from sentry.utils.shared_model_cache import SharedModelCache
+
 Tags = Mapping[str, str]
 
 
@@ -101,7 +104,8 @@ class MetricsWrapper(Metrics):
 
 
 def _get_arroyo_subprocess_initializer(
-    initializer: Callable[[], None] | None
+    initializer: Callable[[], None] | None,
+    shared_model_cache: SharedModelCache | None = None,
 ) -> Callable[[], None]:
     from sentry.metrics.middleware import get_current_global_tags
 
@@ -109,14 +113,28 @@ def _get_arroyo_subprocess_initializer(
     # tags that may not be pickleable. Because those tags are getting pickled
     # as part of the constructed partial()
     tags: Tags = {k: v for k, v in get_current_global_tags().items() if isinstance(v, str)}
-    return partial(_initialize_arroyo_subprocess, initializer=initializer, tags=tags)
-
-
-def _initialize_arroyo_subprocess(initializer: Callable[[], None] | None, tags: Tags) -> None:
+    return partial(
+        _initialize_arroyo_subprocess,
+        initializer=initializer,
+        tags=tags,
+        shared_model_cache=shared_model_cache.attach_args if shared_model_cache else None,
+    )
+
+
+def _initialize_arroyo_subprocess(
+    initializer: Callable[[], None] | None,
+    tags: Tags,
+    shared_model_cache: tuple[str, str, int, int, float] | None = None,
+) -> None:
     from sentry.runner import configure
 
     configure()
 
+    if shared_model_cache is not None:
+        from sentry.utils.shared_model_cache import attach_shared_model_cache
+
+        attach_shared_model_cache(shared_model_cache)
+
     if initializer:
         initializer()
 
@@ -138,11 +156,16 @@ def initialize_arroyo_main() -> None:
 class MultiprocessingPool:
     def __init__(self, num_processes: int, initializer: Callable[[], None] | None = None) -> None:
         self.__initializer = initializer
+        self.__shared_model_cache: SharedModelCache | None = None
         if settings.KAFKA_CONSUMER_FORCE_DISABLE_MULTIPROCESSING:
             self.__pool = None
         else:
+            from sentry.utils.shared_model_cache import create_shared_model_cache
+
+            self.__shared_model_cache = create_shared_model_cache()
             self.__pool = ArroyoMultiprocessingPool(
-                num_processes, _get_arroyo_subprocess_initializer(initializer)
+                num_processes,
+                _get_arroyo_subprocess_initializer(initializer, self.__shared_model_cache),
             )
 
     @property
@@ -156,6 +179,8 @@ class MultiprocessingPool:
     def close(self) -> None:
         if self.__pool is not None:
             self.__pool.close()
+        if self.__shared_model_cache is not None:
+            self.__shared_model_cache.close(unlink=True)
 
 
 def run_task_with_multiprocessing(
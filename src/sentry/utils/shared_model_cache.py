@@ -0,0 +1,273 @@
+"""
+A cache of hot model rows that is shared by all worker processes of a
+multiprocessing consumer.
+
+Without it, every arroyo subprocess keeps its own copies of the projects,
+organizations and project keys it has looked up and warms them up on its
+own. The shared cache is a single shared memory segment, created by the
+parent process when the pool is created and attached to by every worker, so
+a row fetched by one worker can be used by all of them.
+
+The segment is a fixed size hash table. Every slot holds one row, serialized
+as the pickled list of its concrete field values, and is protected by a
+sequence counter and a checksum so that readers can detect concurrent or
+torn writes and treat them as a miss. Writers are serialized by file locks on
+stripes of slots, which the kernel releases if a writer dies. Colliding keys
+simply evict each other.
+
+Behind the slots, the segment holds a table of row generations. Every row is
+stamped with the generation it was fetched under, and the model manager's
+post-save and post-delete signals bump the generation, so a row changed by
+any of the workers is never served again. Lookups don't need any network
+round trip for this. Rows changed by other processes are only invalidated by
+the TTL, after which a row is never served.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import os
+import pickle
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from multiprocessing.shared_memory import SharedMemory
+
+from django.conf import settings
+from django.db.models import Model
+
+from sentry.utils import metrics
+
+#: Models (by ``_meta.label_lower``) that are stored in the shared cache.
+SHARED_CACHE_MODELS = frozenset(["sentry.project", "sentry.organization", "sentry.projectkey"])
+
+# sequence, key hash, time stored, generation, payload length, payload checksum
+_HEADER = struct.Struct("<IQdIII")
+_SEQUENCE = struct.Struct("<I")
+_FIELDS = struct.Struct("<QdIII")
+_GENERATION = struct.Struct("<I")
+
+#: Number of locks that writers to the slots are spread over.
+LOCK_STRIPES = 64
+
+_shared_model_cache: SharedModelCache | None = None
+
+
+def _key_hash(model: type[Model], version: str, pk: int) -> int:
+    key = f"{model._meta.label_lower}:{version}:{pk}".encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def _row_hash(model: type[Model], pk: int) -> int:
+    key = f"{model._meta.label_lower}:{pk}".encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+class SharedModelCache:
+    def __init__(
+        self, shm: SharedMemory, lock_path: str, num_slots: int, slot_size: int, ttl: float
+    ) -> None:
+        assert slot_size > _HEADER.size
+        assert shm.size >= num_slots * (slot_size + _GENERATION.size)
+        self.shm = shm
+        self.lock_path = lock_path
+        # Byte range locks are held per process, so threads of the same
+        # process are serialized by a thread lock per stripe in addition.
+        self.lock_fd = os.open(lock_path, os.O_RDWR)
+        self.thread_locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        self.num_slots = num_slots
+        self.slot_size = slot_size
+        self.ttl = ttl
+
+    @classmethod
+    def create(cls, num_slots: int, slot_size: int, ttl: float) -> SharedModelCache:
+        shm = SharedMemory(create=True, size=num_slots * (slot_size + _GENERATION.size))
+        fd, lock_path = tempfile.mkstemp(prefix="sentry-shared-model-cache-")
+        os.close(fd)
+        metrics.gauge("shared_model_cache.size", shm.size)
+        return cls(shm, lock_path, num_slots, slot_size, ttl)
+
+    @classmethod
+    def attach(
+        cls, name: str, lock_path: str, num_slots: int, slot_size: int, ttl: float
+    ) -> SharedModelCache:
+        return cls(SharedMemory(name=name), lock_path, num_slots, slot_size, ttl)
+
+    @property
+    def attach_args(self) -> tuple[str, str, int, int, float]:
+        """Arguments for `attach`, to be passed to worker processes."""
+        return (self.shm.name, self.lock_path, self.num_slots, self.slot_size, self.ttl)
+
+    def close(self, unlink: bool = False) -> None:
+        self.shm.close()
+        os.close(self.lock_fd)
+        if unlink:
+            self.shm.unlink()
+            os.unlink(self.lock_path)
+
+    def _slot(self, model: type[Model], version: str, pk: int) -> tuple[int, int]:
+        key_hash = _key_hash(model, version, pk)
+        return key_hash, key_hash % self.num_slots
+
+    def _generation_offset(self, index: int) -> int:
+        return self.num_slots * self.slot_size + index * _GENERATION.size
+
+    def generation(self, model: type[Model], pk: int) -> int:
+        """
+        Returns the current generation of a row. This has to be read before
+        the row is fetched and passed to `set`, so that a concurrent change
+        bumps the generation after it.
+        """
+        index = _row_hash(model, pk) % self.num_slots
+        return _GENERATION.unpack_from(self.shm.buf, self._generation_offset(index))[0]
+
+    def bump(self, model: type[Model], pk: int) -> None:
+        """Invalidates a row for all processes attached to the cache."""
+        index = _row_hash(model, pk) % self.num_slots
+        offset = self._generation_offset(index)
+        self._lock(index, blocking=True)
+        try:
+            generation = _GENERATION.unpack_from(self.shm.buf, offset)[0]
+            _GENERATION.pack_into(self.shm.buf, offset, (generation + 1) % 2**32)
+        finally:
+            self._unlock(index)
+
+    def get(self, model: type[Model], version: str, pk: int) -> Model | None:
+        key_hash, index = self._slot(model, version, pk)
+        offset = index * self.slot_size
+        buf = self.shm.buf
+        tags = {"model": model.__name__}
+
+        sequence, stored_key_hash, stored_at, generation, length, checksum = _HEADER.unpack_from(
+            buf, offset
+        )
+        if sequence % 2 or stored_key_hash != key_hash or not length:
+            metrics.incr("shared_model_cache.get", tags={**tags, "result": "miss"})
+            return None
+
+        if generation != self.generation(model, pk):
+            metrics.incr("shared_model_cache.get", tags={**tags, "result": "invalidated"})
+            return None
+
+        if time.time() - stored_at > self.ttl:
+            metrics.incr("shared_model_cache.get", tags={**tags, "result": "expired"})
+            return None
+
+        start = offset + _HEADER.size
+        payload = bytes(buf[start : start + length])
+        if _SEQUENCE.unpack_from(buf, offset)[0] != sequence or zlib.crc32(payload) != checksum:
+            # The slot was written to while we read it.
+            metrics.incr("shared_model_cache.get", tags={**tags, "result": "conflict"})
+            return None
+
+        values = pickle.loads(payload)
+        metrics.incr("shared_model_cache.get", tags={**tags, "result": "hit"})
+        return model.from_db(None, [f.attname for f in model._meta.concrete_fields], values)
+
+    def set(self, instance: Model, version: str, generation: int) -> None:
+        model = type(instance)
+        payload = pickle.dumps(
+            [getattr(instance, f.attname) for f in model._meta.concrete_fields],
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        if _HEADER.size + len(payload) > self.slot_size:
+            metrics.incr("shared_model_cache.set.too_large", tags={"model": model.__name__})
+            return
+
+        key_hash, index = self._slot(model, version, instance.pk)
+        # Filling the cache is best effort, skip it if the slot is busy.
+        if not self._lock(index, blocking=False):
+            metrics.incr("shared_model_cache.set.contended", tags={"model": model.__name__})
+            return
+        try:
+            self._write(index * self.slot_size, key_hash, generation, payload)
+        finally:
+            self._unlock(index)
+
+    def _lock(self, index: int, blocking: bool) -> bool:
+        """
+        Locks the stripe of a slot, which also covers the generation with the
+        same index.
+        """
+        stripe = index % LOCK_STRIPES
+        thread_lock = self.thread_locks[stripe]
+        if not thread_lock.acquire(blocking=blocking):
+            return False
+        try:
+            fcntl.lockf(
+                self.lock_fd,
+                fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB,
+                1,
+                stripe,
+            )
+        except OSError:
+            thread_lock.release()
+            if blocking:
+                raise
+            return False
+        return True
+
+    def _unlock(self, index: int) -> None:
+        stripe = index % LOCK_STRIPES
+        fcntl.lockf(self.lock_fd, fcntl.LOCK_UN, 1, stripe)
+        self.thread_locks[stripe].release()
+
+    def _write(self, offset: int, key_hash: int, generation: int, payload: bytes) -> None:
+        """Writes a slot, the caller has to hold the slot's lock."""
+        buf = self.shm.buf
+        # An odd sequence marks the slot as being written to. A writer that
+        # died while holding the lock may have left it odd already.
+        sequence = _SEQUENCE.unpack_from(buf, offset)[0] | 1
+        _SEQUENCE.pack_into(buf, offset, sequence)
+        start = offset + _HEADER.size
+        buf[start : start + len(payload)] = payload
+        _FIELDS.pack_into(
+            buf,
+            offset + _SEQUENCE.size,
+            key_hash,
+            time.time(),
+            generation,
+            len(payload),
+            zlib.crc32(payload),
+        )
+        # The sequence is written last, so that readers never see an even
+        # sequence together with partially written fields.
+        _SEQUENCE.pack_into(buf, offset, (sequence + 1) % 2**32)
+
+
+def create_shared_model_cache() -> SharedModelCache | None:
+    """
+    Creates the shared cache for a multiprocessing pool, if it is enabled.
+    """
+    num_slots = settings.KAFKA_CONSUMER_SHARED_MODEL_CACHE_SLOTS
+    if not num_slots:
+        return None
+
+    return SharedModelCache.create(
+        num_slots=num_slots,
+        slot_size=settings.KAFKA_CONSUMER_SHARED_MODEL_CACHE_SLOT_SIZE,
+        ttl=settings.KAFKA_CONSUMER_SHARED_MODEL_CACHE_TTL,
+    )
+
+
+def attach_shared_model_cache(attach_args: tuple[str, str, int, int, float]) -> None:
+    """
+    Attaches the current (worker) process to a shared cache created by the
+    parent process. Model managers start using it right away.
+    """
+    global _shared_model_cache
+    _shared_model_cache = SharedModelCache.attach(*attach_args)
+
+
+def get_shared_model_cache(model: type[Model]) -> SharedModelCache | None:
+    if _shared_model_cache is None or model._meta.label_lower not in SHARED_CACHE_MODELS:
+        return None
+    return _shared_model_cache
+
+
+def set_shared_model_cache(value: SharedModelCache | None) -> None:
+    global _shared_model_cache
+    _shared_model_cache = value
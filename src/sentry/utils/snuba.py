@@ -6,17 +6,19 @@ import logging
 import math
 import os
 import re
+import threading
 import time
 from collections import namedtuple
-from collections.abc import Callable, Collection, Mapping, MutableMapping, Sequence
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Callable, Collection, Generator, Mapping, MutableMapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
-from copy import deepcopy
+from copy import copy, deepcopy
 from datetime import datetime, timedelta, timezone
 from hashlib import sha1
 from typing import Any
 from urllib.parse import urlparse
 
+import orjson
 import sentry_sdk
 import sentry_sdk.scope
 import urllib3
@@ -26,6 +28,7 @@ from django.core.cache import cache
 from snuba_sdk import DeleteQuery, MetricsQuery, Request
 from snuba_sdk.legacy import json_to_snql
 
+from sentry import options
 from sentry.models.environment import Environment
 from sentry.models.group import Group
 from sentry.models.grouprelease import GroupRelease
@@ -41,6 +44,8 @@ from sentry.snuba.query_sources import QuerySource
 from sentry.snuba.referrer import validate_referrer
 from sentry.utils import json, metrics
 from sentry.utils.dates import outside_retention_with_modified_start
+from sentry.utils.locking import UnableToAcquireLock
+from sentry.utils.locking.lock import Lock
 
 logger = logging.getLogger(__name__)
 
@@ -453,6 +458,60 @@ def timer(name, prefix="snuba.client"):
         metrics.timing(f"{prefix}.{name}", time.time() - t)
 
 
+def _get_referrer_semaphore(referrer: str) -> threading.BoundedSemaphore | None:
+    limit = options.get("snuba.referrer-concurrency-limits").get(referrer)
+    if not limit:
+        return None
+
+    with _referrer_semaphores_lock:
+        current = _referrer_semaphores.get(referrer)
+        if current is None or current[0] != limit:
+            current = _referrer_semaphores[referrer] = (limit, threading.BoundedSemaphore(limit))
+        return current[1]
+
+
+def _acquire_referrer_slot(referrer: str) -> Callable[[], None]:
+    """
+    Waits for a slot of the referrer's limit in `snuba.referrer-concurrency-limits` and
+    returns a function that releases it.
+
+    Raises `RateLimitExceeded` if no slot frees up within the snuba timeout.
+    """
+    semaphore = _get_referrer_semaphore(referrer)
+    if semaphore is None:
+        return lambda: None
+
+    start = time.monotonic()
+    acquired = semaphore.acquire(timeout=settings.SENTRY_SNUBA_TIMEOUT)
+    metrics.timing(
+        "snuba.client.referrer_queue_time",
+        time.monotonic() - start,
+        tags={"referrer": referrer, "acquired": str(acquired).lower()},
+    )
+    if not acquired:
+        raise RateLimitExceeded(f"Too many concurrent queries for referrer {referrer}")
+    return semaphore.release
+
+
+@contextmanager
+def referrer_concurrency_slot(referrer: str) -> Generator[None]:
+    """
+    Waits until fewer queries with the given referrer than its limit in
+    `snuba.referrer-concurrency-limits` are in flight in this process, so that a single
+    fan-out heavy referrer can't use up all of the threads and connections to snuba.
+
+    Slots are taken before queries are submitted to `_query_thread_pool`, so that queries
+    waiting for a slot don't hold a thread of the pool.
+
+    Raises `RateLimitExceeded` if no slot frees up within the snuba timeout.
+    """
+    release = _acquire_referrer_slot(referrer)
+    try:
+        yield
+    finally:
+        release()
+
+
 @contextmanager
 def options_override(overrides):
     """\
@@ -528,9 +587,28 @@ _snuba_pool = connection_from_url(
         allowed_methods={"GET", "POST", "DELETE"},
     ),
     timeout=settings.SENTRY_SNUBA_TIMEOUT,
-    maxsize=10,
+    maxsize=settings.SENTRY_SNUBA_POOL_MAXSIZE,
 )
-_query_thread_pool = ThreadPoolExecutor(max_workers=10)
+_query_thread_pool = ThreadPoolExecutor(max_workers=settings.SENTRY_SNUBA_QUERY_THREADS)
+
+# Semaphores enforcing `snuba.referrer-concurrency-limits`, keyed by referrer, along with the
+# limit each one was created for so that it is replaced when the limit changes.
+_referrer_semaphores: dict[str, tuple[int, threading.BoundedSemaphore]] = {}
+_referrer_semaphores_lock = threading.Lock()
+
+# Requests this process is currently sending to snuba, keyed by `_get_coalesce_key`. Identical
+# requests made meanwhile wait for these instead of being sent again.
+_inflight_requests: dict[str, Future[Any]] = {}
+_inflight_requests_lock = threading.Lock()
+
+# How long another process may hold the lease for a request
+COALESCE_LEASE_DURATION = 30
+# Waiting for the result of another process starts polling at the first interval, which doubles
+# up to the second one
+COALESCE_LEASE_POLL_INTERVAL = 0.05
+COALESCE_LEASE_MAX_POLL_INTERVAL = 1.0
+# Results larger than this aren't shared with other processes, memcached rejects items over 1MB
+COALESCE_MAX_RESULT_SIZE = 512 * 1024
 
 
 epoch_naive = datetime(1970, 1, 1, tzinfo=None)
@@ -1013,8 +1091,8 @@ def bulk_snuba_queries_with_referrers(
         SnubaRequest(
             request=request,
             referrer=referrer,
-            forward=lambda x: x,
-            reverse=lambda x: x,
+            forward=_identity,
+            reverse=_identity,
         )
         for request, referrer in requests_with_referrers
     ]
@@ -1093,7 +1171,10 @@ def _apply_cache_and_build_results(
             to_query.append((query_pos, snuba_request, None))
 
     if to_query:
-        query_results = _bulk_snuba_query([item[1] for item in to_query])
+        if options.get("snuba.coalesce-requests.enabled"):
+            query_results = _bulk_snuba_query_coalesced([item[1] for item in to_query])
+        else:
+            query_results = _bulk_snuba_query([item[1] for item in to_query])
         for result, (query_pos, _, opt_cache_key) in zip(query_results, to_query):
             if opt_cache_key:
                 cache.set(
@@ -1109,6 +1190,176 @@ def _apply_cache_and_build_results(
     return [result[1] for result in results]
 
 
+def _get_coalesce_key(snuba_request: SnubaRequest) -> str | None:
+    # Deletes must always be sent
+    if isinstance(snuba_request.request.query, DeleteQuery):
+        return None
+    return f"{get_cache_key(snuba_request.request)}:{snuba_request.referrer}"
+
+
+def _bulk_snuba_query_coalesced(snuba_requests: Sequence[SnubaRequest]) -> ResultSet:
+    """
+    Like `_bulk_snuba_query`, but requests identical to one that another thread of this process
+    is already sending to snuba are not sent again. They wait for the in-flight request and
+    share its result (or its error) instead.
+    """
+    keys = [_get_coalesce_key(snuba_request) for snuba_request in snuba_requests]
+    futures: list[Future[Any]] = []
+    leading: list[int] = []
+
+    with _inflight_requests_lock:
+        for index, key in enumerate(keys):
+            future = _inflight_requests.get(key) if key is not None else None
+            if future is None:
+                future = Future()
+                if key is not None:
+                    _inflight_requests[key] = future
+                leading.append(index)
+            futures.append(future)
+
+    try:
+        if leading:
+            if options.get("snuba.coalesce-requests.cross-process"):
+                query_results = _bulk_snuba_query_leased(
+                    [snuba_requests[index] for index in leading],
+                    [keys[index] for index in leading],
+                )
+            else:
+                query_results = _bulk_snuba_query([snuba_requests[index] for index in leading])
+            for index, result in zip(leading, query_results):
+                futures[index].set_result(result)
+    except BaseException as e:
+        for index in leading:
+            if not futures[index].done():
+                futures[index].set_exception(e)
+        raise
+    finally:
+        with _inflight_requests_lock:
+            for index in leading:
+                key = keys[index]
+                if key is not None and _inflight_requests.get(key) is futures[index]:
+                    del _inflight_requests[key]
+
+    leading_indexes = set(leading)
+    results = []
+    for index, future in enumerate(futures):
+        if index in leading_indexes:
+            results.append(future.result())
+            continue
+
+        referrer = snuba_requests[index].referrer
+        metrics.incr(
+            "snuba.query_coalesce.coalesced",
+            tags={"referrer": referrer or "unknown", "source": "thread"},
+        )
+        try:
+            result = future.result()
+        except Exception as e:
+            # Every follower raises the leader's exception, so each raises its own copy rather
+            # than adding to the traceback of the instance shared with other threads
+            try:
+                error = copy(e)
+            except Exception:
+                raise e
+            raise error from e
+        # Callers are free to modify their results, so they can't share them
+        results.append(deepcopy(result))
+
+    return results
+
+
+def _wait_for_leased_result(result_key: str, lease: Lock, deadline: float) -> Any | None:
+    poll_interval = COALESCE_LEASE_POLL_INTERVAL
+    while True:
+        # Check whether the lease is still held before looking for the result, so that a
+        # result written right before the lease was released isn't missed
+        try:
+            locked = lease.locked()
+        except Exception:
+            # Send the request ourselves if the lease can't be checked
+            return None
+        cached_result = cache.get(result_key)
+        if cached_result is not None:
+            return json.loads(cached_result)
+        remaining = deadline - time.monotonic()
+        if not locked or remaining <= 0:
+            return None
+        time.sleep(min(poll_interval, remaining))
+        poll_interval = min(poll_interval * 2, COALESCE_LEASE_MAX_POLL_INTERVAL)
+
+
+def _bulk_snuba_query_leased(
+    snuba_requests: Sequence[SnubaRequest], keys: Sequence[str | None]
+) -> ResultSet:
+    """
+    Like `_bulk_snuba_query`, but requests that another process holds the lease for are not
+    sent. Their results are read from the cache once the other process has written them, and
+    are only sent when that doesn't happen before the lease is released or expires.
+    """
+    from sentry.locks import locks
+
+    results: dict[int, Any] = {}
+    # Deletes aren't coalesced, so they're sent without a lease
+    leases: list[tuple[int, Lock | None]] = []
+    waiting: list[tuple[int, Lock]] = []
+    for index, key in enumerate(keys):
+        if key is None:
+            leases.append((index, None))
+            continue
+
+        lease = locks.get(
+            f"{key}:lease", duration=COALESCE_LEASE_DURATION, name="snuba_query_coalesce"
+        )
+        try:
+            lease.acquire()
+        except UnableToAcquireLock:
+            waiting.append((index, lease))
+        else:
+            leases.append((index, lease))
+
+    try:
+        if leases:
+            query_results = _bulk_snuba_query([snuba_requests[index] for index, _ in leases])
+            for (index, _), result in zip(leases, query_results):
+                results[index] = result
+                key = keys[index]
+                if key is None:
+                    continue
+                payload = json.dumps(result)
+                if len(payload) > COALESCE_MAX_RESULT_SIZE:
+                    # Other processes send the request themselves once the lease is released
+                    metrics.incr("snuba.query_coalesce.result_too_large")
+                    continue
+                cache.set(f"{key}:result", payload, COALESCE_LEASE_DURATION)
+    finally:
+        for _, lease in leases:
+            if lease is not None:
+                lease.release()
+
+    # Don't wait any longer for other processes than we would for snuba itself
+    deadline = time.monotonic() + settings.SENTRY_SNUBA_TIMEOUT
+    to_query: list[int] = []
+    for index, lease in waiting:
+        result = _wait_for_leased_result(f"{keys[index]}:result", lease, deadline)
+        if result is None:
+            to_query.append(index)
+            continue
+
+        referrer = snuba_requests[index].referrer
+        metrics.incr(
+            "snuba.query_coalesce.coalesced",
+            tags={"referrer": referrer or "unknown", "source": "process"},
+        )
+        results[index] = result
+
+    if to_query:
+        query_results = _bulk_snuba_query([snuba_requests[index] for index in to_query])
+        for index, result in zip(to_query, query_results):
+            results[index] = result
+
+    return [results[index] for index in range(len(snuba_requests))]
+
+
 def _is_rejected_query(body: Any) -> bool:
     return (
         "quota_allowance" in body
@@ -1118,6 +1369,27 @@ def _is_rejected_query(body: Any) -> bool:
     )
 
 
+def _identity(x: Any) -> Any:
+    return x
+
+
+def _decode_response_body(data: bytes) -> Any:
+    """
+    Decodes the JSON body of a snuba response. With `snuba.compact-result-decoding.enabled`
+    the body is parsed by orjson straight from the response bytes, which avoids an
+    intermediate copy of the payload as a string and shares the row keys between all rows.
+    """
+    if options.get("snuba.compact-result-decoding.enabled"):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects some payloads the default decoder accepts, such as NaN and
+            # Infinity. Bodies that aren't JSON at all are left to the default decoder to
+            # raise on as well.
+            pass
+    return json.loads(data)
+
+
 def _bulk_snuba_query(snuba_requests: Sequence[SnubaRequest]) -> ResultSet:
     snuba_requests_list = list(snuba_requests)
 
@@ -1125,36 +1397,46 @@ def _bulk_snuba_query(snuba_requests: Sequence[SnubaRequest]) -> ResultSet:
         span.set_tag("snuba.num_queries", len(snuba_requests_list))
 
         if len(snuba_requests_list) > 1:
-            query_results = list(
-                _query_thread_pool.map(
-                    _snuba_query,
-                    [
+            futures = []
+            for snuba_request in snuba_requests_list:
+                # Wait for the referrer's concurrency limit here rather than in the pool
+                release = _acquire_referrer_slot(snuba_request.headers.get("referer", "unknown"))
+                try:
+                    future = _query_thread_pool.submit(
+                        _snuba_query,
                         (
                             sentry_sdk.Scope.get_isolation_scope(),
                             sentry_sdk.Scope.get_current_scope(),
                             snuba_request,
-                        )
-                        for snuba_request in snuba_requests_list
-                    ],
-                )
-            )
+                            time.monotonic(),
+                        ),
+                    )
+                except BaseException:
+                    release()
+                    raise
+                future.add_done_callback(lambda _, release=release: release())
+                futures.append(future)
+            query_results = [future.result() for future in futures]
         else:
             # No need to submit to the thread pool if we're just performing a single query
-            query_results = [
-                _snuba_query(
-                    (
-                        sentry_sdk.Scope.get_isolation_scope(),
-                        sentry_sdk.Scope.get_current_scope(),
-                        snuba_requests_list[0],
+            snuba_request = snuba_requests_list[0]
+            with referrer_concurrency_slot(snuba_request.headers.get("referer", "unknown")):
+                query_results = [
+                    _snuba_query(
+                        (
+                            sentry_sdk.Scope.get_isolation_scope(),
+                            sentry_sdk.Scope.get_current_scope(),
+                            snuba_request,
+                            None,
+                        )
                     )
-                )
-            ]
+                ]
 
         results = []
         for index, item in enumerate(query_results):
             referrer, response, _, reverse = item
             try:
-                body = json.loads(response.data)
+                body = _decode_response_body(response.data)
                 if SNUBA_INFO:
                     if "sql" in body:
                         log_snuba_info(
@@ -1220,7 +1502,8 @@ def _bulk_snuba_query(snuba_requests: Sequence[SnubaRequest]) -> ResultSet:
                     raise SnubaError(f"HTTP {response.status}")
 
             # Forward and reverse translation maps from model ids to snuba keys, per column
-            body["data"] = [reverse(d) for d in body["data"]]
+            if reverse is not _identity:
+                body["data"] = [reverse(d) for d in body["data"]]
             results.append(body)
 
         return results
@@ -1246,11 +1529,15 @@ def _snuba_query(
         sentry_sdk.Scope,
         sentry_sdk.Scope,
         SnubaRequest,
+        float | None,
     ],
 ) -> RawResult:
     # Eventually we can get rid of this wrapper, but for now it's cleaner to unwrap
     # the params here than in the calling function. (bc of thread .map)
-    thread_isolation_scope, thread_current_scope, snuba_request = params
+    thread_isolation_scope, thread_current_scope, snuba_request, queued_at = params
+    if queued_at is not None:
+        # Time spent waiting for a free thread of `_query_thread_pool`
+        metrics.timing("snuba.client.thread_pool.queue_time", time.monotonic() - queued_at)
     with sentry_sdk.scope.use_isolation_scope(thread_isolation_scope):
         with sentry_sdk.scope.use_scope(thread_current_scope):
             headers = snuba_request.headers
@@ -1269,23 +1556,17 @@ def _snuba_query(
                 sentry_sdk.set_tag("query.referrer", referrer)
 
                 if isinstance(request.query, MetricsQuery):
-                    return (
-                        referrer,
-                        _raw_mql_query(request, headers),
-                        snuba_request.forward,
-                        snuba_request.reverse,
-                    )
+                    raw_query = _raw_mql_query
                 elif isinstance(request.query, DeleteQuery):
-                    return (
-                        referrer,
-                        _raw_delete_query(request, headers),
-                        snuba_request.forward,
-                        snuba_request.reverse,
-                    )
+                    raw_query = _raw_delete_query
+                else:
+                    raw_query = _raw_snql_query
+
+                response = raw_query(request, headers)
 
                 return (
                     referrer,
-                    _raw_snql_query(request, headers),
+                    response,
                     snuba_request.forward,
                     snuba_request.reverse,
                 )
@@ -65,5 +65,13 @@ class DetectorHandler(abc.ABC, Generic[T]):
     ) -> dict[DetectorGroupKey, DetectorEvaluationResult]:
         pass
 
+    def evaluate_batch(
+        self, data_packets: list[DataPacket[T]]
+    ) -> list[dict[DetectorGroupKey, DetectorEvaluationResult]]:
+        """
+        Evaluates a list of data packets in order, returning the results for each packet.
+        """
+        return [self.evaluate(data_packet) for data_packet in data_packets]
+
     def commit_state_updates(self):
         pass
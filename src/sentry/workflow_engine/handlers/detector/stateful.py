@@ -1,4 +1,5 @@
 import abc
+import dataclasses
 from datetime import timedelta
 from typing import Any, TypeVar
 
@@ -129,17 +130,59 @@ class StatefulDetectorHandler(DetectorHandler[T], abc.ABC):
         There will be one result for each group key result in the packet, unless the
         evaluation is skipped due to various rules.
         """
-        dedupe_value = self.get_dedupe_value(data_packet)
-        group_values = self.get_group_key_values(data_packet)
-        all_state_data = self.get_state_data(list(group_values.keys()))
-        results = {}
-        for group_key, group_value in group_values.items():
-            result = self.evaluate_group_key_value(
-                group_key, group_value, all_state_data[group_key], dedupe_value
+        return self.evaluate_batch([data_packet])[0]
+
+    def evaluate_batch(
+        self, data_packets: list[DataPacket[T]]
+    ) -> list[dict[DetectorGroupKey, DetectorEvaluationResult]]:
+        """
+        Evaluates a list of data packets in order, returning the results for each packet.
+
+        State is fetched once for all group keys in the batch, and the enqueued updates of each
+        packet are carried over to the following packets in memory. This means that
+        `commit_state_updates` only needs to be called once for the whole batch.
+        """
+        packet_values = [
+            (self.get_dedupe_value(data_packet), self.get_group_key_values(data_packet))
+            for data_packet in data_packets
+        ]
+        # Preserve the order group keys are first seen in
+        group_keys = list(
+            dict.fromkeys(
+                group_key for _, group_values in packet_values for group_key in group_values
             )
-            if result:
-                results[result.group_key] = result
-        return results
+        )
+        all_state_data = self.get_state_data(group_keys)
+
+        batch_results = []
+        for dedupe_value, group_values in packet_values:
+            results = {}
+            for group_key, group_value in group_values.items():
+                result = self.evaluate_group_key_value(
+                    group_key, group_value, all_state_data[group_key], dedupe_value
+                )
+                all_state_data[group_key] = self.apply_enqueued_updates(all_state_data[group_key])
+                if result:
+                    results[result.group_key] = result
+            batch_results.append(results)
+        return batch_results
+
+    def apply_enqueued_updates(self, state_data: DetectorStateData) -> DetectorStateData:
+        """
+        Returns the state of a group key with the updates that are waiting to be committed applied.
+        """
+        group_key = state_data.group_key
+        active, status = self.state_updates.get(group_key, (state_data.active, state_data.status))
+        return dataclasses.replace(
+            state_data,
+            active=active,
+            status=status,
+            dedupe_value=self.dedupe_updates.get(group_key, state_data.dedupe_value),
+            counter_updates={
+                **state_data.counter_updates,
+                **self.counter_updates.get(group_key, {}),
+            },
+        )
 
     def evaluate_group_key_value(
         self,
@@ -94,7 +94,11 @@ class DataCondition(DefaultFieldsModel):
 
         return condition_handler_registry.get(condition_type)
 
-    def evaluate_value(self, value: T) -> DataConditionResult:
+    def get_evaluator(self) -> Callable[[T], DataConditionResult]:
+        """
+        Resolve the handler or operator and the result of this condition once, returning a
+        function that evaluates a value against them.
+        """
         condition_handler: DataConditionHandler[T] | None = None
         op: Callable | None = None
 
@@ -106,11 +110,7 @@ class DataCondition(DefaultFieldsModel):
             condition = Condition(self.condition)
             op = condition_ops.get(condition, None)
 
-        if condition_handler is not None:
-            result = condition_handler.evaluate_value(value, self.comparison, self.condition)
-        elif op is not None:
-            result = op(cast(Any, value), self.comparison)
-        else:
+        if condition_handler is None and op is None:
             logger.error(
                 "Invalid Data Condition Evaluation",
                 extra={
@@ -120,9 +120,29 @@ class DataCondition(DefaultFieldsModel):
                 },
             )
 
-            return None
+            return lambda value: None
 
-        if result:
-            return self.get_condition_result()
+        comparison = self.comparison
+        condition_result = self.get_condition_result()
 
-        return None
+        if condition_handler is not None:
+            handler = condition_handler
+            data_filter = self.condition
+
+            def evaluate(value: T) -> DataConditionResult:
+                if handler.evaluate_value(value, comparison, data_filter):
+                    return condition_result
+                return None
+
+        else:
+            compare = cast(Callable, op)
+
+            def evaluate(value: T) -> DataConditionResult:
+                if compare(cast(Any, value), comparison):
+                    return condition_result
+                return None
+
+        return evaluate
+
+    def evaluate_value(self, value: T) -> DataConditionResult:
+        return self.get_evaluator()(value)
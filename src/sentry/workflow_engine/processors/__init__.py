@@ -1,7 +1,8 @@
 __all__ = [
     "process_data_sources",
     "process_detectors",
+    "process_detectors_batch",
 ]
 
 from .data_source import process_data_sources
-from .detector import process_detectors
+from .detector import process_detectors, process_detectors_batch
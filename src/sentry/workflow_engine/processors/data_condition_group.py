@@ -1,14 +1,49 @@
 import logging
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from typing import Any, TypeVar
 
+from cachetools import LRUCache
+
 from sentry.utils.function_cache import cache_func_for_models
+from sentry.utils.registry import NoRegistrationExistsError
 from sentry.workflow_engine.models import DataCondition, DataConditionGroup
-from sentry.workflow_engine.types import ProcessedDataConditionResult
+from sentry.workflow_engine.types import DataConditionResult, ProcessedDataConditionResult
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Number of compiled condition groups kept per process
+COMPILED_GROUP_CACHE_SIZE = 10000
+
+
+@dataclass(frozen=True)
+class CompiledCondition:
+    # Position of the condition within the group, results are reported in this order
+    index: int
+    # Conditions with a custom handler may need to query the database or snuba, while the
+    # default operators are a plain comparison
+    is_slow: bool
+    evaluate: Callable[[Any], DataConditionResult]
+
+
+@dataclass(frozen=True)
+class CompiledConditionGroup:
+    # Identifies the version of the conditions this group was compiled from
+    fingerprint: tuple[tuple[Any, ...], ...]
+    # Conditions in the order they were defined
+    conditions: tuple[CompiledCondition, ...]
+    # Conditions ordered cheapest first, used when the order of evaluation does not matter
+    by_cost: tuple[CompiledCondition, ...]
+
+
+_compiled_groups: LRUCache[int, CompiledConditionGroup] = LRUCache(
+    maxsize=COMPILED_GROUP_CACHE_SIZE
+)
+_compiled_groups_lock = threading.Lock()
+
 
 @cache_func_for_models(
     [(DataCondition, lambda condition: (condition.condition_group_id,))],
@@ -18,59 +53,133 @@ def get_data_conditions_for_group(data_condition_group_id: int) -> list[DataCond
     return list(DataCondition.objects.filter(condition_group_id=data_condition_group_id))
 
 
-def evaluate_condition_group(
-    data_condition_group: DataConditionGroup,
-    value: T,
-) -> ProcessedDataConditionResult:
+def _get_fingerprint(conditions: Sequence[DataCondition]) -> tuple[tuple[Any, ...], ...]:
+    return tuple(
+        (
+            condition.id,
+            condition.type,
+            condition.condition,
+            condition.comparison,
+            condition.condition_result,
+        )
+        for condition in conditions
+    )
+
+
+def _is_slow_condition(condition: DataCondition) -> bool:
+    try:
+        condition.get_condition_handler()
+    except NoRegistrationExistsError:
+        return False
+    return True
+
+
+def compile_conditions(conditions: Sequence[DataCondition]) -> CompiledConditionGroup:
     """
-    Evaluate the conditions for a given group and value.
+    Resolve the handlers, operators and results of the conditions once, so evaluating the
+    group only has to call the compiled functions.
+    """
+    compiled = tuple(
+        CompiledCondition(
+            index=index,
+            is_slow=_is_slow_condition(condition),
+            evaluate=condition.get_evaluator(),
+        )
+        for index, condition in enumerate(conditions)
+    )
+
+    return CompiledConditionGroup(
+        fingerprint=_get_fingerprint(conditions),
+        conditions=compiled,
+        # sorted is stable, so conditions of the same cost keep their relative order
+        by_cost=tuple(sorted(compiled, key=lambda condition: condition.is_slow)),
+    )
+
+
+def get_compiled_condition_group(data_condition_group_id: int) -> CompiledConditionGroup:
+    """
+    Returns the compiled conditions for the group, compiling them again whenever a condition
+    was added, removed or updated.
     """
-    results = []
-    conditions = get_data_conditions_for_group(data_condition_group.id)
+    conditions = get_data_conditions_for_group(data_condition_group_id)
+    fingerprint = _get_fingerprint(conditions)
+
+    with _compiled_groups_lock:
+        compiled = _compiled_groups.get(data_condition_group_id)
+
+    if compiled is not None and compiled.fingerprint == fingerprint:
+        return compiled
+
+    compiled = compile_conditions(conditions)
+    with _compiled_groups_lock:
+        _compiled_groups[data_condition_group_id] = compiled
 
-    # TODO - @saponifi3d
-    # Split the conditions into fast and slow conditions
-    # Evaluate the fast conditions first, if any are met, return early
-    # Enqueue the slow conditions to be evaluated later
+    return compiled
 
-    if len(conditions) == 0:
+
+def evaluate_compiled_condition_group(
+    logic_type: str,
+    compiled: CompiledConditionGroup,
+    value: T,
+) -> ProcessedDataConditionResult:
+    if len(compiled.conditions) == 0:
         # if we don't have any conditions, always return True
         return True, []
 
-    for condition in conditions:
-        evaluation_result = condition.evaluate_value(value)
-        is_condition_triggered = evaluation_result is not None
+    if logic_type == DataConditionGroup.Type.ANY_SHORT_CIRCUIT:
+        # The first condition that is met decides the result, so the order of evaluation must
+        # be kept
+        for condition in compiled.conditions:
+            evaluation_result = condition.evaluate(value)
+            if evaluation_result is not None:
+                return True, [evaluation_result]
 
-        if is_condition_triggered:
-            # Check for short-circuiting evaluations
-            if data_condition_group.logic_type == data_condition_group.Type.ANY_SHORT_CIRCUIT:
-                return is_condition_triggered, [evaluation_result]
+        return False, []
 
-            if data_condition_group.logic_type == data_condition_group.Type.NONE:
+    if logic_type == DataConditionGroup.Type.NONE:
+        # Any condition being met is enough to fail, so check the cheap ones first
+        for condition in compiled.by_cost:
+            if condition.evaluate(value) is not None:
                 return False, []
 
-        results.append((is_condition_triggered, evaluation_result))
-
-    if data_condition_group.logic_type == data_condition_group.Type.NONE:
         # if we get to this point, no conditions were met
         return True, []
-    elif data_condition_group.logic_type == data_condition_group.Type.ANY:
-        is_any_condition_met = any([result[0] for result in results])
 
-        if is_any_condition_met:
-            condition_results = [result[1] for result in results if result[0]]
-            return is_any_condition_met, condition_results
-    elif data_condition_group.logic_type == data_condition_group.Type.ALL:
-        conditions_met = [result[0] for result in results]
-        is_all_conditions_met = all(conditions_met)
+    if logic_type == DataConditionGroup.Type.ALL:
+        # Any condition not being met is enough to fail, so check the cheap ones first and
+        # only evaluate the slow ones when all of those passed
+        results: list[tuple[int, DataConditionResult]] = []
+        for condition in compiled.by_cost:
+            evaluation_result = condition.evaluate(value)
+            if evaluation_result is None:
+                return False, []
+            results.append((condition.index, evaluation_result))
 
-        if is_all_conditions_met:
-            condition_results = [result[1] for result in results if result[0]]
-            return is_all_conditions_met, condition_results
+        return True, [evaluation_result for _, evaluation_result in sorted(results)]
+
+    condition_results = []
+    for condition in compiled.conditions:
+        evaluation_result = condition.evaluate(value)
+        if evaluation_result is not None:
+            condition_results.append(evaluation_result)
+
+    if logic_type == DataConditionGroup.Type.ANY and condition_results:
+        return True, condition_results
 
     return False, []
 
 
+def evaluate_condition_group(
+    data_condition_group: DataConditionGroup,
+    value: T,
+) -> ProcessedDataConditionResult:
+    """
+    Evaluate the conditions for a given group and value.
+    """
+    compiled = get_compiled_condition_group(data_condition_group.id)
+    return evaluate_compiled_condition_group(data_condition_group.logic_type, compiled, value)
+
+
 def process_data_condition_group(
     data_condition_group_id: int,
     value: Any,
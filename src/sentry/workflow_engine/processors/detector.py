@@ -68,3 +68,38 @@ def process_detectors(
         handler.commit_state_updates()
 
     return results
+
+
+def process_detectors_batch(
+    data_packets: list[DataPacket], detectors: list[Detector]
+) -> list[tuple[Detector, list[dict[DetectorGroupKey, DetectorEvaluationResult]]]]:
+    """
+    Processes a list of data packets, in order, with each of the detectors. Unlike calling
+    `process_detectors` for each packet, the state of each detector is fetched and committed
+    once for the whole batch.
+
+    Returns the results of each detector that produced any, as a list with the results for
+    each data packet.
+    """
+    results = []
+
+    for detector in detectors:
+        handler = detector.detector_handler
+
+        if not handler:
+            continue
+
+        packet_results = handler.evaluate_batch(data_packets)
+
+        for detector_results in packet_results:
+            for result in detector_results.values():
+                if result.result is not None:
+                    create_issue_occurrence_from_result(result)
+
+        if any(packet_results):
+            results.append((detector, packet_results))
+
+        # Now that we've processed all packets for this detector, commit any state changes
+        handler.commit_state_updates()
+
+    return results
@@ -198,3 +198,31 @@ class TestEqualsConditions:
         not_condition = NotEqualsCondition(property="foo", value=values)
         with pytest.raises(ConditionTypeMismatchException):
             not_condition.match(context=EvaluationContext({"foo": "foo"}), segment_name="test")
+
+
+class TestCompiledConditions:
+    def test_compiled_matches_conditions(self):
+        conditions = [
+            InCondition(property="foo", value=["bAr", 1, 2.5]),
+            NotInCondition(property="foo", value=["bAr", 1, 2.5]),
+            InCondition(property="foo", value="bar"),
+            ContainsCondition(property="foo", value="BAR"),
+            NotContainsCondition(property="foo", value=1),
+            EqualsCondition(property="foo", value="bAr"),
+            NotEqualsCondition(property="foo", value="bAr"),
+            EqualsCondition(property="foo", value=1),
+            NotEqualsCondition(property="foo", value=["bar"]),
+        ]
+        values = ["BaR", "baz", "1", 1, 2.5, True, None, ["bar"], [1], {"k": "v"}]
+
+        for condition in conditions:
+            predicate = condition.compile(segment_name="test")
+            for value in values:
+                context = EvaluationContext({"foo": value})
+                try:
+                    expected = condition.match(context=context, segment_name="test")
+                except ConditionTypeMismatchException:
+                    with pytest.raises(ConditionTypeMismatchException):
+                        predicate(context)
+                else:
+                    assert predicate(context) == expected, (condition, value)
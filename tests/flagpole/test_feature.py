@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from unittest import mock
 
 import jsonschema
 import orjson
@@ -310,6 +311,48 @@ class TestParseFeatureConfig:
         context_builder = self.get_is_true_context_builder(is_true_value=True)
         assert not feature.match(context_builder.build(SimpleTestContextData()))
 
+    def test_feature_config_cached(self):
+        config = """
+            {
+                "owner": "test-user",
+                "segments": []
+            }
+            """
+        feature = Feature.from_feature_config_json("foo", config)
+        assert Feature.from_feature_config_json("foo", config) is feature
+        assert Feature.from_feature_config_json("bar", config) is not feature
+
+    def test_match_memoized_by_context(self):
+        feature = Feature.from_feature_config_json(
+            "memoized",
+            """
+            {
+                "owner": "test-user",
+                "segments": [{
+                    "name": "sentry",
+                    "conditions": [{
+                        "property": "organization_slug",
+                        "operator": "in",
+                        "value": ["sentry"]
+                    }]
+                }]
+            }
+            """,
+        )
+        context_get = EvaluationContext.get
+
+        with mock.patch.object(
+            EvaluationContext, "get", autospec=True, side_effect=context_get
+        ) as mock_get:
+            assert feature.match(EvaluationContext({"organization_slug": "sentry"}))
+            assert feature.match(EvaluationContext({"organization_slug": "sentry"}))
+            assert mock_get.call_count == 1
+
+            # Contexts with other contents are evaluated separately
+            assert not feature.match(EvaluationContext({"organization_slug": "other"}))
+            assert feature.match(EvaluationContext({"organization_slug": "Sentry"}))
+            assert mock_get.call_count == 3
+
     def test_dump_yaml(self):
         feature = Feature.from_feature_config_json(
             "foo",
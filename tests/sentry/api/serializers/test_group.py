@@ -393,6 +393,8 @@ class GroupSerializerTest(TestCase, PerformanceIssueTestCase):
             "info": {
                 "syncCount": 0,
                 "totalEvents": 0,
+                "processedEvents": 0,
+                "eventsPerSecond": result["statusDetails"]["info"]["eventsPerSecond"],
                 "dateCreated": result["statusDetails"]["info"]["dateCreated"],
             },
         }
@@ -10,6 +10,7 @@ from sentry.models.files.file import File
 from sentry.search.events.constants import TIMEOUT_ERROR_MESSAGE
 from sentry.testutils.cases import SnubaTestCase, TestCase
 from sentry.testutils.helpers.datetime import before_now
+from sentry.testutils.helpers.options import override_options
 from sentry.utils.samples import load_data
 from sentry.utils.snuba import (
     DatasetSelectionError,
@@ -229,6 +230,28 @@ class AssembleDownloadTest(TestCase, SnubaTestCase):
 
         assert emailer.called
 
+    @patch("sentry.data_export.models.ExportedData.email_success")
+    def test_discover_batched_fetch_concurrency(self, emailer):
+        de = ExportedData.objects.create(
+            user_id=self.user.id,
+            organization=self.org,
+            query_type=ExportQueryType.DISCOVER,
+            query_info={"project": [self.project.id], "field": ["title"], "query": ""},
+        )
+        with self.tasks(), override_options({"dataexport.fetch-concurrency": 4}):
+            assemble_download(de.id, batch_size=1)
+        de = ExportedData.objects.get(id=de.id)
+        assert de.file_id is not None
+        file = de._get_file()
+        with file.getfile() as f:
+            header, *rows = f.read().strip().split(b"\r\n")
+        assert header == b"title"
+        # Fragments fetched past the end of the export aren't written
+        assert len(rows) == 3
+        assert all(row.startswith(b"<unlabeled event>") for row in rows)
+
+        assert emailer.called
+
     @patch("sentry.data_export.models.ExportedData.email_success")
     def test_discover_respects_selected_environment(self, emailer):
         de = ExportedData.objects.create(
@@ -0,0 +1,92 @@
+from sentry import deletions
+from sentry.deletions.base import ModelDeletionTask
+from sentry.models.activity import Activity
+from sentry.testutils.cases import TestCase
+from sentry.types.activity import ActivityType
+
+
+class ModelDeletionTaskTest(TestCase):
+    def create_activities(self, count: int) -> list[Activity]:
+        return [
+            Activity.objects.create(
+                group=self.group,
+                project=self.project,
+                type=ActivityType.NOTE.value,
+                data={"text": str(i)},
+            )
+            for i in range(count)
+        ]
+
+    def test_chunk_resumes_after_last_deleted_id(self):
+        activities = self.create_activities(5)
+        other = self.create_activities(1)[0]
+
+        task = deletions.get(
+            task=ModelDeletionTask,
+            model=Activity,
+            query={"id__in": [a.id for a in activities]},
+            query_limit=2,
+            chunk_size=4,
+        )
+        assert isinstance(task, ModelDeletionTask)
+
+        assert task.chunk()
+        assert task.last_deleted_id == activities[3].id
+        assert list(Activity.objects.filter(project=self.project).order_by("id")) == [
+            activities[4],
+            other,
+        ]
+
+        assert not task.chunk()
+        assert task.last_deleted_id == activities[4].id
+        assert list(Activity.objects.filter(project=self.project)) == [other]
+
+    def test_chunk_with_order_by_does_not_track_cursor(self):
+        activities = self.create_activities(3)
+
+        task = deletions.get(
+            task=ModelDeletionTask,
+            model=Activity,
+            query={"id__in": [a.id for a in activities]},
+            order_by="-id",
+        )
+        assert isinstance(task, ModelDeletionTask)
+
+        while task.chunk():
+            pass
+
+        assert task.last_deleted_id is None
+        assert not Activity.objects.filter(id__in=[a.id for a in activities]).exists()
+
+    def test_chunk_resumes_from_last_deleted_id_kwarg(self):
+        activities = self.create_activities(4)
+
+        task = deletions.get(
+            task=ModelDeletionTask,
+            model=Activity,
+            query={"id__in": [a.id for a in activities]},
+            last_deleted_id=activities[1].id,
+        )
+        assert isinstance(task, ModelDeletionTask)
+
+        assert not task.chunk()
+        assert task.last_deleted_id == activities[3].id
+        assert list(Activity.objects.filter(project=self.project).order_by("id")) == activities[:2]
+
+    def test_chunk_without_id_filter_does_not_track_cursor(self):
+        self.create_activities(3)
+
+        task = deletions.get(
+            task=ModelDeletionTask,
+            model=Activity,
+            query={"project_id": self.project.id},
+            query_limit=2,
+            chunk_size=2,
+        )
+        assert isinstance(task, ModelDeletionTask)
+
+        while task.chunk():
+            pass
+
+        assert task.last_deleted_id is None
+        assert not Activity.objects.filter(project=self.project).exists()
@@ -422,6 +422,41 @@ class SnubaEventStreamTest(TestCase, SnubaTestCase, OccurrenceTestMixin):
         assert ("occurrence_id", group_event.occurrence.id.encode()) in headers
         assert body["queue"] == "post_process_issue_platform"
 
+    def test_batch_defers_poll(self):
+        producer = self.producer_mock
+
+        with self.kafka_eventstream.batch():
+            for _ in range(3):
+                self.kafka_eventstream._send(self.project.id, "insert", extra_data=({},))
+
+            assert producer.produce.call_count == 3
+            assert not producer.poll.called
+
+        producer.poll.assert_called_once_with(0.0)
+        assert not producer.flush.called
+
+        # Outside of a batch every message polls again.
+        self.kafka_eventstream._send(self.project.id, "insert", extra_data=({},))
+        assert producer.poll.call_count == 2
+
+    def test_batch_flushes_once_for_synchronous_sends(self):
+        producer = self.producer_mock
+
+        with self.kafka_eventstream.batch():
+            self.kafka_eventstream._send(self.project.id, "insert", extra_data=({},))
+            self.kafka_eventstream._send(
+                self.project.id, "insert", extra_data=({},), asynchronous=False
+            )
+            with self.kafka_eventstream.batch():
+                self.kafka_eventstream._send(
+                    self.project.id, "insert", extra_data=({},), asynchronous=False
+                )
+
+            assert not producer.flush.called
+
+        producer.flush.assert_called_once_with()
+        assert not producer.poll.called
+
     def test_insert_generic_event_contexts(self):
         create_default_projects()
         es = SnubaProtocolEventStream()
@@ -357,6 +357,70 @@ class FeatureManagerTest(TestCase):
         for project in projects:
             assert result[f"project:{project.id}"]["projects:feature"]
 
+    def test_batch_has_no_entity_checks_projects_in_batches(self):
+        checks = []
+
+        class OrganizationHandler(features.BatchFeatureHandler):
+            features = {"projects:feature", "projects:other"}
+
+            def _check_for_batch(self, feature_name, organization, actor):
+                checks.append((feature_name, organization.id))
+                return feature_name == "projects:feature"
+
+        manager = features.FeatureManager()
+        manager.add("projects:feature", ProjectFeature)
+        manager.add("projects:other", ProjectFeature)
+        manager.add("projects:unhandled", ProjectFeature)
+        manager.add_handler(OrganizationHandler())
+        other_org = self.create_organization()
+        projects = [
+            self.project,
+            self.create_project(organization=self.organization),
+            self.create_project(organization=other_org),
+        ]
+
+        result = manager.batch_has(
+            ["projects:feature", "projects:other", "projects:unhandled"],
+            actor=self.user,
+            projects=projects,
+        )
+        assert result == {
+            f"project:{project.id}": {
+                "projects:feature": True,
+                "projects:other": False,
+                "projects:unhandled": False,
+            }
+            for project in projects
+        }
+        # Once per feature and organization, as opposed to once per project
+        assert sorted(checks) == sorted(
+            (feature_name, org.id)
+            for feature_name in ("projects:feature", "projects:other")
+            for org in (self.organization, other_org)
+        )
+
+    def test_batch_feature_handler_batch_has(self):
+        checks = []
+
+        class OrganizationHandler(features.BatchFeatureHandler):
+            features = {"projects:feature", "organizations:feature"}
+
+            def _check_for_batch(self, feature_name, organization, actor):
+                checks.append(feature_name)
+                return True
+
+        handler = OrganizationHandler()
+        projects = [self.project, self.create_project(organization=self.organization)]
+
+        assert handler.batch_has(
+            ["projects:feature", "projects:unhandled"], self.user, projects=projects
+        ) == {f"project:{project.id}": {"projects:feature": True} for project in projects}
+        assert checks == ["projects:feature"]
+
+        assert handler.batch_has(
+            ["organizations:feature"], self.user, organization=self.organization
+        ) == {f"organization:{self.organization.id}": {"organizations:feature": True}}
+
     def test_has(self):
         manager = features.FeatureManager()
         manager.add("auth:register")
@@ -1,10 +1,11 @@
+from unittest.mock import patch
 from urllib.parse import urlencode
 
 import responses
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test.client import RequestFactory
 
-from sentry.hybridcloud.apigateway.proxy import proxy_request
+from sentry.hybridcloud.apigateway.proxy import _get_region_session, proxy_request
 from sentry.silo.util import INVALID_OUTBOUND_HEADERS, PROXY_DIRECT_LOCATION_HEADER
 from sentry.testutils.helpers.apigateway import (
     ApiGatewayTestCase,
@@ -12,6 +13,7 @@ from sentry.testutils.helpers.apigateway import (
     verify_request_body,
     verify_request_headers,
 )
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.helpers.response import close_streaming_response
 from sentry.testutils.silo import control_silo_test
 from sentry.utils import json
@@ -233,3 +235,46 @@ class ProxyTestCase(ApiGatewayTestCase):
 
         resp = proxy_request(request, self.organization.slug, url_name)
         assert not any([header in resp for header in INVALID_OUTBOUND_HEADERS])
+
+    @responses.activate
+    def test_session_reuse_drops_cookies(self) -> None:
+        responses.add(
+            responses.GET,
+            "http://us.internal.sentry.io/cookie",
+            body=json.dumps({"proxy": True}),
+            content_type="application/json",
+            adding_headers={"Set-Cookie": "session=secret; Path=/"},
+        )
+
+        request = RequestFactory().get("http://sentry.io/cookie")
+        resp = proxy_request(request, self.organization.slug, url_name)
+        close_streaming_response(resp)
+        assert resp["Set-Cookie"] == "session=secret; Path=/"
+        session = _get_region_session(self.REGION)
+
+        request = RequestFactory().get("http://sentry.io/get")
+        resp = proxy_request(request, self.organization.slug, url_name)
+        close_streaming_response(resp)
+        assert _get_region_session(self.REGION) is session
+
+        # Cookies of one user's response are not sent with another user's request
+        assert "Cookie" not in responses.calls[1].request.headers
+
+    @responses.activate
+    @patch("sentry.hybridcloud.apigateway.proxy.REGION_SLOT_TIMEOUT", 0)
+    def test_region_concurrency_limit(self) -> None:
+        request = RequestFactory().get("http://sentry.io/get")
+        with override_options(
+            {"hybridcloud.apigateway.region-concurrency-limits": {self.REGION.name: 1}}
+        ):
+            # The slot is held until the response body has been relayed
+            first = proxy_request(request, self.organization.slug, url_name)
+            assert first.status_code == 200
+
+            limited = proxy_request(request, self.organization.slug, url_name)
+            assert limited.status_code == 503
+
+            first.close()
+            resp = proxy_request(request, self.organization.slug, url_name)
+            assert resp.status_code == 200
+            assert json.loads(close_streaming_response(resp))["proxy"]
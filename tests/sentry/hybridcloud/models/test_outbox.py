@@ -7,6 +7,7 @@ from unittest.mock import Mock, call, patch
 
 import pytest
 from django.db import connections
+from django.db.models import Max
 from django.test import RequestFactory
 from pytest import raises
 
@@ -479,6 +480,27 @@ class RegionOutboxTest(TestCase):
             (OutboxScope.ORGANIZATION_SCOPE.value, org2.id),
         }
 
+    def test_find_scheduled_shards_deepest_first(self) -> None:
+        org1 = Factories.create_organization()
+        org2 = Factories.create_organization()
+
+        with outbox_context(flush=False):
+            Organization(id=org1.id).outbox_for_update().save()
+            OrganizationMember(organization_id=org2.id, id=1).outbox_for_update().save()
+            OrganizationMember(organization_id=org2.id, id=2).outbox_for_update().save()
+            hi = RegionOutbox.objects.aggregate(Max("id"))["id__max"] + 1
+            OrganizationMember(organization_id=org1.id, id=3).outbox_for_update().save()
+            OrganizationMember(organization_id=org1.id, id=4).outbox_for_update().save()
+
+        def shard_ids(**kwargs: Any) -> list[int]:
+            return [row["shard_identifier"] for row in RegionOutbox.find_scheduled_shards(**kwargs)]
+
+        assert shard_ids() == [org1.id, org2.id]
+        assert shard_ids(deepest_first=True) == [org1.id, org2.id]
+        # Depths only count the messages in the id range
+        assert shard_ids(hi=hi) == [org1.id, org2.id]
+        assert shard_ids(hi=hi, deepest_first=True) == [org2.id, org1.id]
+
     def test_scheduling_with_future_outbox_time(self) -> None:
         with outbox_runner():
             pass
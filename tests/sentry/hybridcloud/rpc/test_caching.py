@@ -1,5 +1,7 @@
 from collections.abc import Generator, Iterator
+from concurrent.futures import Future
 from random import Random
+from unittest.mock import Mock, patch
 
 from django.core.cache import cache
 
@@ -10,7 +12,17 @@ from sentry.hybridcloud.rpc.caching import (
     control_caching_service,
     region_caching_service,
 )
-from sentry.hybridcloud.rpc.caching.impl import CacheBackend, _consume_generator
+from sentry.hybridcloud.rpc.caching.impl import (
+    CacheBackend,
+    _consume_generator,
+    _delete_local,
+    _fill_coalesced,
+    _fill_many_coalesced,
+    _get_local_many,
+    _inflight_fills,
+    _local_cache,
+    _set_local,
+)
 from sentry.organizations.services.organization.model import (
     RpcOrganizationMember,
     RpcOrganizationSummary,
@@ -18,6 +30,7 @@ from sentry.organizations.services.organization.model import (
 from sentry.organizations.services.organization.service import organization_service
 from sentry.silo.base import SiloMode
 from sentry.testutils.factories import Factories
+from sentry.testutils.helpers import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.testutils.silo import assume_test_silo_mode, control_silo_test, no_silo_test
 from sentry.types.region import get_local_region
@@ -327,3 +340,125 @@ def test_caching_list() -> None:
 
     cached_members = get_org_members(org.id)
     assert len(cached_members) == 0, "with members updated none are owners"
+
+
+@django_db_all(transaction=True)
+@override_options({"hybridcloud.caching.local_ttl": 60.0})
+def test_local_cache() -> None:
+    cache.clear()
+    _local_cache.clear()
+
+    @back_with_silo_cache(base_key="my-local-key", silo_mode=SiloMode.REGION, t=RpcUser)
+    def get_user(user_id: int) -> RpcUser:
+        return user_service.get_many(filter=dict(user_ids=[user_id]))[0]
+
+    user = Factories.create_user()
+    cached = get_user(user.id)
+    assert cached
+
+    # Served from process memory without reading versions or the shared cache
+    with patch("sentry.hybridcloud.rpc.caching.impl.cache") as shared_cache:
+        assert get_user(user.id) == cached
+        assert not shared_cache.get_many.called
+
+    with assume_test_silo_mode(SiloMode.CONTROL):
+        user.update(username=user.username + "moocow")
+
+    # Bumping the version drops the local copy
+    region_caching_service.clear_key(
+        region_name=get_local_region().name, key=get_user.key_from(user.id)
+    )
+    updated = get_user(user.id)
+    assert updated
+    assert updated.username == user.username
+
+
+@override_options({"hybridcloud.caching.local_ttl": 60.0})
+def test_local_cache_rejects_older_versions() -> None:
+    _local_cache.clear()
+
+    _set_local("key", "new", 2)
+    _set_local("key", "old", 1)
+    assert _get_local_many(["key"]) == {"key": "new"}
+
+    # A version bump made by this process hides the value, and keeps concurrent readers
+    # from storing values they read at the previous version
+    _delete_local("key", 3)
+    _set_local("key", "new", 2)
+    assert _get_local_many(["key"]) == {}
+
+    _set_local("key", "newer", 3)
+    assert _get_local_many(["key"]) == {"key": "newer"}
+
+
+@override_options({"hybridcloud.caching.coalesce_fills": True})
+def test_fill_coalesced() -> None:
+    future: Future[list[int]] = Future()
+    future.set_result([1, 2])
+    _inflight_fills["key.1"] = future
+
+    try:
+        cb = Mock()
+        result = _fill_coalesced("key", 1, cb)
+        assert result == [1, 2]
+        assert result is not future.result()
+        assert not cb.called
+    finally:
+        _inflight_fills.pop("key.1", None)
+
+    assert _fill_coalesced("key", 2, lambda: [3]) == [3]
+    assert "key.2" not in _inflight_fills
+
+
+@override_options({"hybridcloud.caching.coalesce_fills": True})
+def test_fill_many_coalesced() -> None:
+    filling: Future[list[int] | None] = Future()
+    filling.set_result([1])
+    _inflight_fills["key:1.1"] = filling
+    missing: Future[list[int] | None] = Future()
+    missing.set_result(None)
+    _inflight_fills["key:2.1"] = missing
+
+    try:
+        cb = Mock(return_value={3: [3]})
+        result = _fill_many_coalesced(
+            {1: ("key:1", 1), 2: ("key:2", 1), 3: ("key:3", 1), 4: ("key:4", 1)}, cb
+        )
+        assert result == {1: [1], 3: [3]}
+        assert result[1] is not filling.result()
+        cb.assert_called_once_with([3, 4])
+    finally:
+        _inflight_fills.pop("key:1.1", None)
+        _inflight_fills.pop("key:2.1", None)
+
+    assert "key:3.1" not in _inflight_fills
+    assert "key:4.1" not in _inflight_fills
+
+
+@django_db_all(transaction=True)
+@override_options({"hybridcloud.caching.coalesce_fills": True})
+def test_caching_many_coalesced() -> None:
+    cache.clear()
+    cb = Mock(side_effect=lambda user_ids: user_service.get_many(filter=dict(user_ids=user_ids)))
+    get_users = back_with_silo_cache_many(
+        base_key="get_users", silo_mode=SiloMode.REGION, t=RpcUser
+    )(cb)
+
+    users = [Factories.create_user() for _ in range(2)]
+    cache_keys = [get_users.key_from(user.id) for user in users]
+    versions = _consume_generator(CacheBackend.get_cache(cache_keys, SiloMode.REGION))
+
+    # Another thread is already fetching the first user
+    filling: Future[RpcUser | None] = Future()
+    filling.set_result(get_users.cb([users[0].id])[0])
+    versioned_key = f"{cache_keys[0]}.{versions[cache_keys[0]]}"
+    _inflight_fills[versioned_key] = filling
+    cb.reset_mock()
+
+    try:
+        result = get_users([user.id for user in users])
+    finally:
+        _inflight_fills.pop(versioned_key, None)
+
+    assert [user.id for user in result] == [user.id for user in users]
+    cb.assert_called_once_with([users[1].id])
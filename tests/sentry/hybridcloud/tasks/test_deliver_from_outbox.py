@@ -0,0 +1,30 @@
+from unittest.mock import patch
+
+from sentry.hybridcloud.models.outbox import RegionOutbox
+from sentry.hybridcloud.outbox.category import OutboxScope
+from sentry.hybridcloud.tasks.deliver_from_outbox import process_outbox_batch
+from sentry.testutils.helpers import override_options
+
+
+def shard(identifier: int) -> dict[str, int]:
+    return {"shard_scope": OutboxScope.ORGANIZATION_SCOPE, "shard_identifier": identifier}
+
+
+@patch("sentry.hybridcloud.tasks.deliver_from_outbox.connections")
+@patch("sentry.hybridcloud.tasks.deliver_from_outbox._process_shard")
+@patch.object(RegionOutbox, "find_scheduled_shards")
+def test_process_outbox_batch_concurrently(mock_find, mock_process_shard, mock_connections) -> None:
+    shards = [shard(identifier) for identifier in range(10)]
+    mock_find.return_value = shards
+    # Shards that were locked by another drain aren't counted
+    mock_process_shard.side_effect = lambda attributes, model: attributes["shard_identifier"] % 2
+
+    with override_options({"hybridcloud.outbox.drain_shard_concurrency": 4}):
+        assert process_outbox_batch(100, 0, RegionOutbox) == 5
+
+    mock_find.assert_called_once_with(0, 100, deepest_first=True)
+    assert sorted(
+        call.args[0]["shard_identifier"] for call in mock_process_shard.call_args_list
+    ) == list(range(10))
+    # Connections are closed once per worker thread rather than once per shard
+    assert mock_connections.close_all.call_count == 4
@@ -46,9 +46,12 @@ from sentry.incidents.subscription_processor import (
     build_alert_rule_trigger_stat_key,
     build_trigger_stat_keys,
     get_alert_rule_stats,
+    get_alert_rule_stats_many,
     get_redis_client,
     partition,
+    process_updates,
     update_alert_rule_stats,
+    update_alert_rule_stats_many,
 )
 from sentry.incidents.utils.types import AlertRuleActivationConditionType
 from sentry.issues.grouptype import MetricIssuePOC
@@ -65,6 +68,7 @@ from sentry.sentry_metrics.indexer.postgres.models import MetricsKeyIndexer
 from sentry.sentry_metrics.utils import resolve_tag_key
 from sentry.snuba.dataset import Dataset
 from sentry.snuba.models import QuerySubscription, SnubaQuery, SnubaQueryEventType
+from sentry.snuba.query_subscriptions.consumer import BatchPartiallyHandledError
 from sentry.testutils.cases import BaseMetricsTestCase, SnubaTestCase, TestCase
 from sentry.testutils.factories import DEFAULT_EVENT_DATA
 from sentry.testutils.helpers.alert_rule import TemporaryAlertRuleTriggerActionRegistry
@@ -72,6 +76,8 @@ from sentry.testutils.helpers.datetime import freeze_time
 from sentry.testutils.helpers.features import with_feature
 from sentry.types.group import PriorityLevel
 from sentry.utils import json
+from sentry.utils.dates import to_datetime
+from sentry.utils.snuba import bulk_snuba_queries
 
 EMPTY = object()
 
@@ -2956,6 +2962,162 @@ class ProcessUpdateTest(ProcessUpdateBaseClass):
         assert status_change.new_status == GroupStatus.RESOLVED
         assert occurrence.fingerprint == status_change.fingerprint
 
+    def send_updates(self, updates):
+        self.email_action_handler.reset_mock()
+        with (
+            self.feature(["organizations:incidents", "organizations:performance-view"]),
+            self.capture_on_commit_callbacks(execute=True),
+        ):
+            process_updates(updates)
+
+    def test_process_updates(self):
+        rule = self.rule
+        trigger = self.trigger
+        rule.update(threshold_period=2)
+        alert_update = self.build_subscription_update(
+            self.sub, value=trigger.alert_threshold + 1, time_delta=timedelta(minutes=-2)
+        )
+        other_update = self.build_subscription_update(
+            self.other_sub, value=trigger.alert_threshold + 1, time_delta=timedelta(minutes=-2)
+        )
+
+        # The trigger count of the first update is carried over to the second one
+        self.send_updates(
+            [
+                (alert_update, self.sub),
+                (other_update, self.other_sub),
+                (
+                    self.build_subscription_update(
+                        self.sub,
+                        value=trigger.alert_threshold + 1,
+                        time_delta=timedelta(minutes=-1),
+                    ),
+                    self.sub,
+                ),
+                # Already processed
+                (alert_update, self.sub),
+            ]
+        )
+        incident = self.assert_active_incident(rule)
+        self.assert_trigger_exists_with_status(incident, trigger, TriggerStatus.ACTIVE)
+        self.assert_actions_fired_for_incident(
+            incident,
+            [self.action],
+            [(trigger.alert_threshold + 1, IncidentStatus.CRITICAL, mock.ANY)],
+        )
+        self.assert_no_active_incident(rule, self.other_sub)
+
+        last_update, alert_counts, resolve_counts = get_alert_rule_stats(rule, self.sub, [trigger])
+        assert last_update == timezone.now().replace(microsecond=0) - timedelta(minutes=1)
+        assert alert_counts == {trigger.id: 0}
+        assert resolve_counts == {trigger.id: 0}
+        assert get_alert_rule_stats(rule, self.other_sub, [trigger])[1] == {trigger.id: 1}
+
+    def test_process_updates_stats_write_failure(self):
+        rule = self.rule
+        trigger = self.trigger
+        update = self.build_subscription_update(
+            self.sub, value=trigger.alert_threshold + 1, time_delta=timedelta(minutes=-1)
+        )
+
+        with mock.patch(
+            "sentry.incidents.subscription_processor.update_alert_rule_stats_many",
+            side_effect=Exception("redis unavailable"),
+        ):
+            # The action already fired, so the batch isn't reported as failed
+            self.send_updates([(update, self.sub)])
+
+        incident = self.assert_active_incident(rule)
+        self.assert_actions_fired_for_incident(
+            incident,
+            [self.action],
+            [(trigger.alert_threshold + 1, IncidentStatus.CRITICAL, mock.ANY)],
+        )
+
+    def test_process_updates_partially_handled(self):
+        rule = self.rule
+        trigger = self.trigger
+        alert_update = self.build_subscription_update(
+            self.sub, value=trigger.alert_threshold + 1, time_delta=timedelta(minutes=-2)
+        )
+        other_update = self.build_subscription_update(
+            self.other_sub, value=trigger.alert_threshold + 1, time_delta=timedelta(minutes=-1)
+        )
+
+        init = SubscriptionProcessor.__init__
+
+        def fail_for_other_sub(processor, subscription, *args, **kwargs):
+            if subscription == self.other_sub:
+                raise Exception("failed to load processor")
+            init(processor, subscription, *args, **kwargs)
+
+        with (
+            mock.patch.object(SubscriptionProcessor, "__init__", fail_for_other_sub),
+            pytest.raises(BatchPartiallyHandledError) as excinfo,
+        ):
+            self.send_updates([(alert_update, self.sub), (other_update, self.other_sub)])
+
+        # Only the update that wasn't handled is left for the fallback
+        assert list(excinfo.value.unhandled) == [(other_update, self.other_sub)]
+        incident = self.assert_active_incident(rule)
+        self.assert_actions_fired_for_incident(
+            incident,
+            [self.action],
+            [(trigger.alert_threshold + 1, IncidentStatus.CRITICAL, mock.ANY)],
+        )
+        # The stats of the handled update were still written
+        last_update = get_alert_rule_stats(rule, self.sub, [trigger])[0]
+        assert last_update == timezone.now().replace(microsecond=0) - timedelta(minutes=2)
+
+    def test_process_updates_removed_alert_rule(self):
+        message = self.build_subscription_update(self.sub)
+        self.rule.delete()
+        subscription_id = self.sub.id
+        with self.tasks():
+            self.send_updates([(message, self.sub)])
+        assert not QuerySubscription.objects.filter(id=subscription_id).exists()
+
+    def test_process_updates_comparison_alert(self):
+        rule = self.comparison_rule_above
+        trigger = self.trigger
+        comparison_date = timezone.now() - timedelta(seconds=rule.comparison_delta)
+        for i in range(4):
+            self.store_event(
+                data={"timestamp": (comparison_date - timedelta(minutes=30 + i)).isoformat()},
+                project_id=self.project.id,
+            )
+
+        with mock.patch(
+            "sentry.incidents.subscription_processor.bulk_snuba_queries",
+            wraps=bulk_snuba_queries,
+        ) as mock_bulk_snuba_queries:
+            self.send_updates(
+                [
+                    # 6/4 == 150%, but we want > 150%
+                    (
+                        self.build_subscription_update(
+                            self.sub, value=6, time_delta=timedelta(minutes=-7)
+                        ),
+                        self.sub,
+                    ),
+                    # 7/4 == 175% > 150%
+                    (
+                        self.build_subscription_update(
+                            self.sub, value=7, time_delta=timedelta(minutes=-6)
+                        ),
+                        self.sub,
+                    ),
+                ]
+            )
+        assert mock_bulk_snuba_queries.call_count == 1
+        assert len(mock_bulk_snuba_queries.call_args[0][0]) == 2
+
+        incident = self.assert_active_incident(rule)
+        self.assert_trigger_exists_with_status(incident, trigger, TriggerStatus.ACTIVE)
+        self.assert_actions_fired_for_incident(
+            incident, [self.action], [(175.0, IncidentStatus.CRITICAL, mock.ANY)]
+        )
+
 
 class MetricsCrashRateAlertProcessUpdateTest(ProcessUpdateBaseClass, BaseMetricsTestCase):
     @pytest.fixture(autouse=True)
@@ -3692,3 +3854,47 @@ class TestUpdateAlertRuleStats(TestCase):
         ]
 
         assert results == [int(date.timestamp()), 20, 10, 3, 15]
+
+
+class TestGetAlertRuleStatsMany(TestCase):
+    def test(self):
+        sub = QuerySubscription(project_id=2)
+        timestamp = timezone.now().replace(microsecond=0)
+        update_alert_rule_stats(AlertRule(id=1), sub, timestamp, {3: 1}, {3: 2})
+
+        stats = get_alert_rule_stats_many(
+            [
+                (AlertRule(id=1), sub, [AlertRuleTrigger(id=3)]),
+                (AlertRule(id=5), sub, [AlertRuleTrigger(id=6), AlertRuleTrigger(id=7)]),
+            ]
+        )
+        assert stats == [
+            (timestamp, {3: 1}, {3: 2}),
+            (to_datetime(0), {6: 0, 7: 0}, {6: 0, 7: 0}),
+        ]
+
+
+class TestUpdateAlertRuleStatsMany(TestCase):
+    def test(self):
+        sub = QuerySubscription(project_id=2)
+        date = timezone.now()
+        update_alert_rule_stats_many(
+            [
+                (AlertRule(id=1), sub, (date, {3: 20}, {})),
+                (AlertRule(id=5), sub, (date, {}, {6: 4})),
+            ]
+        )
+        results = get_redis_client().mget(
+            [
+                "{alert_rule:1:project:2}:last_update",
+                "{alert_rule:1:project:2}:trigger:3:alert_triggered",
+                "{alert_rule:5:project:2}:last_update",
+                "{alert_rule:5:project:2}:trigger:6:resolve_triggered",
+            ]
+        )
+        assert [int(result) for result in results] == [
+            int(date.timestamp()),
+            20,
+            int(date.timestamp()),
+            4,
+        ]
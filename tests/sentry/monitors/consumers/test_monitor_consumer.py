@@ -19,7 +19,11 @@ from sentry.constants import ObjectStatus
 from sentry.db.models import BoundedPositiveIntegerField
 from sentry.models.environment import Environment
 from sentry.monitors.constants import TIMEOUT, PermitCheckInStatus
-from sentry.monitors.consumers.monitor_consumer import StoreMonitorCheckInStrategyFactory
+from sentry.monitors.consumers.monitor_consumer import (
+    StoreMonitorCheckInStrategyFactory,
+    preload_monitors,
+    process_checkin_group,
+)
 from sentry.monitors.models import (
     CheckInStatus,
     Monitor,
@@ -248,6 +252,65 @@ class MonitorConsumerTest(TestCase):
         # The last group is monitor_2 but with a diff environment
         assert group_3[0].payload.get("environment") == "test"
 
+    def create_checkin_item(self, monitor_slug: str, **overrides: Any) -> CheckinItem:
+        payload = {
+            "monitor_slug": monitor_slug,
+            "status": "ok",
+            "duration": None,
+            "check_in_id": uuid.uuid4().hex,
+            "environment": "production",
+        }
+        payload.update(overrides)
+
+        ts = datetime.now()
+        wrapper: CheckIn = {
+            "message_type": "check_in",
+            "start_time": ts.timestamp(),
+            "project_id": self.project.id,
+            "payload": json.dumps(payload),
+            "sdk": "test/1.0",
+            "retention_days": 90,
+        }
+        return CheckinItem(ts, self.partition.index, wrapper, payload)  # type: ignore[arg-type]
+
+    def test_preload_monitors(self) -> None:
+        monitor_1 = self._create_monitor(slug="my-monitor-1")
+        monitor_2 = self._create_monitor(slug="my-monitor-2")
+        other_project = self.create_project()
+
+        items = [
+            self.create_checkin_item(monitor_1.slug),
+            self.create_checkin_item(monitor_2.slug, environment="test"),
+            self.create_checkin_item("unknown-monitor"),
+        ]
+        other_item = self.create_checkin_item(monitor_1.slug)
+        other_item.message["project_id"] = other_project.id
+
+        with self.assertNumQueries(1):
+            preloaded = preload_monitors([*items, other_item])
+
+        assert preloaded == {
+            (self.project.id, monitor_1.slug): monitor_1,
+            (self.project.id, monitor_2.slug): monitor_2,
+        }
+        assert preload_monitors([]) == {}
+
+    def test_process_checkin_group_preloaded_monitor(self) -> None:
+        monitor = self._create_monitor(slug="my-monitor")
+        items = [
+            self.create_checkin_item(monitor.slug, status="in_progress"),
+            self.create_checkin_item(monitor.slug),
+        ]
+
+        preloaded_monitor = Monitor.objects.get(id=monitor.id)
+        with mock.patch.object(Monitor.objects, "get", wraps=Monitor.objects.get) as monitor_get:
+            process_checkin_group(items, preloaded_monitor)
+
+        # The monitor was not looked up by its slug again
+        assert not any("slug" in call.kwargs for call in monitor_get.call_args_list)
+
+        assert MonitorCheckIn.objects.filter(monitor=monitor).count() == 2
+
     def test_passing(self) -> None:
         monitor = self._create_monitor(slug="my-monitor")
         self.send_checkin(monitor.slug)
@@ -487,6 +487,20 @@ class BaseUpdateMonitorTest(MonitorTestCase):
             second=0, microsecond=0
         ) + timedelta(minutes=TIMEOUT)
 
+    @patch("sentry.monitors.endpoints.base_monitor_details.timing_wheel.schedule_monitor")
+    def test_config_change_schedules_timing_wheel(self, mock_schedule_monitor):
+        monitor = self._create_monitor()
+
+        self.get_success_response(
+            self.organization.slug, monitor.slug, method="PUT", **{"name": "renamed"}
+        )
+        assert not mock_schedule_monitor.called
+
+        self.get_success_response(
+            self.organization.slug, monitor.slug, method="PUT", **{"config": {"max_runtime": 15}}
+        )
+        mock_schedule_monitor.assert_called_once_with(monitor.id)
+
     def test_existing_issue_alert_rule(self):
         monitor = self._create_monitor()
         rule = self._create_issue_alert_rule(monitor)
@@ -0,0 +1,18 @@
+from unittest import mock
+
+from sentry.locks import locks
+from sentry.monitors.tasks.rebuild_timing_wheel import rebuild_timing_wheel
+
+
+@mock.patch("sentry.monitors.tasks.rebuild_timing_wheel.timing_wheel.maybe_rebuild")
+def test_rebuild_timing_wheel(mock_maybe_rebuild):
+    rebuild_timing_wheel()
+    assert mock_maybe_rebuild.call_count == 1
+
+
+@mock.patch("sentry.monitors.tasks.rebuild_timing_wheel.timing_wheel.maybe_rebuild")
+def test_rebuild_timing_wheel_in_progress(mock_maybe_rebuild):
+    lock = locks.get("monitors:rebuild_timing_wheel", duration=60, name="monitors")
+    with lock.acquire():
+        rebuild_timing_wheel()
+    assert not mock_maybe_rebuild.called
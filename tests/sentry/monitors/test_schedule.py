@@ -74,3 +74,64 @@ def test_get_prev_schedule():
 
     # 2 hour interval: (start = 1:30) 5:35 -> 5:30
     assert get_prev_schedule(start_ts, t(5, 35), IntervalSchedule(2, "hour")) == t(5, 30)
+
+
+def test_get_next_schedule_minute_crontab():
+    # */15 * * * *: 5:44 -> 5:45
+    assert get_next_schedule(t(5, 44), CrontabSchedule("*/15 * * * *")) == t(5, 45)
+
+    # 0,20 * * * *: 5:45 -> 6:00
+    assert get_next_schedule(t(5, 45), CrontabSchedule("0,20 * * * *")) == t(6, 0)
+
+    # Timezones with a non-hour offset use the minute of the local time
+    assert get_next_schedule(
+        datetime(2024, 1, 1, 5, 10, 0, tzinfo=ZoneInfo("Asia/Kolkata")),
+        CrontabSchedule("0 * * * *"),
+    ) == datetime(2024, 1, 1, 6, 0, 0, tzinfo=ZoneInfo("Asia/Kolkata"))
+
+    # Lord Howe moves its clock by 30 minutes at DST end
+    assert get_next_schedule(
+        datetime(2024, 4, 7, 1, 50, 0, fold=0, tzinfo=ZoneInfo("Australia/Lord_Howe")),
+        CrontabSchedule("0 * * * *"),
+    ) == datetime(2024, 4, 7, 2, 0, 0, tzinfo=ZoneInfo("Australia/Lord_Howe"))
+
+
+def test_get_prev_schedule_minute_crontab():
+    start_ts = datetime(2019, 1, 1, 1, 30, 0, tzinfo=timezone.utc)
+
+    # */15 * * * *: 5:45 -> 5:30
+    assert get_prev_schedule(start_ts, t(5, 45), CrontabSchedule("*/15 * * * *")) == t(5, 30)
+
+    # 20,40 * * * *: 5:10 -> 4:40
+    assert get_prev_schedule(start_ts, t(5, 10), CrontabSchedule("20,40 * * * *")) == t(4, 40)
+
+    # 1 * * * *: 1:01:44 -> 1:01, the minute of a reference that isn't on the
+    # whole minute is before the reference
+    reference_ts = datetime(2019, 1, 1, 1, 1, 44, tzinfo=timezone.utc)
+    assert get_prev_schedule(start_ts, reference_ts, CrontabSchedule("1 * * * *")) == t(1, 1)
+
+    # * * * * *: 4:49:46 -> 4:49
+    reference_ts = datetime(2019, 1, 1, 4, 49, 46, tzinfo=timezone.utc)
+    assert get_prev_schedule(start_ts, reference_ts, CrontabSchedule("* * * * *")) == t(4, 49)
+
+    # * * * * *: 4:49:00.5 -> 4:48, microseconds are ignored
+    reference_ts = datetime(2019, 1, 1, 4, 49, 0, 500000, tzinfo=timezone.utc)
+    assert get_prev_schedule(start_ts, reference_ts, CrontabSchedule("* * * * *")) == t(4, 48)
+
+
+def test_get_prev_schedule_interval_long_running():
+    start_ts = datetime(2019, 1, 1, 1, 30, 15, tzinfo=timezone.utc)
+    reference_ts = datetime(2024, 6, 1, 12, 3, 0, tzinfo=timezone.utc)
+
+    # Five years of minutely occurrences do not need to be iterated over
+    assert get_prev_schedule(start_ts, reference_ts, IntervalSchedule(5, "minute")) == datetime(
+        2024, 6, 1, 12, 0, 0, tzinfo=timezone.utc
+    )
+
+    # Occurrences are computed using the wall clock across DST transitions
+    tz = ZoneInfo("America/New_York")
+    assert get_prev_schedule(
+        datetime(2024, 3, 9, 12, 0, 0, tzinfo=tz),
+        datetime(2024, 3, 11, 12, 0, 0, tzinfo=tz),
+        IntervalSchedule(1, "day"),
+    ) == datetime(2024, 3, 10, 12, 0, 0, tzinfo=tz)
@@ -0,0 +1,195 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+
+from sentry.constants import ObjectStatus
+from sentry.monitors import timing_wheel
+from sentry.monitors.clock_tasks.check_missed import dispatch_check_missing
+from sentry.monitors.clock_tasks.check_timeout import dispatch_check_timeout
+from sentry.monitors.models import (
+    CheckInStatus,
+    Monitor,
+    MonitorCheckIn,
+    MonitorEnvironment,
+    MonitorStatus,
+    MonitorType,
+    ScheduleType,
+)
+from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
+
+
+@override_options({"crons.timing_wheel.enabled": True})
+class TimingWheelTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        timing_wheel._get_redis_client().delete(
+            timing_wheel.MISSED_KEY, timing_wheel.TIMEOUT_KEY, timing_wheel.REBUILT_KEY
+        )
+        self.ts = timezone.now().replace(second=0, microsecond=0)
+        self.monitor = Monitor.objects.create(
+            organization_id=self.organization.id,
+            project_id=self.project.id,
+            type=MonitorType.CRON_JOB,
+            config={
+                "schedule_type": ScheduleType.CRONTAB,
+                "schedule": "* * * * *",
+                "max_runtime": None,
+                "checkin_margin": None,
+            },
+        )
+
+    def create_monitor_environment(self, next_checkin_latest):
+        return MonitorEnvironment.objects.create(
+            monitor=self.monitor,
+            environment_id=self.create_environment(project=self.project).id,
+            last_checkin=next_checkin_latest - timedelta(minutes=2),
+            next_checkin=next_checkin_latest - timedelta(minutes=1),
+            next_checkin_latest=next_checkin_latest,
+            status=MonitorStatus.OK,
+        )
+
+    def test_pop_due_missed(self):
+        timing_wheel.schedule_missed(1, self.ts - timedelta(minutes=1))
+        timing_wheel.schedule_missed(2, self.ts)
+        timing_wheel.schedule_missed(3, self.ts + timedelta(minutes=1))
+
+        assert sorted(timing_wheel.pop_due_missed(self.ts, 10)) == [1, 2]
+        assert timing_wheel.pop_due_missed(self.ts, 10) == []
+        assert timing_wheel.pop_due_missed(self.ts + timedelta(minutes=1), 10) == [3]
+
+    def test_pop_due_timeouts_limit(self):
+        timing_wheel.schedule_timeout(10, 1, self.ts - timedelta(minutes=2))
+        timing_wheel.schedule_timeout(11, 1, self.ts - timedelta(minutes=1))
+
+        assert timing_wheel.pop_due_timeouts(self.ts, 1) == [(10, 1)]
+        assert timing_wheel.pop_due_timeouts(self.ts, 1) == [(11, 1)]
+
+    @mock.patch("sentry.monitors.clock_tasks.check_missed.produce_task")
+    def test_dispatch_check_missing_not_built(self, mock_produce_task):
+        missed = self.create_monitor_environment(self.ts)
+
+        # Until the index is complete the database is scanned instead
+        with mock.patch("sentry.monitors.timing_wheel.pop_due_missed") as mock_pop:
+            dispatch_check_missing(self.ts)
+        assert not mock_pop.called
+        assert mock_produce_task.call_count == 1
+        assert mock_produce_task.mock_calls[0].args[0].key == str(missed.id).encode()
+
+    def test_maybe_rebuild_failed(self):
+        with mock.patch("sentry.monitors.timing_wheel.rebuild", side_effect=Exception):
+            with pytest.raises(Exception):
+                timing_wheel.maybe_rebuild()
+        assert not timing_wheel.is_built()
+
+        timing_wheel.maybe_rebuild()
+        assert timing_wheel.is_built()
+
+        with mock.patch("sentry.monitors.timing_wheel.rebuild") as mock_rebuild:
+            timing_wheel.maybe_rebuild()
+        assert not mock_rebuild.called
+
+    def test_schedule_monitor(self):
+        monitor_environment = self.create_monitor_environment(self.ts + timedelta(minutes=5))
+        # Changed in bulk, as when the check-in margin is lowered
+        MonitorEnvironment.objects.filter(id=monitor_environment.id).update(
+            next_checkin_latest=self.ts
+        )
+
+        timing_wheel.schedule_monitor(self.monitor.id)
+        assert timing_wheel.pop_due_missed(self.ts, 10) == [monitor_environment.id]
+
+    def test_disabled(self):
+        with override_options({"crons.timing_wheel.enabled": False}):
+            timing_wheel.schedule_missed(1, self.ts)
+
+        assert timing_wheel._get_redis_client().zcard(timing_wheel.MISSED_KEY) == 0
+
+    @mock.patch("sentry.monitors.clock_tasks.check_missed.produce_task")
+    def test_invalidated_while_disabled(self, mock_produce_task):
+        timing_wheel.maybe_rebuild()
+        assert timing_wheel.is_built()
+
+        with override_options({"crons.timing_wheel.enabled": False}):
+            # The clock tick doesn't touch the index while it is disabled
+            with mock.patch("sentry.monitors.timing_wheel.invalidate") as mock_invalidate:
+                dispatch_check_missing(self.ts)
+            assert not mock_invalidate.called
+
+            timing_wheel.maybe_rebuild()
+        assert not timing_wheel.is_built()
+
+    @mock.patch("sentry.monitors.clock_tasks.check_missed.produce_task")
+    def test_dispatch_check_missing_disabled_monitor(self, mock_produce_task):
+        missed = self.create_monitor_environment(self.ts)
+        self.monitor.update(status=ObjectStatus.DISABLED)
+
+        timing_wheel.maybe_rebuild()
+        dispatch_check_missing(self.ts)
+        assert mock_produce_task.call_count == 0
+
+        # Checked again on the next tick rather than dropped from the index
+        client = timing_wheel._get_redis_client()
+        assert (
+            client.zscore(timing_wheel.MISSED_KEY, str(missed.id))
+            == (self.ts + timedelta(minutes=1)).timestamp()
+        )
+
+        self.monitor.update(status=ObjectStatus.ACTIVE)
+        dispatch_check_missing(self.ts + timedelta(minutes=1))
+        assert mock_produce_task.call_count == 1
+        assert mock_produce_task.mock_calls[0].args[0].key == str(missed.id).encode()
+
+    @mock.patch("sentry.monitors.clock_tasks.check_missed.produce_task")
+    def test_dispatch_check_missing(self, mock_produce_task):
+        missed = self.create_monitor_environment(self.ts)
+        # Moved forward without the index being updated
+        moved = self.create_monitor_environment(self.ts)
+        moved.update(next_checkin_latest=self.ts + timedelta(minutes=5))
+        # Not yet due
+        self.create_monitor_environment(self.ts + timedelta(minutes=1))
+
+        # The index is rebuilt from the database outside of the clock tick
+        timing_wheel.maybe_rebuild()
+        assert timing_wheel.is_built()
+        dispatch_check_missing(self.ts)
+        assert mock_produce_task.call_count == 1
+        assert mock_produce_task.mock_calls[0].args[0].key == str(missed.id).encode()
+
+        # The moved environment was scheduled again for its new time
+        client = timing_wheel._get_redis_client()
+        assert (
+            client.zscore(timing_wheel.MISSED_KEY, str(moved.id))
+            == (self.ts + timedelta(minutes=5)).timestamp()
+        )
+        assert client.zscore(timing_wheel.MISSED_KEY, str(missed.id)) is None
+
+    @mock.patch("sentry.monitors.clock_tasks.check_timeout.produce_task")
+    def test_dispatch_check_timeout(self, mock_produce_task):
+        monitor_environment = self.create_monitor_environment(self.ts + timedelta(minutes=1))
+        timed_out = MonitorCheckIn.objects.create(
+            monitor=self.monitor,
+            monitor_environment=monitor_environment,
+            project_id=self.project.id,
+            status=CheckInStatus.IN_PROGRESS,
+            timeout_at=self.ts - timedelta(minutes=1),
+        )
+        completed = MonitorCheckIn.objects.create(
+            monitor=self.monitor,
+            monitor_environment=monitor_environment,
+            project_id=self.project.id,
+            status=CheckInStatus.IN_PROGRESS,
+            timeout_at=self.ts - timedelta(minutes=1),
+        )
+
+        timing_wheel._get_redis_client().set(timing_wheel.REBUILT_KEY, "1")
+        timing_wheel.schedule_timeout(timed_out.id, monitor_environment.id, timed_out.timeout_at)
+        timing_wheel.schedule_timeout(completed.id, monitor_environment.id, completed.timeout_at)
+        completed.update(status=CheckInStatus.OK)
+
+        dispatch_check_timeout(self.ts)
+        assert mock_produce_task.call_count == 1
+        assert mock_produce_task.mock_calls[0].args[0].key == str(monitor_environment.id).encode()
+        assert timing_wheel._get_redis_client().zcard(timing_wheel.TIMEOUT_KEY) == 0
@@ -9,7 +9,7 @@ from django.test import override_settings
 
 from sentry.models.options.option import Option
 from sentry.options.manager import OptionsManager, UpdateChannel
-from sentry.options.store import OptionsStore
+from sentry.options.store import SNAPSHOT_VERSION_KEY, OptionsStore
 from sentry.testutils.cases import TestCase
 from sentry.testutils.silo import no_silo_test
 
@@ -164,3 +164,46 @@ class OptionsStoreTest(TestCase):
         mocked_time.return_value = 26
         store.clean_local_cache()
         assert not store._local_cache
+
+    @override_settings(SENTRY_OPTIONS_SNAPSHOT=True)
+    @patch("sentry.options.store.time")
+    def test_snapshot(self, mocked_time):
+        store, key = self.store, self.key
+        other_key = self.make_key()
+
+        mocked_time.return_value = 0
+        assert store.get(key) is None
+        store.set(key, "bar", UpdateChannel.CLI)
+        # Our own writes are visible right away
+        assert store.get(key) == "bar"
+
+        # Changes from elsewhere are only picked up when the version changes
+        Option.objects.create(key=other_key.name, value="baz")
+        mocked_time.return_value = 5
+        assert store.get(other_key) is None
+
+        store.cache.set(SNAPSHOT_VERSION_KEY, ("other-process", 3), None)
+        assert store.get(other_key) is None
+
+        mocked_time.return_value = 7
+        assert store.get(other_key) == "baz"
+
+        with patch.object(Option.objects, "get_queryset", side_effect=RuntimeError()):
+            with patch.object(store.cache, "get", side_effect=RuntimeError()):
+                # Reads don't touch the cache or the database
+                assert store.get(key) == "bar"
+
+    @override_settings(SENTRY_OPTIONS_SNAPSHOT=True, SENTRY_OPTIONS_SNAPSHOT_MAX_AGE=60)
+    @patch("sentry.options.store.time")
+    def test_snapshot_max_age(self, mocked_time):
+        store, key = self.store, self.key
+
+        mocked_time.return_value = 0
+        assert store.get(key) is None
+        Option.objects.create(key=key.name, value="bar")
+
+        mocked_time.return_value = 30
+        assert store.get(key) is None
+
+        mocked_time.return_value = 61
+        assert store.get(key) == "bar"
@@ -10,6 +10,7 @@ from pytest import raises
 
 from sentry.ingest.consumer.factory import IngestStrategyFactory
 from sentry.ingest.types import ConsumerType
+from sentry.processing.backpressure.arroyo import HealthChecker, simulate_admission_rates
 from sentry.processing.backpressure.health import record_consumer_health
 from sentry.profiles.consumers.process.factory import ProcessProfileStrategyFactory
 from sentry.testutils.helpers.options import override_options
@@ -146,6 +147,100 @@ def test_backpressure_not_enabled(process_profile_task):
     process_profile_task.assert_called_once()
 
 
+def test_simulate_admission_rates():
+    rates = simulate_admission_rates(
+        [False, False, False, False, False, True, True, True],
+        decrease_factor=0.5,
+        increase_step=0.25,
+        min_rate=0.1,
+    )
+    assert rates == [0.5, 0.25, 0.125, 0.0, 0.0, 0.25, 0.5, 0.75]
+
+
+@override_options(
+    {
+        "backpressure.checking.enabled": True,
+        "backpressure.checking.interval": 1,
+        "backpressure.monitoring.enabled": True,
+        "backpressure.status_ttl": 60,
+        "backpressure.throttling.enabled": True,
+        "backpressure.throttling.decrease_factor": 0.5,
+        "backpressure.throttling.increase_step": 0.5,
+        "backpressure.throttling.min_rate": 0.3,
+    }
+)
+def test_health_checker_throttling():
+    health_checker = HealthChecker("profiles")
+    now = 1000.0
+
+    with (
+        patch("sentry.processing.backpressure.arroyo.time.time", side_effect=lambda: now),
+        patch("sentry.processing.backpressure.arroyo.is_consumer_healthy") as is_healthy,
+    ):
+        is_healthy.return_value = True
+        for _ in range(128):
+            assert health_checker.should_admit()
+
+        now += 1
+        is_healthy.return_value = False
+        assert health_checker.should_admit()
+        assert health_checker.admission_rate == 0.5
+        assert health_checker.observed_throughput == 128.0
+
+        # The initial burst of up to one second worth of messages
+        assert sum(health_checker.should_admit() for _ in range(100)) == 63
+        # After that half the observed throughput is admitted, no matter how
+        # often rejected messages are retried
+        for _ in range(4):
+            now += 0.125
+            assert sum(health_checker.should_admit() for _ in range(100)) == 8
+
+        # Halted entirely below the minimum rate
+        now += 0.5
+        assert not health_checker.should_admit()
+        assert health_checker.admission_rate == 0.0
+
+        is_healthy.return_value = True
+        now += 1
+        assert health_checker.should_admit()
+        assert health_checker.admission_rate == 0.5
+        now += 1
+        assert health_checker.should_admit()
+        assert health_checker.admission_rate == 1.0
+
+
+@override_options(
+    {
+        "backpressure.checking.enabled": True,
+        "backpressure.checking.interval": 1,
+        "backpressure.monitoring.enabled": True,
+        "backpressure.status_ttl": 60,
+        "backpressure.throttling.enabled": True,
+        "backpressure.throttling.decrease_factor": 0.5,
+        "backpressure.throttling.min_rate": 0.3,
+        "backpressure.throttling.min_throughput": 8.0,
+    }
+)
+def test_health_checker_throttling_without_throughput():
+    health_checker = HealthChecker("profiles")
+    now = 1000.0
+
+    with (
+        patch("sentry.processing.backpressure.arroyo.time.time", side_effect=lambda: now),
+        patch("sentry.processing.backpressure.arroyo.is_consumer_healthy") as is_healthy,
+    ):
+        # Throttled before any throughput was observed
+        is_healthy.return_value = False
+        assert sum(health_checker.should_admit() for _ in range(100)) == 4
+        assert health_checker.admission_rate == 0.5
+        assert health_checker.observed_throughput == 0.0
+
+        # Half of the minimum throughput is still admitted
+        for _ in range(3):
+            now += 0.25
+            assert sum(health_checker.should_admit() for _ in range(100)) == 1
+
+
 def process_one_message(consumer_type: str, topic: str, payload: str):
     if consumer_type == "profiles":
         processing_strategy = ProcessProfileStrategyFactory().create_with_partitions(
@@ -921,3 +921,22 @@ class EventAttributeConditionTest(RuleTestCase):
             data={"match": MatchType.NOT_IN, "attribute": "platform", "value": "python"}
         )
         self.assertPasses(rule, event)
+
+    def test_attribute_values_shared_across_rules(self):
+        event = self.get_event()
+        state = self.get_state()
+        equals = self.get_rule(
+            data={"match": MatchType.EQUAL, "attribute": "extra.foo.bar", "value": "baz"}
+        )
+        not_equals = self.get_rule(
+            data={"match": MatchType.NOT_EQUAL, "attribute": "extra.foo.bar", "value": "baz"}
+        )
+
+        with patch(
+            "sentry.rules.conditions.event_attribute.ExtraAttributeHandler._handle",
+            return_value=["baz"],
+        ) as mock_handle:
+            assert equals.passes(event, state) is True
+            assert not_equals.passes(event, state) is False
+        assert mock_handle.call_count == 1
+        assert state.attribute_cache[("event_attribute", "extra.foo.bar")] == ["baz"]
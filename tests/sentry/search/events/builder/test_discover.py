@@ -18,6 +18,7 @@ from sentry.search.events.types import ParamsType, QueryBuilderConfig
 from sentry.snuba.dataset import Dataset
 from sentry.snuba.referrer import Referrer
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 from sentry.utils.snuba import QueryOutsideRetentionError, UnqualifiedQueryError, bulk_snuba_queries
 from sentry.utils.validators import INVALID_ID_DETAILS
 
@@ -951,3 +952,39 @@ class DiscoverQueryBuilderTest(TestCase):
                 )
             ],
         )
+
+    def test_process_results(self):
+        def build_results():
+            return {
+                "data": [
+                    {"message": "first", "count": 2},
+                    {"message": "second", "count": 1},
+                ],
+                "meta": [
+                    {"name": "message", "type": "String"},
+                    {"name": "count", "type": "UInt64"},
+                ],
+            }
+
+        query = DiscoverQueryBuilder(
+            Dataset.Discover,
+            self.params,
+            selected_columns=["message", "count()"],
+            config=QueryBuilderConfig(transform_alias_to_input_format=True),
+        )
+        expected = [
+            {"message": "first", "count()": 2},
+            {"message": "second", "count()": 1},
+        ]
+
+        results = build_results()
+        processed = query.process_results(results)
+        assert processed["data"] == expected
+        assert processed["meta"]["fields"] == {"message": "string", "count()": "integer"}
+        assert results["data"][0] == {"message": "first", "count": 2}
+
+        results = build_results()
+        with override_options({"snuba.compact-result-decoding.enabled": True}):
+            processed = query.process_results(results)
+        assert processed["data"] == expected
+        assert results["data"][0] == {"message": "first", "count": 2}
@@ -5,9 +5,14 @@ from snuba_sdk.column import Column
 from snuba_sdk.conditions import Condition, Op
 from snuba_sdk.function import Function
 
-from sentry.search.events.builder.profile_functions import ProfileFunctionsQueryBuilder
+from sentry.search.events.builder.profile_functions import (
+    ProfileFunctionsQueryBuilder,
+    ProfileFunctionsTimeseriesQueryBuilder,
+)
+from sentry.search.events.types import QueryBuilderConfig
 from sentry.snuba.dataset import Dataset
 from sentry.testutils.factories import Factories
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
 
 
@@ -87,3 +92,32 @@ def test_where(params, search, condition):
         selected_columns=["count()"],
     )
     assert condition in builder.where
+
+
+@django_db_all
+@pytest.mark.parametrize("compact_decoding", [False, True])
+def test_timeseries_process_results_keeps_data(params, compact_decoding):
+    builder = ProfileFunctionsTimeseriesQueryBuilder(
+        Dataset.Functions,
+        params,
+        interval=3600,
+        selected_columns=["count()"],
+        config=QueryBuilderConfig(transform_alias_to_input_format=True),
+    )
+    data = [{"time": 1667174400, "count": 5}, {"time": 1667178000, "count": 3}]
+    results = builder.strip_alias_prefix(
+        {
+            "data": [{"time": row["time"], "sentry_count": row["count"]} for row in data],
+            "meta": [
+                {"name": "time", "type": "UInt32"},
+                {"name": "sentry_count", "type": "UInt64"},
+            ],
+        }
+    )
+
+    with override_options({"snuba.compact-result-decoding.enabled": compact_decoding}):
+        processed = builder.process_results(results)
+
+    # The rows keep the keys zerofill expects, only the meta is translated
+    assert processed["data"] == data
+    assert "count()" in processed["meta"]["fields"]
@@ -16,8 +16,10 @@ from sentry.runner.commands.run import DEFAULT_BLOCK_SIZE
 from sentry.snuba.dataset import Dataset
 from sentry.snuba.models import SnubaQuery
 from sentry.snuba.query_subscriptions.consumer import (
+    BatchPartiallyHandledError,
     InvalidSchemaError,
     parse_message_value,
+    register_batch_subscriber,
     register_subscriber,
     subscriber_registry,
 )
@@ -139,6 +141,95 @@ class HandleMessageTest(BaseQuerySubscriptionTest, TestCase):
         )
         mock_callback.assert_called_once_with(data["payload"], sub)
 
+    def run_batched_consumer(self, registration_key):
+        with self.tasks():
+            snuba_query = create_snuba_query(
+                SnubaQuery.Type.ERROR,
+                Dataset.Events,
+                "hello",
+                "count()",
+                timedelta(minutes=10),
+                timedelta(minutes=1),
+                None,
+            )
+            sub = create_snuba_subscription(self.project, registration_key, snuba_query)
+        sub.refresh_from_db()
+
+        data = deepcopy(self.valid_wrapper)
+        data["payload"]["subscription_id"] = sub.subscription_id
+        commit = mock.Mock()
+        partition = Partition(ArroyoTopic("test"), 0)
+        factory = QuerySubscriptionStrategyFactory(
+            self.dataset.value,
+            2,
+            1,
+            1,
+            DEFAULT_BLOCK_SIZE,
+            DEFAULT_BLOCK_SIZE,
+            mode="batched",
+        )
+        # Batched mode doesn't use a multiprocessing pool
+        assert factory.pool is None
+        strategy = factory.create_with_partitions(commit, {partition: 0})
+        message = self.build_mock_message(data, topic=self.topic)
+
+        for offset in (1, 2):
+            strategy.submit(
+                Message(
+                    BrokerValue(
+                        KafkaPayload(b"key", message.value().encode("utf-8"), []),
+                        partition,
+                        offset,
+                        datetime.now(),
+                    )
+                )
+            )
+        strategy.join()
+        factory.shutdown()
+
+        payload = deepcopy(data["payload"])
+        payload["values"] = payload.pop("result")
+        payload.pop("request")
+        payload["timestamp"] = parse_date(payload["timestamp"]).replace(tzinfo=timezone.utc)
+        return payload, sub
+
+    def test_arroyo_consumer_batched(self):
+        registration_key = "registered_test_batched"
+        mock_callback = mock.Mock()
+        mock_batch_callback = mock.Mock()
+        register_subscriber(registration_key)(mock_callback)
+        register_batch_subscriber(registration_key)(mock_batch_callback)
+
+        payload, sub = self.run_batched_consumer(registration_key)
+        mock_batch_callback.assert_called_once_with([(payload, sub), (payload, sub)])
+        assert not mock_callback.called
+
+    def test_arroyo_consumer_batched_fallback(self):
+        registration_key = "registered_test_batched_fallback"
+        mock_callback = mock.Mock()
+        mock_batch_callback = mock.Mock(side_effect=Exception("pipeline failed"))
+        register_subscriber(registration_key)(mock_callback)
+        register_batch_subscriber(registration_key)(mock_batch_callback)
+
+        # A failing batch callback falls back to handling the updates one by one
+        payload, sub = self.run_batched_consumer(registration_key)
+        assert mock_batch_callback.call_count == 1
+        assert mock_callback.call_args_list == [mock.call(payload, sub), mock.call(payload, sub)]
+
+    def test_arroyo_consumer_batched_partial_fallback(self):
+        registration_key = "registered_test_batched_partial_fallback"
+        mock_callback = mock.Mock()
+
+        def batch_callback(updates):
+            # The first update was handled before the callback failed
+            raise BatchPartiallyHandledError(updates[1:])
+
+        register_subscriber(registration_key)(mock_callback)
+        register_batch_subscriber(registration_key)(batch_callback)
+
+        payload, sub = self.run_batched_consumer(registration_key)
+        assert mock_callback.call_args_list == [mock.call(payload, sub)]
+
 
 class ParseMessageValueTest(BaseQuerySubscriptionTest, unittest.TestCase):
     def run_test(self, message):
@@ -23,7 +23,12 @@ from sentry.models.groupredirect import GroupRedirect
 from sentry.models.userreport import UserReport
 from sentry.plugins.base.v2 import Plugin2
 from sentry.projectoptions.defaults import DEFAULT_GROUPING_CONFIG
-from sentry.reprocessing2 import is_group_finished
+from sentry.reprocessing2 import (
+    CannotReprocess,
+    ReprocessableEvent,
+    is_group_finished,
+    pull_event_data_bulk,
+)
 from sentry.tasks.reprocessing2 import finish_reprocessing, reprocess_group
 from sentry.tasks.store import preprocess_event
 from sentry.testutils.helpers.datetime import before_now
@@ -442,6 +447,45 @@ def test_attachments_and_userfeedback(
     assert is_group_finished(event.group_id)
 
 
+@django_db_all
+@pytest.mark.snuba
+def test_pull_event_data_bulk(
+    default_project,
+    reset_snuba,
+    process_and_save,
+):
+    MINIDUMP_PLACEHOLDER = {
+        "platform": "native",
+        "exception": {"values": [{"mechanism": {"type": "minidump"}, "type": "test bogus"}]},
+    }
+
+    with_minidump_id = process_and_save({"message": "hello world", **MINIDUMP_PLACEHOLDER})
+    missing_minidump_id = process_and_save({"message": "hello world", **MINIDUMP_PLACEHOLDER})
+    plain_id = process_and_save({"message": "hello world", "platform": "python"})
+
+    events = [
+        eventstore.backend.get_event_by_id(default_project.id, event_id)
+        for event_id in (with_minidump_id, missing_minidump_id, plain_id)
+    ]
+    for type in ("event.attachment", "event.minidump"):
+        _create_event_attachment(events[0], type)
+
+    pulled = pull_event_data_bulk(default_project.id, events)
+
+    with_minidump = pulled[with_minidump_id]
+    assert isinstance(with_minidump, ReprocessableEvent)
+    assert [attachment.type for attachment in with_minidump.attachments] == ["event.minidump"]
+
+    missing_minidump = pulled[missing_minidump_id]
+    assert isinstance(missing_minidump, CannotReprocess)
+    assert str(missing_minidump) == "attachment.not_found"
+
+    # Python events are not backed up for reprocessing.
+    plain = pulled[plain_id]
+    assert isinstance(plain, CannotReprocess)
+    assert str(plain) == "unprocessed_event.not_found"
+
+
 @django_db_all
 @pytest.mark.snuba
 @pytest.mark.parametrize("remaining_events", ["keep", "delete"])
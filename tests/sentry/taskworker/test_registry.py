@@ -5,6 +5,7 @@ import pytest
 from django.test.utils import override_settings
 
 from sentry.conf.types.kafka_definition import Topic
+from sentry.taskworker.constants import ExecutionClass
 from sentry.taskworker.registry import TaskNamespace, TaskRegistry
 from sentry.taskworker.retry import LastAction, Retry
 from sentry.taskworker.task import Task
@@ -86,6 +87,28 @@ def test_register_inherits_default_expires_processing_deadline() -> None:
     assert activation.processing_deadline_duration == 10
 
 
+def test_register_inherits_default_execution_class() -> None:
+    namespace = TaskNamespace(
+        name="tests",
+        topic=Topic.TASK_WORKER,
+        retry=None,
+        execution_class=ExecutionClass.IO,
+        io_concurrency=4,
+    )
+
+    @namespace.register(name="test.default")
+    def default_class() -> None:
+        pass
+
+    @namespace.register(name="test.cpu", execution_class=ExecutionClass.CPU)
+    def cpu_class() -> None:
+        pass
+
+    assert namespace.io_concurrency == 4
+    assert namespace.get("test.default").execution_class == ExecutionClass.IO
+    assert namespace.get("test.cpu").execution_class == ExecutionClass.CPU
+
+
 def test_namespace_get_unknown() -> None:
     namespace = TaskNamespace(
         name="tests",
@@ -1,3 +1,6 @@
+import itertools
+import time
+from collections import deque
 from unittest import mock
 
 from django.test import override_settings
@@ -9,9 +12,10 @@ from sentry_protos.sentry.v1.taskworker_pb2 import (
     TaskActivation,
 )
 
+from sentry.taskworker.constants import ExecutionClass
 from sentry.taskworker.registry import taskregistry
 from sentry.taskworker.retry import Retry, RetryError
-from sentry.taskworker.worker import TaskWorker
+from sentry.taskworker.worker import TaskWorker, _BufferedActivation
 from sentry.testutils.cases import TestCase
 
 test_namespace = taskregistry.create_namespace(
@@ -40,6 +44,16 @@ def at_most_once_task():
     pass
 
 
+@test_namespace.register(name="test.io_task", execution_class=ExecutionClass.IO)
+def io_task():
+    pass
+
+
+@test_namespace.register(name="test.io_fail_task", execution_class=ExecutionClass.IO)
+def io_fail_task():
+    raise ValueError("nope")
+
+
 SIMPLE_TASK = TaskActivation(
     id="111",
     taskname="test.simple_task",
@@ -81,6 +95,23 @@ AT_MOST_ONCE_TASK = TaskActivation(
 )
 
 
+IO_TASK = TaskActivation(
+    id="666",
+    taskname="test.io_task",
+    namespace="tests",
+    parameters='{"args": [], "kwargs": {}}',
+    processing_deadline_duration=1,
+)
+
+IO_FAIL_TASK = TaskActivation(
+    id="777",
+    taskname="test.io_fail_task",
+    namespace="tests",
+    parameters='{"args": [], "kwargs": {}}',
+    processing_deadline_duration=1,
+)
+
+
 @override_settings(TASKWORKER_IMPORTS=("tests.sentry.taskworker.test_worker",))
 class TestTaskWorker(TestCase):
     def test_fetch_task(self) -> None:
@@ -229,3 +260,126 @@ class TestTaskWorker(TestCase):
                 status=TASK_ACTIVATION_STATUS_FAILURE,
                 fetch_next_task=FetchNextTask(namespace=None),
             )
+
+    def test_start_concurrent(self) -> None:
+        taskworker = TaskWorker(
+            rpc_host="127.0.0.1:50051", max_task_count=3, concurrency=2, prefetch=1
+        )
+        with mock.patch.object(taskworker, "client") as mock_client:
+            mock_client.get_task.side_effect = itertools.chain(
+                [SIMPLE_TASK, FAIL_TASK], itertools.repeat(None)
+            )
+            mock_client.update_task.side_effect = [RETRY_TASK, None, None]
+
+            result = taskworker.start()
+
+            assert result == 0
+            assert mock_client.update_task.call_count == 3
+            mock_client.update_task.assert_any_call(
+                task_id=SIMPLE_TASK.id,
+                status=TASK_ACTIVATION_STATUS_COMPLETE,
+                fetch_next_task=mock.ANY,
+            )
+            mock_client.update_task.assert_any_call(
+                task_id=FAIL_TASK.id,
+                status=TASK_ACTIVATION_STATUS_FAILURE,
+                fetch_next_task=mock.ANY,
+            )
+            mock_client.update_task.assert_any_call(
+                task_id=RETRY_TASK.id,
+                status=TASK_ACTIVATION_STATUS_RETRY,
+                fetch_next_task=None,
+            )
+
+    def test_start_concurrent_unknown_task(self) -> None:
+        taskworker = TaskWorker(rpc_host="127.0.0.1:50051", max_task_count=1, concurrency=2)
+        with mock.patch.object(taskworker, "client") as mock_client:
+            mock_client.get_task.return_value = UNDEFINED_TASK
+            mock_client.update_task.return_value = None
+
+            result = taskworker.start()
+
+            assert result == 0
+            assert mock_client.get_task.call_count == 1
+            mock_client.update_task.assert_called_once_with(
+                task_id=UNDEFINED_TASK.id,
+                status=TASK_ACTIVATION_STATUS_FAILURE,
+                fetch_next_task=None,
+            )
+
+    def test_start_io_threads(self) -> None:
+        taskworker = TaskWorker(rpc_host="127.0.0.1:50051", max_task_count=3, io_threads=2)
+        with mock.patch.object(taskworker, "client") as mock_client:
+            mock_client.get_task.side_effect = itertools.chain(
+                [IO_TASK, IO_FAIL_TASK, SIMPLE_TASK], itertools.repeat(None)
+            )
+            mock_client.update_task.return_value = None
+
+            result = taskworker.start()
+
+            assert result == 0
+            assert mock_client.update_task.call_count == 3
+            mock_client.update_task.assert_any_call(
+                task_id=IO_TASK.id,
+                status=TASK_ACTIVATION_STATUS_COMPLETE,
+                fetch_next_task=mock.ANY,
+            )
+            mock_client.update_task.assert_any_call(
+                task_id=IO_FAIL_TASK.id,
+                status=TASK_ACTIVATION_STATUS_FAILURE,
+                fetch_next_task=mock.ANY,
+            )
+            mock_client.update_task.assert_any_call(
+                task_id=SIMPLE_TASK.id,
+                status=TASK_ACTIVATION_STATUS_COMPLETE,
+                fetch_next_task=mock.ANY,
+            )
+
+    def test_io_namespace_concurrency(self) -> None:
+        taskworker = TaskWorker(rpc_host="127.0.0.1:50051", max_task_count=3, io_threads=2)
+        namespace = taskregistry.get("tests")
+        with mock.patch.object(namespace, "io_concurrency", 1):
+            assert taskworker._io_slot
+            assert taskworker._has_io_capacity(taskworker._io_slot, IO_TASK)
+
+            taskworker._io_slot.running[IO_TASK.id] = (IO_TASK, 0.0, 0.0)
+            assert not taskworker._has_io_capacity(taskworker._io_slot, IO_FAIL_TASK)
+
+    def test_held_back_fetch_budget(self) -> None:
+        taskworker = TaskWorker(rpc_host="127.0.0.1:50051", concurrency=1, io_threads=2, prefetch=1)
+        namespace = taskregistry.get("tests")
+        with mock.patch.object(namespace, "io_concurrency", 1):
+            assert taskworker._io_slot
+            taskworker._io_slot.running[IO_TASK.id] = (IO_TASK, 0.0, 0.0)
+
+            buffer = deque(_BufferedActivation(IO_FAIL_TASK) for _ in range(3))
+            assert not taskworker._dispatch_buffered(buffer)
+            assert len(buffer) == 3
+
+            # Held back activations don't keep the idle cpu slot from being filled
+            assert taskworker._wants_activation(buffer)
+
+            buffer.append(_BufferedActivation(IO_FAIL_TASK))
+            assert not taskworker._dispatch_buffered(buffer)
+            assert not taskworker._wants_activation(buffer)
+
+    def test_buffered_deadline(self) -> None:
+        taskworker = TaskWorker(rpc_host="127.0.0.1:50051", concurrency=2, prefetch=2)
+        fetched_at = time.time()
+        buffer = deque(
+            [
+                _BufferedActivation(SIMPLE_TASK, fetched_at=fetched_at - 5),
+                _BufferedActivation(FAIL_TASK, fetched_at=fetched_at),
+            ]
+        )
+        with mock.patch.object(taskworker, "client") as mock_client:
+            assert taskworker._dispatch_buffered(buffer)
+
+        # The expired activation is dropped, the broker hands it to another worker
+        assert not buffer
+        assert not mock_client.update_task.called
+        busy = [slot for slot in taskworker._slots if slot.activation is not None]
+        assert len(busy) == 1
+        assert busy[0].activation == FAIL_TASK
+        # The deadline is measured from when the activation was fetched
+        assert busy[0].deadline == fetched_at + FAIL_TASK.processing_deadline_duration
@@ -23,6 +23,7 @@ from sentry.testutils.helpers.options import override_options
 from sentry.uptime.consumers.results_consumer import (
     AUTO_DETECTED_ACTIVE_SUBSCRIPTION_INTERVAL,
     ONBOARDING_MONITOR_PERIOD,
+    UptimeResultProcessor,
     UptimeResultsStrategyFactory,
     build_last_update_key,
     build_onboarding_failure_key,
@@ -377,6 +378,47 @@ class ProcessResultTest(ProducerTestMixin):
             )
             self.assert_producer_calls(subscription_id)
 
+    def test_parallel(self):
+        factory = UptimeResultsStrategyFactory(mode="parallel", max_batch_size=3, max_workers=1)
+        consumer = factory.create_with_partitions(mock.Mock(), {self.partition: 0})
+        codec = kafka_definition.get_topic_codec(kafka_definition.Topic.UPTIME_RESULTS)
+
+        other_subscription = self.create_uptime_subscription(subscription_id=uuid.uuid4().hex)
+        missing_subscription_id = uuid.uuid4().hex
+        results = [
+            self.create_uptime_result(self.subscription.subscription_id),
+            self.create_uptime_result(other_subscription.subscription_id),
+            self.create_uptime_result(self.subscription.subscription_id),
+            self.create_uptime_result(missing_subscription_id),
+        ]
+
+        with mock.patch.object(UptimeResultProcessor, "process_group") as process_group:
+            for i, result in enumerate(results):
+                consumer.submit(
+                    Message(
+                        BrokerValue(
+                            KafkaPayload(None, codec.encode(result), []),
+                            self.partition,
+                            i,
+                            datetime.now(),
+                        )
+                    )
+                )
+            factory.shutdown()
+
+        # The fourth result is in the next batch
+        assert process_group.call_count == 2
+        assert process_group.mock_calls[0].args == (self.subscription, [results[0], results[2]])
+        assert process_group.mock_calls[1].args == (other_subscription, [results[1]])
+
+    def test_process_group_missing_subscription(self):
+        subscription_id = uuid.uuid4().hex
+        processor = UptimeResultProcessor()
+
+        assert processor.get_subscriptions([subscription_id]) == {}
+        processor.process_group(None, [self.create_uptime_result(subscription_id)])
+        self.assert_producer_calls(subscription_id)
+
     def test_skip_already_processed(self):
         result = self.create_uptime_result(self.subscription.subscription_id)
         _get_cluster().set(
@@ -0,0 +1,111 @@
+from unittest import mock
+
+from sentry.models.project import Project
+from sentry.models.team import Team
+from sentry.testutils.cases import TestCase
+from sentry.utils.cache import cache
+from sentry.utils.shared_model_cache import (
+    SharedModelCache,
+    get_shared_model_cache,
+    set_shared_model_cache,
+)
+
+
+class SharedModelCacheTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.shared_cache = SharedModelCache.create(num_slots=64, slot_size=2048, ttl=30)
+        self.addCleanup(self.shared_cache.close, unlink=True)
+        self.version = Project.objects.cache_version
+
+    def test_set_and_get(self):
+        self.shared_cache.set(self.project, self.version, 0)
+
+        attached = SharedModelCache.attach(*self.shared_cache.attach_args)
+        self.addCleanup(attached.close)
+        result = attached.get(Project, self.version, self.project.id)
+
+        assert result is not None
+        assert result == self.project
+        assert result.slug == self.project.slug
+        assert result.organization_id == self.project.organization_id
+
+    def test_miss(self):
+        assert self.shared_cache.get(Project, self.version, self.project.id) is None
+
+        self.shared_cache.set(self.project, self.version, 0)
+        assert self.shared_cache.get(Project, "other-version", self.project.id) is None
+
+    def test_bump(self):
+        generation = self.shared_cache.generation(Project, self.project.id)
+        self.shared_cache.set(self.project, self.version, generation)
+        self.shared_cache.bump(Project, self.project.id)
+
+        assert self.shared_cache.generation(Project, self.project.id) == generation + 1
+        assert self.shared_cache.get(Project, self.version, self.project.id) is None
+
+    def test_set_after_bump(self):
+        # The row was fetched before a concurrent change bumped its generation
+        generation = self.shared_cache.generation(Project, self.project.id)
+        self.shared_cache.bump(Project, self.project.id)
+        self.shared_cache.set(self.project, self.version, generation)
+
+        assert self.shared_cache.get(Project, self.version, self.project.id) is None
+
+    def test_set_after_dead_writer(self):
+        self.shared_cache.set(self.project, self.version, 0)
+        # A writer that died mid-write leaves an odd sequence behind
+        _, index = self.shared_cache._slot(Project, self.version, self.project.id)
+        offset = index * self.shared_cache.slot_size
+        self.shared_cache.shm.buf[offset : offset + 4] = (7).to_bytes(4, "little")
+        assert self.shared_cache.get(Project, self.version, self.project.id) is None
+
+        self.shared_cache.set(self.project, self.version, 0)
+        assert self.shared_cache.get(Project, self.version, self.project.id) == self.project
+
+    def test_set_while_locked(self):
+        _, index = self.shared_cache._slot(Project, self.version, self.project.id)
+        assert self.shared_cache._lock(index, blocking=False)
+        try:
+            self.shared_cache.set(self.project, self.version, 0)
+        finally:
+            self.shared_cache._unlock(index)
+
+        assert self.shared_cache.get(Project, self.version, self.project.id) is None
+
+    def test_expired(self):
+        self.shared_cache.set(self.project, self.version, 0)
+
+        with mock.patch("sentry.utils.shared_model_cache.time.time", return_value=1e12):
+            assert self.shared_cache.get(Project, self.version, self.project.id) is None
+
+    def test_too_large(self):
+        shared_cache = SharedModelCache.create(num_slots=1, slot_size=64, ttl=30)
+        self.addCleanup(shared_cache.close, unlink=True)
+
+        shared_cache.set(self.project, self.version, 0)
+        assert shared_cache.get(Project, self.version, self.project.id) is None
+
+    def test_get_from_cache(self):
+        set_shared_model_cache(self.shared_cache)
+        self.addCleanup(set_shared_model_cache, None)
+
+        assert get_shared_model_cache(Project) is self.shared_cache
+        assert get_shared_model_cache(Team) is None
+
+        project = Project.objects.get_from_cache(id=self.project.id)
+        assert self.shared_cache.get(Project, self.version, project.id) == project
+
+        # Hits neither touch the database nor the Django cache
+        with (
+            self.assertNumQueries(0),
+            mock.patch.object(cache, "get", wraps=cache.get) as cache_get,
+            mock.patch.object(cache, "add", wraps=cache.add) as cache_add,
+        ):
+            assert Project.objects.get_from_cache(id=self.project.id) == project
+        assert cache_get.call_count == 0
+        assert cache_add.call_count == 0
+
+        project.update(name="renamed")
+        assert self.shared_cache.get(Project, self.version, project.id) is None
+        assert Project.objects.get_from_cache(id=self.project.id).name == "renamed"
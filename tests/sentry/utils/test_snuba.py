@@ -1,28 +1,48 @@
+import math
+import threading
 import unittest
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 from unittest import mock
 
 import pytest
+from django.core.cache import cache
+from django.test import override_settings
 from django.utils import timezone
+from snuba_sdk import Column, Condition, Entity, Op, Query, Request
 from urllib3 import HTTPConnectionPool
 from urllib3.exceptions import HTTPError, ReadTimeoutError
 
+from sentry.locks import locks
 from sentry.models.grouprelease import GroupRelease
 from sentry.models.project import Project
 from sentry.models.release import Release
 from sentry.snuba.dataset import Dataset
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
+from sentry.utils import json
 from sentry.utils.snuba import (
     ROUND_UP,
+    RateLimitExceeded,
     RetrySkipTimeout,
+    SnubaError,
     SnubaQueryParams,
+    SnubaRequest,
     UnqualifiedQueryError,
+    _bulk_snuba_query,
+    _bulk_snuba_query_coalesced,
+    _decode_response_body,
+    _get_coalesce_key,
+    _inflight_requests,
     _prepare_query_params,
+    _referrer_semaphores,
+    bulk_snuba_queries,
     get_json_type,
     get_query_params_to_update_for_projects,
     get_snuba_column_name,
     get_snuba_translators,
     quantize_time,
+    referrer_concurrency_slot,
 )
 
 
@@ -412,6 +432,219 @@ class QuantizeTimeTest(unittest.TestCase):
         assert i != j
 
 
+class CoalesceRequestsTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.request = Request(
+            dataset="events",
+            app_id="default",
+            query=Query(
+                match=Entity("events"),
+                select=[Column("event_id")],
+                where=[
+                    Condition(Column("project_id"), Op.IN, [self.project.id]),
+                    Condition(Column("timestamp"), Op.GTE, timezone.now() - timedelta(hours=1)),
+                    Condition(Column("timestamp"), Op.LT, timezone.now()),
+                ],
+            ),
+            tenant_ids={"organization_id": self.organization.id},
+        )
+        self.snuba_request = SnubaRequest(
+            request=self.request,
+            referrer="test",
+            forward=lambda x: x,
+            reverse=lambda x: x,
+        )
+        self.key = _get_coalesce_key(self.snuba_request)
+        self.result = {"data": [{"event_id": "a"}]}
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_in_flight_request(self, mock_bulk_snuba_query):
+        future: Future[dict] = Future()
+        future.set_result(self.result)
+        _inflight_requests[self.key] = future
+        self.addCleanup(_inflight_requests.pop, self.key, None)
+
+        results = _bulk_snuba_query_coalesced([self.snuba_request])
+        assert results == [self.result]
+        assert results[0] is not self.result
+        assert not mock_bulk_snuba_query.called
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_leads_request(self, mock_bulk_snuba_query):
+        mock_bulk_snuba_query.return_value = [self.result]
+
+        assert _bulk_snuba_query_coalesced([self.snuba_request, self.snuba_request]) == [
+            self.result,
+            self.result,
+        ]
+        assert mock_bulk_snuba_query.call_args[0][0] == [self.snuba_request]
+        assert self.key not in _inflight_requests
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_error(self, mock_bulk_snuba_query):
+        mock_bulk_snuba_query.side_effect = SnubaError("failed")
+
+        with pytest.raises(SnubaError):
+            _bulk_snuba_query_coalesced([self.snuba_request])
+        assert self.key not in _inflight_requests
+
+    def test_in_flight_error(self):
+        error = SnubaError("failed")
+        future: Future[dict] = Future()
+        future.set_exception(error)
+        _inflight_requests[self.key] = future
+        self.addCleanup(_inflight_requests.pop, self.key, None)
+
+        with pytest.raises(SnubaError) as exc_info:
+            _bulk_snuba_query_coalesced([self.snuba_request])
+        assert exc_info.value is not error
+        assert exc_info.value.__cause__ is error
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_cross_process(self, mock_bulk_snuba_query):
+        lease = locks.get(f"{self.key}:lease", duration=10)
+        lease.acquire()
+        self.addCleanup(lease.release)
+        cache.set(f"{self.key}:result", json.dumps(self.result), 10)
+
+        with override_options({"snuba.coalesce-requests.cross-process": True}):
+            assert _bulk_snuba_query_coalesced([self.snuba_request]) == [self.result]
+        assert not mock_bulk_snuba_query.called
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_cross_process_lease_released(self, mock_bulk_snuba_query):
+        mock_bulk_snuba_query.return_value = [self.result]
+        lease = locks.get(f"{self.key}:lease", duration=10)
+
+        with override_options({"snuba.coalesce-requests.cross-process": True}):
+            assert _bulk_snuba_query_coalesced([self.snuba_request]) == [self.result]
+
+        assert mock_bulk_snuba_query.call_count == 1
+        assert not lease.locked()
+        assert json.loads(cache.get(f"{self.key}:result")) == self.result
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_cross_process_wait_bounded(self, mock_bulk_snuba_query):
+        mock_bulk_snuba_query.return_value = [self.result]
+        lease = locks.get(f"{self.key}:lease", duration=10)
+        lease.acquire()
+        self.addCleanup(lease.release)
+
+        with (
+            self.settings(SENTRY_SNUBA_TIMEOUT=0),
+            override_options({"snuba.coalesce-requests.cross-process": True}),
+        ):
+            assert _bulk_snuba_query_coalesced([self.snuba_request]) == [self.result]
+        assert mock_bulk_snuba_query.call_count == 1
+
+    @mock.patch("sentry.utils.snuba.COALESCE_MAX_RESULT_SIZE", 10)
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_cross_process_result_too_large(self, mock_bulk_snuba_query):
+        mock_bulk_snuba_query.return_value = [self.result]
+
+        with override_options({"snuba.coalesce-requests.cross-process": True}):
+            assert _bulk_snuba_query_coalesced([self.snuba_request]) == [self.result]
+        assert cache.get(f"{self.key}:result") is None
+
+    @mock.patch("sentry.utils.snuba._bulk_snuba_query")
+    def test_bulk_snuba_queries(self, mock_bulk_snuba_query):
+        mock_bulk_snuba_query.side_effect = lambda requests: [self.result for _ in requests]
+
+        with override_options({"snuba.coalesce-requests.enabled": True}):
+            assert bulk_snuba_queries([self.request, self.request], referrer="test") == [
+                self.result,
+                self.result,
+            ]
+        assert len(mock_bulk_snuba_query.call_args[0][0]) == 1
+
+
+class DecodeResponseBodyTest(TestCase):
+    def test_decode(self):
+        body = b'{"data":[{"event_id":"a","count":1},{"event_id":"b","count":2}],"meta":[]}'
+        expected = {
+            "data": [{"event_id": "a", "count": 1}, {"event_id": "b", "count": 2}],
+            "meta": [],
+        }
+        assert _decode_response_body(body) == expected
+
+        with override_options({"snuba.compact-result-decoding.enabled": True}):
+            assert _decode_response_body(body) == expected
+
+    @override_options({"snuba.compact-result-decoding.enabled": True})
+    def test_falls_back_to_default_decoder(self):
+        decoded = _decode_response_body(b'{"data":[{"value":NaN}]}')
+        assert math.isnan(decoded["data"][0]["value"])
+
+    @override_options({"snuba.compact-result-decoding.enabled": True})
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            _decode_response_body(b"<html>bad gateway</html>")
+
+
+class ReferrerConcurrencySlotTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(_referrer_semaphores.clear)
+
+    def test_no_limit(self):
+        with referrer_concurrency_slot("test"), referrer_concurrency_slot("test"):
+            pass
+        assert "test" not in _referrer_semaphores
+
+    @override_options({"snuba.referrer-concurrency-limits": {"test": 1}})
+    @override_settings(SENTRY_SNUBA_TIMEOUT=0.01)
+    def test_limit(self):
+        with referrer_concurrency_slot("test"):
+            with pytest.raises(RateLimitExceeded):
+                with referrer_concurrency_slot("test"):
+                    pass
+            # Other referrers aren't affected
+            with referrer_concurrency_slot("other"):
+                pass
+
+        # The slot was released
+        with referrer_concurrency_slot("test"):
+            pass
+
+    @override_options({"snuba.referrer-concurrency-limits": {"test": 1}})
+    def test_limit_changed(self):
+        with referrer_concurrency_slot("test"):
+            semaphore = _referrer_semaphores["test"][1]
+            with override_options({"snuba.referrer-concurrency-limits": {"test": 2}}):
+                with referrer_concurrency_slot("test"):
+                    assert _referrer_semaphores["test"] == (2, mock.ANY)
+                    assert _referrer_semaphores["test"][1] is not semaphore
+
+    @override_options({"snuba.referrer-concurrency-limits": {"test": 1}})
+    def test_bulk_query_waits_before_submitting(self):
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        def snuba_query(params):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            # The slot is held while the query runs in the pool
+            assert _referrer_semaphores["test"][1]._value == 0
+            with lock:
+                running -= 1
+            raise SnubaError("done")
+
+        requests = [mock.Mock(headers={"referer": "test"}) for _ in range(3)]
+        with mock.patch("sentry.utils.snuba._snuba_query", side_effect=snuba_query) as query:
+            with pytest.raises(SnubaError):
+                _bulk_snuba_query(requests)
+
+        assert query.call_count == 3
+        assert max_running == 1
+        # Every slot is released again
+        with referrer_concurrency_slot("test"):
+            pass
+
+
 class FakeConnectionPool(HTTPConnectionPool):
     def __init__(self, connection, **kwargs):
         self.connection = connection
@@ -1,9 +1,12 @@
 from unittest import mock
 
 from sentry.testutils.cases import TestCase
+from sentry.workflow_engine.handlers.condition import GroupEventConditionHandler
 from sentry.workflow_engine.models import DataConditionGroup
+from sentry.workflow_engine.models.data_condition import Condition
 from sentry.workflow_engine.processors.data_condition_group import (
     evaluate_condition_group,
+    get_compiled_condition_group,
     get_data_conditions_for_group,
     process_data_condition_group,
 )
@@ -251,3 +254,74 @@ class TestEvaluateConditionGroupTypeNone(TestCase):
             True,
             [],
         )
+
+
+class TestCompiledConditionGroup(TestCase):
+    def setUp(self):
+        self.data_condition_group = self.create_data_condition_group(
+            logic_type=DataConditionGroup.Type.ALL
+        )
+
+        self.handler_condition = self.create_data_condition(
+            type=Condition.GROUP_EVENT_ATTR_COMPARISON,
+            condition="group.id",
+            comparison=1,
+            condition_result=True,
+            condition_group=self.data_condition_group,
+        )
+
+        self.data_condition = self.create_data_condition(
+            condition="gt",
+            comparison=5,
+            condition_result=True,
+            condition_group=self.data_condition_group,
+        )
+
+    def test_reuses_compiled_group(self):
+        compiled = get_compiled_condition_group(self.data_condition_group.id)
+        assert get_compiled_condition_group(self.data_condition_group.id) is compiled
+
+        assert [condition.is_slow for condition in compiled.conditions] == [True, False]
+        assert [condition.is_slow for condition in compiled.by_cost] == [False, True]
+
+    def test_recompiles_on_change(self):
+        compiled = get_compiled_condition_group(self.data_condition_group.id)
+
+        self.data_condition.comparison = 20
+        self.data_condition.save()
+
+        recompiled = get_compiled_condition_group(self.data_condition_group.id)
+        assert recompiled is not compiled
+        assert recompiled.by_cost[0].evaluate(10) is None
+
+    def test_all__skips_slow_conditions(self):
+        with mock.patch.object(
+            GroupEventConditionHandler, "evaluate_value", return_value=True
+        ) as mock_evaluate:
+            assert evaluate_condition_group(self.data_condition_group, 1) == (False, [])
+            assert not mock_evaluate.called
+
+            assert evaluate_condition_group(self.data_condition_group, 10) == (
+                True,
+                [True, True],
+            )
+            assert mock_evaluate.call_count == 1
+
+    def test_none__skips_slow_conditions(self):
+        self.data_condition_group.update(logic_type=DataConditionGroup.Type.NONE)
+
+        with mock.patch.object(
+            GroupEventConditionHandler, "evaluate_value", return_value=False
+        ) as mock_evaluate:
+            assert evaluate_condition_group(self.data_condition_group, 10) == (False, [])
+            assert not mock_evaluate.called
+
+    def test_any_short_circuit__keeps_order(self):
+        self.data_condition_group.update(logic_type=DataConditionGroup.Type.ANY_SHORT_CIRCUIT)
+        self.data_condition.update(condition_result=DetectorPriorityLevel.HIGH)
+
+        with mock.patch.object(
+            GroupEventConditionHandler, "evaluate_value", return_value=True
+        ) as mock_evaluate:
+            assert evaluate_condition_group(self.data_condition_group, 10) == (True, [True])
+            assert mock_evaluate.call_count == 1
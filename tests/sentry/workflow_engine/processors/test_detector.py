@@ -9,7 +9,10 @@ from sentry.types.group import PriorityLevel
 from sentry.workflow_engine.handlers.detector import DetectorEvaluationResult, DetectorStateData
 from sentry.workflow_engine.handlers.detector.stateful import get_redis_client
 from sentry.workflow_engine.models import DataPacket, Detector, DetectorState
-from sentry.workflow_engine.processors.detector import process_detectors
+from sentry.workflow_engine.processors.detector import (
+    process_detectors,
+    process_detectors_batch,
+)
 from sentry.workflow_engine.types import DetectorPriorityLevel
 from tests.sentry.workflow_engine.handlers.detector.test_base import (
     BaseDetectorHandlerTest,
@@ -120,6 +123,32 @@ class TestProcessDetectors(BaseDetectorHandlerTest):
             any_order=True,
         )
 
+    @mock.patch("sentry.workflow_engine.processors.detector.produce_occurrence_to_kafka")
+    def test_batch(self, mock_produce_occurrence_to_kafka):
+        detector = self.create_detector_and_conditions(type=self.handler_state_type.slug)
+        data_packets = [
+            DataPacket("1", {"dedupe": 2, "group_vals": {None: 6}}),
+            DataPacket("1", {"dedupe": 3, "group_vals": {None: 7}}),
+        ]
+        results = process_detectors_batch(data_packets, [detector])
+        occurrence, event_data = build_mock_occurrence_and_event(
+            detector.detector_handler, None, 6, PriorityLevel.HIGH
+        )
+        result = DetectorEvaluationResult(
+            None,
+            True,
+            DetectorPriorityLevel.HIGH,
+            occurrence,
+            event_data,
+        )
+
+        # The second packet sees the state change of the first one
+        assert results == [(detector, [{None: result}, {}])]
+        mock_produce_occurrence_to_kafka.assert_called_once()
+        assert DetectorState.objects.filter(
+            detector=detector, active=True, state=DetectorPriorityLevel.HIGH
+        ).exists()
+
     def test_no_issue_type(self):
         detector = self.create_detector(type="invalid slug")
         data_packet = self.build_data_packet()
@@ -325,6 +354,56 @@ class TestEvaluate(BaseDetectorHandlerTest):
             )
         }
 
+    def test_batch(self):
+        handler = self.build_handler()
+        occurrence, event_data = build_mock_occurrence_and_event(
+            handler, "val1", 6, PriorityLevel.HIGH
+        )
+        with mock.patch.object(
+            handler, "bulk_get_detector_state", wraps=handler.bulk_get_detector_state
+        ) as bulk_get_detector_state:
+            results = handler.evaluate_batch(
+                [
+                    DataPacket("1", {"dedupe": 1, "group_vals": {"val1": 0}}),
+                    DataPacket("1", {"dedupe": 2, "group_vals": {"val1": 6}}),
+                    DataPacket("1", {"dedupe": 3, "group_vals": {"val1": 6, "val2": 0}}),
+                    # Already processed
+                    DataPacket("1", {"dedupe": 3, "group_vals": {"val1": 0}}),
+                    DataPacket("1", {"dedupe": 4, "group_vals": {"val1": 0}}),
+                ]
+            )
+            assert bulk_get_detector_state.call_count == 1
+
+        assert results == [
+            {},
+            {
+                "val1": DetectorEvaluationResult(
+                    group_key="val1",
+                    is_active=True,
+                    priority=DetectorPriorityLevel.HIGH,
+                    result=occurrence,
+                    event_data=event_data,
+                )
+            },
+            {},
+            {},
+            {
+                "val1": DetectorEvaluationResult(
+                    group_key="val1",
+                    is_active=False,
+                    result=StatusChangeMessage(
+                        fingerprint=[f"{handler.detector.id}:val1"],
+                        project_id=self.project.id,
+                        new_status=1,
+                        new_substatus=None,
+                    ),
+                    priority=DetectorPriorityLevel.OK,
+                )
+            },
+        ]
+        self.assert_updates(handler, "val1", 4, {}, False, DetectorPriorityLevel.OK)
+        self.assert_updates(handler, "val2", 3, {}, None, None)
+
     def test_no_condition_group(self):
         detector = self.create_detector()
         handler = MockDetectorStateHandler(detector)